@@ -4,6 +4,7 @@ from os import getenv
 from sqlalchemy import engine_from_config, pool
 
 from alembic import context
+from app.db.urls import sync_url
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -27,7 +28,7 @@ target_metadata = None  # type: ignore [var-annotated]
 
 def get_url() -> str:
     """Return db connection url as string."""
-    return getenv("DB_CONNECTION", "undefined")
+    return sync_url(getenv("DB_CONNECTION", "undefined"))
 
 
 def run_migrations_offline() -> None:
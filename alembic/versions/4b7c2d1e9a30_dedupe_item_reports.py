@@ -0,0 +1,65 @@
+"""dedupe item reports, unique (owner_id, title)
+
+Revision ID: 4b7c2d1e9a30
+Revises: 9f123f26e6af
+Create Date: 2026-10-18 14:03:27.518204
+
+"""
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4b7c2d1e9a30"
+down_revision = "9f123f26e6af"
+branch_labels = None
+depends_on = None
+
+# existing rows were last seen no later than now, in UTC as the model writes it
+BACKFILL_LAST_SEEN = sa.text("UPDATE item SET last_seen = :now WHERE last_seen IS NULL")
+# the oldest row of each repeated (owner_id, title) survives and counts them
+COUNT_REPEATS = """
+UPDATE item SET hit_count = (
+    SELECT count(*) FROM item AS dup
+    WHERE dup.owner_id = item.owner_id AND dup.title = item.title
+)
+WHERE id IN (
+    SELECT min(id) FROM item
+    WHERE owner_id IS NOT NULL AND title IS NOT NULL
+    GROUP BY owner_id, title
+    HAVING count(*) > 1
+)
+"""
+DELETE_REPEATS = """
+DELETE FROM item
+WHERE owner_id IS NOT NULL AND title IS NOT NULL AND id NOT IN (
+    SELECT min(id) FROM item
+    WHERE owner_id IS NOT NULL AND title IS NOT NULL
+    GROUP BY owner_id, title
+)
+"""
+
+
+def upgrade():
+    op.add_column(
+        "item",
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="1"),
+    )
+    op.add_column("item", sa.Column("last_seen", sa.DateTime(), nullable=True))
+    op.execute(BACKFILL_LAST_SEEN.bindparams(now=datetime.utcnow()))
+    op.execute(COUNT_REPEATS)
+    op.execute(DELETE_REPEATS)
+    op.create_index(
+        "uq_item_owner_id_title",
+        "item",
+        ["owner_id", "title"],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index("uq_item_owner_id_title", table_name="item")
+    op.drop_column("item", "last_seen")
+    op.drop_column("item", "hit_count")
@@ -0,0 +1,32 @@
+"""index item owner_id, drop unused indexes
+
+Revision ID: 9f123f26e6af
+Revises: 68f24280355c
+Create Date: 2026-10-18 09:12:41.220917
+
+"""
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9f123f26e6af"
+down_revision = "68f24280355c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_item_owner_id_id", "item", ["owner_id", "id"], unique=False)
+    op.drop_index(op.f("ix_item_description"), table_name="item")
+    op.drop_index(op.f("ix_item_title"), table_name="item")
+    op.drop_index(op.f("ix_item_id"), table_name="item")
+    op.drop_index(op.f("ix_user_id"), table_name="user")
+
+
+def downgrade():
+    op.create_index(op.f("ix_user_id"), "user", ["id"], unique=False)
+    op.create_index(op.f("ix_item_id"), "item", ["id"], unique=False)
+    op.create_index(op.f("ix_item_title"), "item", ["title"], unique=False)
+    op.create_index(op.f("ix_item_description"), "item", ["description"], unique=False)
+    op.drop_index("ix_item_owner_id_id", table_name="item")
@@ -0,0 +1,29 @@
+"""item and user row versions
+
+Revision ID: a7d3e91f5b08
+Revises: e5a90b3c1f27
+Create Date: 2026-10-18 19:05:37.418220
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7d3e91f5b08"
+down_revision = "e5a90b3c1f27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ("item", "user"):
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        )
+
+
+def downgrade():
+    for table in ("user", "item"):
+        op.drop_column(table, "version")
@@ -0,0 +1,30 @@
+"""item expiry, created_at and expires_at
+
+Revision ID: c81e5f2a7d64
+Revises: 4b7c2d1e9a30
+Create Date: 2026-10-18 16:41:09.302751
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c81e5f2a7d64"
+down_revision = "4b7c2d1e9a30"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("item", sa.Column("created_at", sa.DateTime(), nullable=True))
+    op.add_column("item", sa.Column("expires_at", sa.DateTime(), nullable=True))
+    # the first report of existing rows is unknown, the last one is close
+    op.execute("UPDATE item SET created_at = last_seen")
+    op.create_index("ix_item_expires_at", "item", ["expires_at"])
+
+
+def downgrade():
+    op.drop_index("ix_item_expires_at", table_name="item")
+    op.drop_column("item", "expires_at")
+    op.drop_column("item", "created_at")
@@ -0,0 +1,68 @@
+"""item change log
+
+Revision ID: e5a90b3c1f27
+Revises: c81e5f2a7d64
+Create Date: 2026-10-18 18:12:44.905163
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e5a90b3c1f27"
+down_revision = "c81e5f2a7d64"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "item_change",
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=True),
+        sa.Column("deleted", sa.Boolean(), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("version"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_item_change_item_id_version",
+        "item_change",
+        ["item_id", "version"],
+    )
+    op.create_table(
+        "change_horizon",
+        sa.Column("log", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("log"),
+    )
+    # one entry per existing item, so that since=0 lists every item
+    item = sa.table(
+        "item", sa.column("id"), sa.column("owner_id"), sa.column("last_seen")
+    )
+    change = sa.table(
+        "item_change",
+        sa.column("item_id"),
+        sa.column("owner_id"),
+        sa.column("deleted"),
+        sa.column("changed_at"),
+    )
+    op.execute(
+        change.insert().from_select(
+            ["item_id", "owner_id", "deleted", "changed_at"],
+            sa.select(
+                item.c.id,
+                item.c.owner_id,
+                sa.false(),
+                sa.func.coalesce(item.c.last_seen, sa.func.current_timestamp()),
+            ).order_by(item.c.id),
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("change_horizon")
+    op.drop_index("ix_item_change_item_id_version", table_name="item_change")
+    op.drop_table("item_change")
@@ -1,8 +1,14 @@
 from fastapi import APIRouter
 
-from app.api.api_v1.endpoints import items, login, users
+from app.api.api_v1.endpoints import bans, changes, ingest, items, login, stream, users
 
 api_router = APIRouter()
 api_router.include_router(login.router, tags=["login"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
+# before the items router, whose /{iid} routes would shadow /lookup,
+# /changes, /ingest and /stream
+api_router.include_router(bans.router, prefix="/items", tags=["items"])
+api_router.include_router(changes.router, prefix="/items", tags=["items"])
+api_router.include_router(ingest.router, prefix="/items", tags=["items"])
+api_router.include_router(stream.router, prefix="/items", tags=["items"])
 api_router.include_router(items.router, prefix="/items", tags=["items"])
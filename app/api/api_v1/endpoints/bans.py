@@ -0,0 +1,33 @@
+from typing import Any, List
+
+from fastapi import APIRouter, Depends
+from pydantic import IPvAnyAddress
+
+from app import crud, schemas
+from app.api import deps, lookup
+from app.core.config import settings
+
+router = APIRouter()
+
+
+@router.get("/lookup", response_model=schemas.BanLookup)
+async def lookup_address(
+    addr: IPvAnyAddress,
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
+) -> Any:
+    """Tell whether an address is banned, CIDR bans included.
+
+    Answered from the in-memory ban index, without a database query.
+    """
+    owner_id = None if crud.auser.is_superuser(current_user) else current_user.id
+    return lookup.lookup(addr, owner_id)
+
+
+@router.post("/lookup", response_model=List[schemas.BanLookup])
+async def lookup_addresses(
+    lookup_in: schemas.BanLookupRequest,
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
+) -> Any:
+    """Tell for each address of the batch whether it is banned."""
+    owner_id = None if crud.auser.is_superuser(current_user) else current_user.id
+    return lookup.lookup_many(lookup_in.addrs, owner_id, settings.ITEMS_BULK_MAX)
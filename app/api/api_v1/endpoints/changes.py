@@ -0,0 +1,45 @@
+from http import HTTPStatus
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import changes, deps
+from app.core.config import settings
+
+router = APIRouter()
+
+
+@router.get(
+    "/changes",
+    response_model=schemas.ItemChanges,
+    responses={HTTPStatus.GONE.value: {"description": "List the items again"}},
+)
+async def read_item_changes(
+    db: AsyncSession = Depends(deps.get_db),
+    since: int = Query(0, ge=0),
+    limit: int = Query(settings.ITEMS_CHANGES_LIMIT, gt=0),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
+) -> Any:
+    """Get the items changed after the `since` version.
+
+    Start from since=0, or from the `version` of a 410 answer after listing
+    the items, and pass the returned `version` on the next call. The answer
+    is 410 when the changes after `since` have been compacted away.
+    """
+    if since < await crud.achange.horizon(db):
+        return JSONResponse(
+            status_code=HTTPStatus.GONE,
+            content={
+                "detail": "Changes after this version were compacted",
+                "version": await crud.achange.head(db),
+            },
+        )
+    return await changes.changes_since(
+        db,
+        since=since,
+        owner_id=None if crud.auser.is_superuser(current_user) else current_user.id,
+        limit=min(limit, settings.ITEMS_CHANGES_LIMIT),
+    )
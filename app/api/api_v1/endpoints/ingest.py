@@ -0,0 +1,24 @@
+from http import HTTPStatus
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app import schemas
+from app.api import deps, ingest
+
+router = APIRouter()
+
+
+@router.get("/ingest/{ingest_id}", response_model=schemas.IngestReceipt)
+async def read_ingest_receipt(
+    ingest_id: str,
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
+) -> Any:
+    """Get the state of an item accepted by the write-behind queue."""
+    receipt = ingest.ingest_queue.receipts.get(ingest_id)
+    if receipt is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail="Unknown ingest id",
+        )
+    return receipt
@@ -1,106 +1,221 @@
 from http import HTTPStatus
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
 from app import crud, models, schemas
-from app.api import deps
+from app.api import bulk, deps, etags, export, fastjson, ingest, packed, pagination
+from app.core.config import settings
 from app.utils import ensure_int
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[schemas.Item])
-def read_items(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user: models.User = Depends(deps.get_current_active_user),
+@router.get(
+    "/",
+    response_model=List[schemas.Item],
+    responses={HTTPStatus.OK.value: {"content": {packed.KMSGPACK: {}}}},
+)
+async def read_items(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_db),
+    page: pagination.Page = Depends(pagination.page_params),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
 ) -> Any:
-    """Retrieve items."""
-    if crud.user.is_superuser(current_user):
-        return crud.citem.get_multi(db, skip=skip, limit=limit)
-    return crud.citem.get_multi_by_owner(
-        db=db,
-        owner_id=ensure_int(current_user.id, "current_user.id is None"),
-        skip=skip,
-        limit=limit,
-    )
+    """Retrieve items ordered by id.
+
+    Pass the `after` cursor of the Link/X-Next-Cursor headers to fetch the
+    next page, skip/limit paging keeps working. The page is not sent again
+    when If-None-Match holds its ETag. Clients listing application/msgpack
+    in Accept ahead of JSON get a MessagePack array.
+    """
+    if packed.AVAILABLE:
+        response.headers["Vary"] = "Accept"
+    if settings.FAST_JSON_RESPONSES or packed.wanted(request):
+        return await fastjson.item_rows_response(
+            request,
+            response,
+            db,
+            page,
+            current_user,
+        )
+    if crud.auser.is_superuser(current_user):
+        articulos = await crud.acitem.get_multi(
+            db,
+            skip=page.skip,
+            limit=page.limit,
+            after=page.after,
+        )
+    else:
+        articulos = await crud.acitem.get_multi_by_owner(
+            db=db,
+            owner_id=ensure_int(current_user.id, "current_user.id is None"),
+            skip=page.skip,
+            limit=page.limit,
+            after=page.after,
+        )
+    not_modified = etags.conditional(request, response, articulos)
+    if not_modified is not None:
+        return not_modified
+    pagination.set_next_page(request, response, articulos, page.limit)
+    return articulos
 
 
-@router.post("/", response_model=schemas.Item)
-def create_item(
+@router.post(
+    "/",
+    response_model=schemas.Item,
+    responses={HTTPStatus.ACCEPTED.value: {"model": schemas.IngestReceipt}},
+)
+async def create_item(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     item_in: schemas.ItemCreate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
 ) -> Any:
-    """Create new item."""
+    """Create new item.
+
+    With write-behind enabled the item is queued and the answer is 202 with
+    an ingest id to poll at /items/ingest/{ingest_id}; when the queue is
+    full the item is written right away.
+    """
     cuid: int = ensure_int(current_user.id, "current_user.id is None")
-    return crud.citem.create_with_owner(
+    if not settings.ITEMS_DURABLE_WRITES:
+        receipt = ingest.ingest_queue.submit(item_in, cuid)
+        if receipt is not None:
+            return JSONResponse(
+                status_code=HTTPStatus.ACCEPTED,
+                content=receipt.dict(),
+            )
+    return await crud.acitem.create_with_owner(
         db=db,
         obj_in=item_in,
         owner_id=cuid,
     )
 
 
-@router.put("/{iid}", response_model=schemas.Item)
-def update_item(
+@router.post(
+    "/bulk",
+    response_model=schemas.BulkReport,
+    openapi_extra={"requestBody": bulk.openapi_request_body()},
+)
+async def create_items_bulk(
     *,
-    db: Session = Depends(deps.get_db),
-    iid: int,
+    db: AsyncSession = Depends(deps.get_db),
+    request: Request,
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
+) -> Any:
+    """Create many items from a JSON array or an NDJSON body."""
+    rows = await bulk.read_rows(
+        request,
+        settings.ITEMS_BULK_MAX,
+        settings.ITEMS_BULK_MAX * settings.ITEMS_BULK_ROW_BYTES,
+    )
+    valid, errors = bulk.validate_items(rows)
+    written = await crud.acitem.create_multi_with_owner(
+        db=db,
+        objs_in=[item_in for _, item_in in valid],
+        owner_id=current_user.id,
+        chunk_size=settings.ITEMS_BULK_CHUNK,
+    )
+    return bulk.build_report(len(rows), valid, written, errors)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        HTTPStatus.OK.value: {
+            "content": {media: {} for media in export.MEDIA_TYPES.values()},
+        },
+    },
+)
+async def export_items(
+    export_format: export.ExportFormat = Query(
+        export.ExportFormat.ndjson,
+        alias="format",
+    ),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
+) -> Any:
+    """Stream every visible item as NDJSON or CSV in constant memory."""
+    owner_id = None if crud.auser.is_superuser(current_user) else current_user.id
+    return StreamingResponse(
+        export.export_items(export_format, owner_id),
+        media_type=export.MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": "attachment; filename=items.{0}".format(
+                export_format.value,
+            ),
+        },
+    )
+
+
+@router.put(
+    "/{iid}",
+    response_model=schemas.Item,
+    responses={HTTPStatus.PRECONDITION_FAILED.value: {"model": schemas.Msg}},
+)
+async def update_item(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    request: Request,
+    response: Response,
     item_in: schemas.ItemUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    articulo: models.Item = Depends(deps.get_owned_item),
 ) -> Any:
-    """Update an item."""
-    articulo = crud.citem.get(db=db, iid=iid)
-    if not articulo:
-        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Item not found")
-    if not crud.user.is_superuser(current_user):
-        if articulo.owner_id != current_user.id:
-            raise HTTPException(
-                status_code=HTTPStatus.BAD_REQUEST,
-                detail="Not enough permissions",
-            )
-    return crud.citem.update(db=db, db_obj=articulo, obj_in=item_in)
+    """Update an item, its owner may not have another with the new title.
+
+    With If-Match the item is only updated while it still has that ETag,
+    the answer is 412 once another write changed it.
+    """
+    if_version = etags.if_match_version(request, articulo)
+    try:
+        articulo = await crud.acitem.update(
+            db=db,
+            db_obj=articulo,
+            obj_in=item_in,
+            if_version=if_version,
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail="The owner already has an item with this title",
+        )
+    except StaleDataError:
+        raise HTTPException(
+            status_code=HTTPStatus.PRECONDITION_FAILED,
+            detail="It was changed since it was read",
+        )
+    response.headers["ETag"] = etags.etag([articulo])
+    return articulo
 
 
 @router.get("/{iid}", response_model=schemas.Item)
-def read_item(
+async def read_item(
     *,
-    db: Session = Depends(deps.get_db),
-    iid: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    request: Request,
+    response: Response,
+    articulo: models.Item = Depends(deps.get_owned_item),
 ) -> Any:
-    """Get item by ID."""
-    articulo = crud.citem.get(db=db, iid=iid)
-    if not articulo:
-        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Item not found")
-    if not crud.user.is_superuser(current_user):
-        if articulo.owner_id != current_user.id:
-            raise HTTPException(
-                status_code=HTTPStatus.BAD_REQUEST,
-                detail="Not enough permissions",
-            )
+    """Get item by ID, 304 when If-None-Match holds its ETag."""
+    not_modified = etags.conditional(request, response, [articulo])
+    if not_modified is not None:
+        return not_modified
     return articulo
 
 
 @router.delete("/{iid}", response_model=schemas.Item)
-def delete_item(
+async def delete_item(
     *,
-    db: Session = Depends(deps.get_db),
-    iid: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    db: AsyncSession = Depends(deps.get_db),
+    articulo: models.Item = Depends(deps.get_owned_item),
 ) -> Any:
     """Delete an item."""
-    articulo = crud.citem.get(db=db, iid=iid)
-    if not articulo:
-        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Item not found")
-    if not crud.user.is_superuser(current_user):
-        if articulo.owner_id != current_user.id:
-            raise HTTPException(
-                status_code=HTTPStatus.BAD_REQUEST,
-                detail="Not enough permissions",
-            )
-    return crud.citem.remove(db=db, iid=iid)
+    return await crud.acitem.remove(
+        db=db,
+        iid=ensure_int(articulo.id, "item.id is None"),
+    )
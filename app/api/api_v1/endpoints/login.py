@@ -4,12 +4,13 @@ from typing import Any
 
 from fastapi import APIRouter, Body, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud, models, schemas
+from app import crud, schemas
 from app.api import deps
-from app.core import security
+from app.core import auth_cache, security
 from app.core.config import settings
+from app.core.hashing import hasher
 
 # from app.core.security import get_password_hash
 from app.utils import (
@@ -23,12 +24,12 @@ router = APIRouter()
 
 
 @router.post("/login/access-token", response_model=schemas.Token)
-def login_access_token(
-    db: Session = Depends(deps.get_db),
+async def login_access_token(
+    db: AsyncSession = Depends(deps.get_db),
     form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Any:
     """OAuth2 compatible token login, get an access token for future requests."""
-    user = crud.user.authenticate(
+    user = await crud.auser.authenticate(
         db,
         email=form_data.username,
         password=form_data.password,
@@ -38,7 +39,7 @@ def login_access_token(
             status_code=HTTPStatus.BAD_REQUEST,
             detail="Incorrect email or password",
         )
-    elif crud.user.disabled(user):
+    elif crud.auser.disabled(user):
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Inactive user")
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
@@ -51,17 +52,17 @@ def login_access_token(
 
 
 @router.post("/login/test-token", response_model=schemas.User)
-def test_token(
-    current_user: models.User = Depends(deps.get_current_user),
+async def test_token(
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_user),
 ) -> Any:
     """Test access token."""
     return current_user
 
 
 @router.post("/password-recovery/{email}", response_model=schemas.Msg)
-def recover_password(email: str, db: Session = Depends(deps.get_db)) -> Any:
+async def recover_password(email: str, db: AsyncSession = Depends(deps.get_db)) -> Any:
     """Password Recovery."""
-    user = crud.user.get_by_email(db, email=email)
+    user = await crud.auser.get_by_email(db, email=email)
 
     if not user:
         raise HTTPException(
@@ -72,30 +73,35 @@ def recover_password(email: str, db: Session = Depends(deps.get_db)) -> Any:
     if user.email is None:
         raise ValueError()
     uaddr = ensure_str(user.email, "User id: '{0}' email is None.".format(user.id))
-    send_reset_password_email(email_to=uaddr, email=email, token=password_reset_token)
+    send_reset_password_email(
+        email_to=uaddr,
+        email=email,
+        token=password_reset_token,
+    )
     return {"msg": "Password recovery email sent"}
 
 
 @router.post("/reset-password/", response_model=schemas.Msg)
-def reset_password(
+async def reset_password(
     token: str = Body(...),
     new_password: str = Body(...),
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
 ) -> Any:
     """Reset password."""
     email = verify_password_reset_token(token)
     if not email:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Invalid token")
-    user = crud.user.get_by_email(db, email=email)
+    user = await crud.auser.get_by_email(db, email=email)
     if not user:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="The user with this username does not exist in the system.",
         )
-    elif crud.user.disabled(user):
+    elif crud.auser.disabled(user):
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Inactive user")
-    hashed_password = security.get_password_hash(new_password)
+    hashed_password = await hasher.hash(new_password)
     user.hashed_password = hashed_password
     db.add(user)
-    db.commit()
+    await db.commit()
+    auth_cache.invalidate_user(user.id)
     return {"msg": "Password updated successfully"}
@@ -0,0 +1,55 @@
+from http import HTTPStatus
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, Query, WebSocket, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.api import deps, sockets, stream
+
+router = APIRouter()
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={HTTPStatus.OK.value: {"content": {"text/event-stream": {}}}},
+)
+async def stream_items(
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
+) -> Any:
+    """Push the item writes as server-sent events once they are committed.
+
+    `upsert` and `delete` events carry the item id, owner_id, title and
+    expires_at. The stream starts with a `ready` event holding the change
+    log version it follows, fetch /items/changes up to that version to
+    catch up. A `resync` event ends a stream that fell behind.
+    """
+    subscription, version = await stream.subscribe(db, current_user)
+    # the stream outlives the request, give its connection back to the pool
+    await db.close()
+    return StreamingResponse(
+        stream.sse_events(subscription, version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/stream")
+async def stream_items_websocket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+) -> None:
+    """Push the item writes as JSON messages, like GET /items/stream.
+
+    The access token is passed as the `token` query parameter or as a
+    bearer Authorization header.
+    """
+    subscribed = await sockets.websocket_subscribe(websocket, token)
+    if subscribed is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    await sockets.websocket_events(websocket, *subscribed)
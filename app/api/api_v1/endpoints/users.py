@@ -1,11 +1,11 @@
 from http import HTTPStatus
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud, models, schemas
-from app.api import deps
+from app import crud, schemas
+from app.api import deps, etags, fastjson, pagination
 from app.core.config import settings
 from app.utils import send_new_account_email
 
@@ -13,31 +13,50 @@ router = APIRouter()
 
 
 @router.get("/", response_model=List[schemas.User])
-def read_users(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+async def read_users(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_db),
+    page: pagination.Page = Depends(pagination.page_params),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_superuser),
 ) -> Any:
-    """Retrieve users."""
-    return crud.user.get_multi(db, skip=skip, limit=limit)
+    """Retrieve users ordered by id, see read_items for the `after` cursor."""
+    if settings.FAST_JSON_RESPONSES:
+        rows = await crud.auser.get_multi_rows(
+            db,
+            columns=fastjson.user_rows.columns,
+            skip=page.skip,
+            limit=page.limit,
+            after=page.after,
+        )
+        fast_response = fastjson.user_rows.response(rows)
+        pagination.set_next_page(request, fast_response, rows, page.limit)
+        return fast_response
+    users = await crud.auser.get_multi(
+        db,
+        skip=page.skip,
+        limit=page.limit,
+        after=page.after,
+    )
+    pagination.set_next_page(request, response, users, page.limit)
+    return users
 
 
 @router.post("/", response_model=schemas.User)
-def create_user(
+async def create_user(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     user_in: schemas.UserCreate,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """Create new user."""
-    user = crud.user.get_by_email(db, email=user_in.email)
+    user = await crud.auser.get_by_email(db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
             detail="The user with this username already exists in the system.",
         )
-    user = crud.user.create(db, obj_in=user_in)
+    user = await crud.auser.create(db, obj_in=user_in)
     if settings.EMAILS_ENABLED and user_in.email:
         send_new_account_email(
             email_to=user_in.email,
@@ -48,45 +67,56 @@ def create_user(
 
 
 @router.get("/me", response_model=schemas.User)
-def read_user_me(
-    db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_active_user),
+async def read_user_me(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
 ) -> Any:
-    """Get current user."""
+    """Get current user, 304 when If-None-Match holds its ETag."""
+    not_modified = etags.conditional(request, response, [current_user])
+    if not_modified is not None:
+        return not_modified
     return current_user
 
 
 @router.get("/{user_id}", response_model=schemas.User)
-def read_user_by_id(
+async def read_user_by_id(
+    request: Request,
+    response: Response,
     user_id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
-    db: Session = Depends(deps.get_db),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_user),
+    db: AsyncSession = Depends(deps.get_db),
 ) -> Any:
-    """Get a specific user by id."""
-    user = crud.user.get(db, iid=user_id)
-    if user == current_user:
-        return user
-    if not crud.user.is_superuser(current_user):
+    """Get a specific user by id, 304 when If-None-Match holds its ETag."""
+    user = await crud.auser.get(db, iid=user_id)
+    own = user is not None and user.id == current_user.id
+    if not own and not crud.auser.is_superuser(current_user):
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
             detail="The user doesn't have enough privileges",
         )
+    if user is None:
+        return user
+    not_modified = etags.conditional(request, response, [user])
+    if not_modified is not None:
+        return not_modified
     return user
 
 
 @router.put("/{user_id}", response_model=schemas.User)
-def update_user(
+async def update_user(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     user_id: int,
     user_in: schemas.UserUpdate,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    current_user: schemas.UserSnapshot = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """Update a user."""
-    user = crud.user.get(db, iid=user_id)
+    user = await crud.auser.get(db, iid=user_id)
     if not user:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="The user with this username does not exist in the system",
         )
-    return crud.user.update(db, db_obj=user, obj_in=user_in)
+    return await crud.auser.update(db, db_obj=user, obj_in=user_in)
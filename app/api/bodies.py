@@ -0,0 +1,37 @@
+"""Request bodies read under a size limit."""
+from http import HTTPStatus
+
+from fastapi import HTTPException, Request
+
+
+async def read_body(request: Request, max_bytes: int) -> bytes:
+    """Return the request body, refused once it grows over max_bytes.
+
+    A declared Content-Length over the limit is refused before reading.
+
+    Args:
+        request (Request): incoming request
+        max_bytes (int): largest accepted body size
+
+    Raises:
+        HTTPException: if the body is larger than max_bytes
+
+    Returns:
+        bytes: the body
+    """
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > max_bytes:
+        raise _too_large(max_bytes)
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise _too_large(max_bytes)
+    return bytes(body)
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        detail="At most {0} bytes per request".format(max_bytes),
+    )
@@ -0,0 +1,151 @@
+"""Parsing and validation of bulk request bodies."""
+import json
+from http import HTTPStatus
+from typing import AbstractSet, Any, Dict, List, Mapping, Sequence, Tuple
+
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+
+from app import schemas
+from app.api import bodies
+
+NDJSON_TYPES = frozenset(("application/x-ndjson", "application/ndjson"))
+
+ItemRows = List[Tuple[int, schemas.ItemCreate]]
+
+
+async def read_rows(request: Request, max_rows: int, max_bytes: int) -> List[Any]:
+    """Return the rows of a JSON array or NDJSON request body.
+
+    NDJSON lines that are not valid JSON are kept as `JSONDecodeError`
+    instances so that they show up in the per-row report.
+
+    Args:
+        request (Request): incoming request
+        max_rows (int): largest accepted number of rows
+        max_bytes (int): largest accepted body size
+
+    Raises:
+        HTTPException: if the body is malformed or too large
+
+    Returns:
+        List[Any]: decoded rows
+    """
+    body = await bodies.read_body(request, max_bytes)
+    content_type = request.headers.get("content-type", "")
+    if content_type.split(";")[0].strip() in NDJSON_TYPES:
+        rows = [_decode_line(line) for line in body.splitlines() if line.strip()]
+    else:
+        try:
+            rows = json.loads(body)
+        except ValueError:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail="Body is not valid JSON",
+            )
+    if not isinstance(rows, list):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="Body must be a JSON array or NDJSON",
+        )
+    if len(rows) > max_rows:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            detail="At most {0} rows per request".format(max_rows),
+        )
+    return rows
+
+
+def validate_items(
+    rows: List[Any],
+) -> Tuple[ItemRows, List[schemas.BulkRowResult]]:
+    """Validate every row as an ItemCreate in a single pass.
+
+    Args:
+        rows (List[Any]): decoded rows
+
+    Returns:
+        Tuple[ItemRows, List[schemas.BulkRowResult]]: valid rows with their
+        index and the report entries of the invalid ones
+    """
+    valid: ItemRows = []
+    errors: List[schemas.BulkRowResult] = []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, _parse_item(row)))
+        except (ValueError, TypeError) as exc:
+            errors.append(schemas.BulkRowResult(index=index, error=str(exc)))
+    return valid, errors
+
+
+def build_report(
+    rows_count: int,
+    valid: ItemRows,
+    written: Tuple[Sequence[int], AbstractSet[int]],
+    errors: List[schemas.BulkRowResult],
+) -> schemas.BulkReport:
+    """Merge the written ids and the validation errors into a report.
+
+    The first row of a created item counts as created, the other rows
+    written to an existing item as merged.
+
+    Args:
+        rows_count (int): number of rows received
+        valid (ItemRows): valid rows with their index, in insert order
+        written (Tuple[Sequence[int], AbstractSet[int]]): written ids, in
+        insert order, and the ids of the created items
+        errors (List[schemas.BulkRowResult]): rejected rows
+
+    Returns:
+        schemas.BulkReport: per row outcome, in request order
+    """
+    ids, created = written
+    outcomes = errors + [
+        schemas.BulkRowResult(index=index, id=iid)
+        for (index, _), iid in zip(valid, ids)
+    ]
+    outcomes.sort(key=lambda outcome: outcome.index)
+    return schemas.BulkReport(
+        created=len(created),
+        merged=len(ids) - len(created),
+        failed=rows_count - len(ids),
+        rows=outcomes,
+    )
+
+
+def openapi_request_body() -> Dict[str, Any]:
+    """Return the OpenAPI requestBody of the bulk item endpoints."""
+    rows_schema = {
+        "type": "array",
+        "items": {"$ref": "#/components/schemas/ItemCreate"},
+    }
+    return {
+        "required": True,
+        "content": {
+            "application/json": {"schema": rows_schema},
+            "application/x-ndjson": {"schema": rows_schema},
+        },
+    }
+
+
+def _decode_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as exc:
+        return exc
+
+
+def _parse_item(row: Any) -> schemas.ItemCreate:
+    if isinstance(row, Exception):
+        raise ValueError("Invalid JSON: {0}".format(row))
+    if not isinstance(row, dict):
+        raise TypeError("Row must be a JSON object")
+    try:
+        return schemas.ItemCreate(**row)
+    except ValidationError as exc:
+        raise ValueError("; ".join(_format_error(err) for err in exc.errors()))
+
+
+def _format_error(error: Mapping[str, Any]) -> str:
+    location = ".".join(str(part) for part in error["loc"])
+    return "{0}: {1}".format(location, error["msg"])
@@ -0,0 +1,84 @@
+"""Item change feed read from the change log."""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, models, schemas
+from app.core.config import settings
+
+
+async def changes_since(
+    db: AsyncSession,
+    *,
+    since: int,
+    owner_id: Optional[int],
+    limit: int,
+) -> schemas.ItemChanges:
+    """Return the net changes to the items after version `since`.
+
+    An item changed several times is reported once, with its current
+    state, or as deleted when it no longer exists or has expired.
+
+    Args:
+        db (AsyncSession): database session
+        since (int): last version the consumer has applied
+        owner_id (Optional[int]): only items of this owner when given
+        limit (int): largest number of change log entries read
+
+    Returns:
+        schemas.ItemChanges: items to upsert, ids to delete and the version
+        to pass as `since` next time
+    """
+    entries = await crud.achange.since(
+        db,
+        version=since,
+        owner_id=owner_id,
+        limit=limit,
+    )
+    page = settled(entries, datetime.utcnow())
+    # the latest entry of an item tells whether it was deleted
+    latest: Dict[int, bool] = {entry.item_id: entry.deleted for entry in page}
+    found = await crud.acitem.get_multi_by_ids(db, iids=_upserted(latest))
+    return schemas.ItemChanges(
+        version=page[-1].version if page else since,
+        more=len(page) == limit,
+        items=found,
+        deleted=_missing(latest, found),
+    )
+
+
+def _upserted(latest: Dict[int, bool]) -> List[int]:
+    return [iid for iid, deleted in latest.items() if not deleted]
+
+
+def _missing(latest: Dict[int, bool], found: Sequence[models.Item]) -> List[int]:
+    found_ids = {db_obj.id for db_obj in found}
+    return sorted(iid for iid in latest if iid not in found_ids)
+
+
+def settled(
+    entries: Sequence[Row],  # type: ignore [type-arg]
+    now: datetime,
+) -> List[Row]:  # type: ignore [type-arg]
+    """Return the entries up to the first one younger than the settle delay.
+
+    Versions are assigned when a transaction writes and become visible when
+    it commits, a reader must not move past a version whose transaction may
+    still be running.
+
+    Args:
+        entries (Sequence[Row]): change log entries, oldest first
+        now (datetime): UTC time of the read
+
+    Returns:
+        List[Row]: the settled prefix of `entries`
+    """
+    cutoff = now - timedelta(seconds=settings.ITEMS_CHANGES_SETTLE_SECONDS)
+    page: List[Row] = []  # type: ignore [type-arg]
+    for entry in entries:
+        if entry.changed_at > cutoff:
+            break
+        page.append(entry)
+    return page
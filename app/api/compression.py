@@ -0,0 +1,154 @@
+"""Negotiated response compression that keeps streamed responses streaming."""
+from typing import Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.negotiation import negotiate
+from app.core.codecs import ENCODERS, Encoder, available_codings
+
+KEVENT_STREAM = "text/event-stream"
+COMPRESSIBLE_TYPES = frozenset(  # noqa: WPS407
+    (
+        "application/json",
+        "application/x-ndjson",
+        "application/msgpack",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+    ),
+)
+
+
+def compressible(headers: Headers) -> bool:
+    """Tell whether a response with these headers is worth compressing."""
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type == KEVENT_STREAM:
+        return False
+    if media_type.startswith("text/") or media_type.endswith("+json"):
+        return True
+    return media_type in COMPRESSIBLE_TYPES
+
+
+def encoded_etag(tag: str, coding: str) -> str:
+    """Return the tag of the representation with the content coding applied."""
+    if not tag.endswith('"'):
+        return tag
+    return '{0}-{1}"'.format(tag[:-1], coding)
+
+
+def decoded_etag(tag: str) -> str:
+    """Return the tag of the representation before a content coding."""
+    for coding in ENCODERS:
+        suffix = '-{0}"'.format(coding)
+        if tag.endswith(suffix):
+            return '{0}"'.format(tag[: -len(suffix)])
+    return tag
+
+
+class CompressionMiddleware(object):
+    """Compress the responses with the coding negotiated from Accept-Encoding.
+
+    A pure ASGI middleware. A body sent in one message is compressed when
+    it has at least `minimum_size` bytes. A streamed body is compressed as
+    it goes, every chunk flushed to the client, so exports keep streaming.
+    Server-sent events and bodies that already have a coding pass through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        codings: Sequence[str],
+    ) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app (ASGIApp): the wrapped application
+            minimum_size (int): smallest single message body compressed
+            codings (Sequence[str]): content codings, preferred first
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.codings = available_codings(codings)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request, compressing its response if the client allows."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        responder = CompressingSend(
+            send,
+            negotiate(accept_encoding, self.codings),
+            self.minimum_size,
+        )
+        await self.app(scope, receive, responder)
+
+
+class CompressingSend(object):
+    """The `send` of one response, holding its start until the first body."""
+
+    def __init__(self, send: Send, coding: Optional[str], minimum_size: int) -> None:
+        """Wrap the server's send.
+
+        Args:
+            send (Send): the server's send
+            coding (Optional[str]): negotiated coding, None for no compression
+            minimum_size (int): smallest single message body compressed
+        """
+        self.send = send
+        self.coding = coding
+        self.minimum_size = minimum_size
+        self.encoder: Optional[Encoder] = None
+        self._start: Optional[Message] = None
+
+    async def __call__(self, message: Message) -> None:
+        """Forward the message, compressing response bodies."""
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+        if self._start is not None:
+            await self._send_start(message)
+        if self.encoder is not None:
+            message = self._compressed(message)
+        await self.send(message)
+
+    async def _send_start(self, first: Message) -> None:
+        start = self._start
+        self._start = None
+        headers = MutableHeaders(raw=start["headers"])  # type: ignore [index]
+        if compressible(headers):
+            headers.add_vary_header("Accept-Encoding")
+            if self._compresses(first):
+                self._encode(headers)
+        await self.send(start)  # type: ignore [arg-type]
+
+    def _compresses(self, first: Message) -> bool:
+        if self.coding is None:
+            return False
+        streamed = first.get("more_body", False)
+        return streamed or len(first.get("body", b"")) >= self.minimum_size
+
+    def _encode(self, headers: MutableHeaders) -> None:
+        coding = str(self.coding)
+        self.encoder = ENCODERS[coding]()
+        headers["Content-Encoding"] = coding
+        del headers["Content-Length"]  # noqa: WPS420
+        tag = headers.get("etag")
+        if tag is not None:
+            headers["ETag"] = encoded_etag(tag, coding)
+
+    def _compressed(self, message: Message) -> Message:
+        encoder = self.encoder
+        body = encoder.compress(message.get("body", b""))  # type: ignore [union-attr]
+        more_body = message.get("more_body", False)
+        if not more_body:
+            body += encoder.finish()  # type: ignore [union-attr]
+        return {**message, "body": body}
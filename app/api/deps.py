@@ -1,71 +1,109 @@
 from http import HTTPStatus
-from typing import Generator
+from typing import AsyncGenerator
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt
-from jose.exceptions import JWTError
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, models, schemas
-from app.core import security
+from app.core import auth_cache
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.core.tokens import TokenError, token_service
+from app.db import session
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl="{0}/login/access-token".format(settings.API_V1_STR),
 )
 
 
-def get_db() -> Generator:  # type: ignore [type-arg]
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Returns the database object."""
-    try:  # noqa: WPS501
-        db = SessionLocal()
+    async with session.AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(reusable_oauth2),
-) -> models.User:
-    """Returns the current user."""
+def decode_token(token: str) -> schemas.TokenPayload:
+    """Returns the validated claims of the token, cached per token."""
+    token_data = auth_cache.token_cache.get(token)
+    if token_data is not None:
+        return token_data
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[security.ALGORITHM],
-        )
-        token_data = schemas.TokenPayload(**payload)
-    except (JWTError, ValidationError):
+        payload = token_service().decode(token)
+        return auth_cache.remember_token(token, payload)
+    except (TokenError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = crud.user.get(db, iid=token_data.sub)
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
+    token: str = Depends(reusable_oauth2),
+) -> schemas.UserSnapshot:
+    """Returns the current user."""
+    return await user_of_token(db, token)
+
+
+async def user_of_token(db: AsyncSession, token: str) -> schemas.UserSnapshot:
+    """Returns the user the token was issued to, for routes without a Request.
+
+    Args:
+        db (AsyncSession): database session
+        token (str): bearer token
+
+    Raises:
+        HTTPException: invalid token or unknown user
+
+    Returns:
+        schemas.UserSnapshot: the user
+    """
+    token_data = decode_token(token)
+    if token_data.sub is not None:
+        snapshot = auth_cache.user_cache.get(token_data.sub)
+        if snapshot is not None:
+            return snapshot
+    user = await crud.auser.get(db, iid=token_data.sub)
     if not user:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="User not found")
-    return user
+    return auth_cache.remember_user(user)
 
 
-def get_current_active_user(
-    current_user: models.User = Depends(get_current_user),
-) -> models.User:
+async def get_current_active_user(
+    current_user: schemas.UserSnapshot = Depends(get_current_user),
+) -> schemas.UserSnapshot:
     """Returns the current user if user is enabled/active."""
-    if crud.user.disabled(current_user):
+    if crud.auser.disabled(current_user):
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Inactive user")
     return current_user
 
 
-def get_current_active_superuser(
-    current_user: models.User = Depends(get_current_user),
-) -> models.User:
+async def get_current_active_superuser(
+    current_user: schemas.UserSnapshot = Depends(get_current_user),
+) -> schemas.UserSnapshot:
     """Returns the current user if is a superuser."""
-    if not crud.user.is_superuser(current_user):
+    if not crud.auser.is_superuser(current_user):
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
             detail="The user doesn't have enough privileges",
         )
     return current_user
+
+
+async def get_owned_item(
+    iid: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserSnapshot = Depends(get_current_active_user),
+) -> models.Item:
+    """Returns the item `iid` if the current user may access it."""
+    articulo = await crud.acitem.get(db=db, iid=iid)
+    if not articulo:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Item not found")
+    if not crud.auser.is_superuser(current_user):
+        if articulo.owner_id != current_user.id:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail="Not enough permissions",
+            )
+    return articulo
@@ -0,0 +1,102 @@
+"""Strong entity tags from row versions and the conditional requests using them."""
+import hashlib
+from http import HTTPStatus
+from typing import Any, Iterable, List, Optional
+
+from fastapi import HTTPException, Request, Response
+
+from app.api.compression import decoded_etag
+
+KWEAK_PREFIX = "W/"
+KDIGEST_SIZE = 16
+
+
+def etag(rows: Iterable[Any], media_type: str = "") -> str:
+    """Return the strong entity tag of rows, or ORM objects, with an id and a version.
+
+    The tag of a list changes when one of its rows is updated, appears or
+    goes away; the body it stands for is only built when it did.
+
+    Args:
+        rows (Iterable[Any]): rows of the representation, in order
+        media_type (str): set for the representations other than JSON
+
+    Returns:
+        str: quoted tag
+    """
+    digest = hashlib.blake2b(media_type.encode(), digest_size=KDIGEST_SIZE)
+    for row in rows:
+        digest.update("{0}:{1};".format(row.id, row.version).encode())
+    return '"{0}"'.format(digest.hexdigest())
+
+
+def conditional(
+    request: Request,
+    response: Response,
+    rows: Iterable[Any],
+    media_type: str = "",
+) -> Optional[Response]:
+    """Answer a GET whose If-None-Match holds the tag of the rows with a 304.
+
+    Args:
+        request (Request): the request
+        response (Response): response whose ETag header is set otherwise
+        rows (Iterable[Any]): rows of the representation, in order
+        media_type (str): set for the representations other than JSON
+
+    Returns:
+        Optional[Response]: 304 Not Modified, None to send the representation
+    """
+    tag = etag(rows, media_type)
+    response.headers["ETag"] = tag
+    header = request.headers.get("If-None-Match")
+    if header is None:
+        return None
+    if header.strip() == "*":
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": tag})
+    cached = _cached_tag(header, tag)
+    if cached is None:
+        return None
+    # the tag the client holds, with the coding of the 200 it cached
+    return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": cached})
+
+
+def if_match_version(request: Request, db_obj: Any) -> Optional[int]:
+    """Return the version a write must find, from its If-Match header.
+
+    Args:
+        request (Request): the request
+        db_obj (Any): current row, with an id and a version
+
+    Raises:
+        HTTPException: 412 when the row no longer has one of the listed tags
+
+    Returns:
+        Optional[int]: the row version, None without If-Match
+    """
+    header = request.headers.get("If-Match")
+    if header is None:
+        return None
+    # If-Match uses the strong comparison, weak tags never match
+    tags = _strong_tags(header)
+    if header.strip() != "*" and etag([db_obj]) not in tags:
+        raise HTTPException(
+            status_code=HTTPStatus.PRECONDITION_FAILED,
+            detail="It was changed since it was read",
+        )
+    return db_obj.version
+
+
+def _cached_tag(header: str, tag: str) -> Optional[str]:
+    # If-None-Match uses the weak comparison
+    for sent in header.split(","):
+        sent = sent.strip()
+        if decoded_etag(sent.removeprefix(KWEAK_PREFIX)) == tag:
+            return sent
+    return None
+
+
+def _strong_tags(header: str) -> List[str]:
+    # the tag of a compressed body names the same version
+    tags = [decoded_etag(tag.strip()) for tag in header.split(",")]
+    return [tag for tag in tags if not tag.startswith(KWEAK_PREFIX)]
@@ -0,0 +1,63 @@
+"""Streaming serialisation of item rows for the export endpoint."""
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy import Row
+
+from app import crud
+from app.db import session
+
+
+class ExportFormat(str, Enum):  # noqa: WPS600
+    """Formats supported by the item export."""
+
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {  # noqa: WPS407
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+async def export_items(
+    export_format: ExportFormat,
+    owner_id: Optional[int],
+) -> AsyncIterator[bytes]:
+    """Yield the serialised items one server side cursor batch at a time.
+
+    The generator owns its session so that the cursor outlives the request
+    handler that returned the streaming response.
+
+    Args:
+        export_format (ExportFormat): serialisation format
+        owner_id (Optional[int]): only export items of this owner when given
+
+    Yields:
+        bytes: a chunk of the export
+    """
+    if export_format == ExportFormat.csv:
+        yield _csv_chunk([crud.acitem.export_columns])
+    async with session.AsyncSessionLocal() as db:
+        async for rows in crud.acitem.stream_rows(db, owner_id=owner_id):
+            if export_format == ExportFormat.csv:
+                yield _csv_chunk(rows)
+            else:
+                yield _ndjson_chunk(rows)
+
+
+def _ndjson_chunk(rows: Sequence[Row]) -> bytes:  # type: ignore [type-arg]
+    columns = crud.acitem.export_columns
+    lines = [json.dumps(dict(zip(columns, row))) for row in rows]
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def _csv_chunk(rows: Sequence[Sequence[object]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
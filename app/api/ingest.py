@@ -0,0 +1,186 @@
+"""Write-behind queue committing created items in batches."""
+import asyncio
+import logging
+import uuid
+from typing import List, NamedTuple, Optional, Sequence
+
+from app import crud, schemas
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db import session
+
+logger = logging.getLogger(__name__)
+
+KQUEUED = "queued"
+KCREATED = "created"
+KFAILED = "failed"
+
+
+class IngestJob(NamedTuple):
+    """An item waiting to be written."""
+
+    ingest_id: str
+    owner_id: int
+    item_in: schemas.ItemCreate
+
+
+class IngestQueue(object):
+    """Bounded queue of items drained by one background task.
+
+    The task waits for a first item, then keeps collecting until the batch
+    is full or `flush_seconds` have passed, and writes the batch with one
+    multi-row INSERT and a single commit. Under a burst of reports this
+    trades one fsync per item for one per batch.
+
+    The receipts of the last items are kept for `receipt_seconds` so that
+    clients can learn the id of what they submitted. Items still queued
+    when the process dies are lost, `ITEMS_DURABLE_WRITES` keeps the
+    synchronous path for deployments that cannot afford that.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        batch_size: int,
+        flush_seconds: float,
+        receipt_seconds: int,
+    ) -> None:
+        """Configure the queue, the drain task is started by `start`.
+
+        Args:
+            maxsize (int): number of items allowed to wait
+            batch_size (int): maximum number of items per commit
+            flush_seconds (float): longest wait for a batch to fill
+            receipt_seconds (int): how long receipts stay readable
+        """
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.receipts: TTLCache[str, schemas.IngestReceipt] = TTLCache(
+            maxsize=maxsize * 2,
+            ttl=receipt_seconds,
+        )
+        self._queue: Optional["asyncio.Queue[IngestJob]"] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start accepting items, from the event loop."""
+        self._queue = asyncio.Queue(self.maxsize)
+        self._task = asyncio.create_task(self._drain(self._queue))
+
+    async def stop(self) -> None:
+        """Stop accepting items and wait until the queued ones are written."""
+        queue, task = self._queue, self._task
+        self._queue = None
+        self._task = None
+        if queue is None or task is None:
+            return
+        await queue.join()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def submit(
+        self,
+        item_in: schemas.ItemCreate,
+        owner_id: int,
+    ) -> Optional[schemas.IngestReceipt]:
+        """Queue an item for the next batch.
+
+        Args:
+            item_in (schemas.ItemCreate): validated item
+            owner_id (int): owner of the item
+
+        Returns:
+            Optional[schemas.IngestReceipt]: receipt, None when the queue is
+            stopped or full and the caller has to write the item itself
+        """
+        if self._queue is None:
+            return None
+        receipt = schemas.IngestReceipt(ingest_id=uuid.uuid4().hex, status=KQUEUED)
+        try:
+            self._queue.put_nowait(IngestJob(receipt.ingest_id, owner_id, item_in))
+        except asyncio.QueueFull:
+            return None
+        self.receipts.set(receipt.ingest_id, receipt)
+        return receipt
+
+    async def _drain(self, queue: "asyncio.Queue[IngestJob]") -> None:
+        while True:  # noqa: WPS457
+            batch = await self._next_batch(queue)
+            try:  # noqa: WPS501
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _next_batch(self, queue: "asyncio.Queue[IngestJob]") -> List[IngestJob]:
+        batch = [await queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.flush_seconds
+        while True:  # noqa: WPS457
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            if len(batch) >= self.batch_size:
+                return batch
+            job = await _wait_job(queue, deadline)
+            if job is None:
+                return batch
+            batch.append(job)
+
+    async def _write(self, batch: List[IngestJob]) -> None:
+        ids: Sequence[Optional[int]]
+        try:
+            ids = await _write_jobs(batch)
+        except Exception:
+            logger.exception(
+                "write-behind batch of {0} failed, retrying its items alone".format(
+                    len(batch),
+                ),
+            )
+            ids = [await _write_alone(job) for job in batch]
+        for job, iid in zip(batch, ids):
+            status = KFAILED if iid is None else KCREATED
+            self.receipts.set(
+                job.ingest_id,
+                schemas.IngestReceipt(ingest_id=job.ingest_id, status=status, id=iid),
+            )
+
+
+async def _write_jobs(jobs: Sequence[IngestJob]) -> List[int]:
+    async with session.AsyncSessionLocal() as db:
+        ids, _ = await crud.acitem.create_owned(
+            db,
+            owned=[(job.owner_id, job.item_in) for job in jobs],
+            chunk_size=settings.ITEMS_BULK_CHUNK,
+        )
+    return ids
+
+
+async def _write_alone(job: IngestJob) -> Optional[int]:
+    # after a failed batch, only the items that fail on their own are lost
+    try:
+        ids = await _write_jobs([job])
+    except Exception:
+        logger.exception("write-behind item {0} failed".format(job.ingest_id))
+        return None
+    return ids[0]
+
+
+async def _wait_job(
+    queue: "asyncio.Queue[IngestJob]",
+    deadline: float,
+) -> Optional[IngestJob]:
+    remaining = deadline - asyncio.get_running_loop().time()
+    if remaining <= 0:
+        return None
+    try:
+        return await asyncio.wait_for(queue.get(), remaining)
+    except asyncio.TimeoutError:
+        return None
+
+
+ingest_queue = IngestQueue(
+    maxsize=settings.ITEMS_INGEST_QUEUE_SIZE,
+    batch_size=settings.ITEMS_INGEST_BATCH,
+    flush_seconds=settings.ITEMS_INGEST_FLUSH_SECONDS,
+    receipt_seconds=settings.ITEMS_INGEST_RECEIPT_SECONDS,
+)
@@ -0,0 +1,69 @@
+"""Ban lookups answered from the in-process ban index."""
+from http import HTTPStatus
+from typing import List, Optional, Sequence, cast
+
+from fastapi import HTTPException
+from pydantic import IPvAnyAddress
+
+from app import crud, schemas
+from app.core.ban_index import Address, ban_index
+from app.db import session
+
+KINDEXED = ("id", "owner_id", "title", "expires_at")
+
+
+async def load_ban_index() -> None:
+    """Fill the ban index from the item table."""
+    ban_index.clear()
+    async with session.AsyncSessionLocal() as db:
+        async for rows in crud.acitem.stream_rows(db, names=KINDEXED):
+            for row in rows:
+                ban_index.put(row.id, row.owner_id, row.title, row.expires_at)
+
+
+def lookup(address: IPvAnyAddress, owner_id: Optional[int]) -> schemas.BanLookup:
+    """Check one address against the ban index.
+
+    Args:
+        address (IPvAnyAddress): address to check
+        owner_id (Optional[int]): only report bans of this owner when given
+
+    Returns:
+        schemas.BanLookup: whether and by which items the address is banned
+    """
+    matches = [
+        schemas.BanMatch(
+            id=entry.item_id,
+            owner_id=entry.owner_id,
+            network=str(entry.network),
+        )
+        for entry in ban_index.lookup(cast(Address, address))
+        if owner_id is None or entry.owner_id == owner_id
+    ]
+    return schemas.BanLookup(addr=address, banned=bool(matches), matches=matches)
+
+
+def lookup_many(
+    addresses: Sequence[IPvAnyAddress],
+    owner_id: Optional[int],
+    max_addrs: int,
+) -> List[schemas.BanLookup]:
+    """Check a batch of addresses against the ban index.
+
+    Args:
+        addresses (Sequence[IPvAnyAddress]): addresses to check
+        owner_id (Optional[int]): only report bans of this owner when given
+        max_addrs (int): largest accepted number of addresses
+
+    Raises:
+        HTTPException: if the batch is too large
+
+    Returns:
+        List[schemas.BanLookup]: one answer per address, in input order
+    """
+    if len(addresses) > max_addrs:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            detail="At most {0} addresses per request".format(max_addrs),
+        )
+    return [lookup(address, owner_id) for address in addresses]
@@ -0,0 +1,131 @@
+"""Request instrumentation middleware and the Prometheus /metrics route."""
+import time
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core import auth_cache
+from app.core.metrics import RequestStats, current_request, header, registry
+from app.db.pool import PoolSnapshot
+from app.db.session import pool_snapshot
+
+KUNMATCHED = "<unmatched>"
+KGAUGE = "gauge"
+# snapshot key, metric name, help, type
+POOL_METRICS = (  # noqa: WPS407
+    ("checkouts", "db_pool_checkouts_total", "Connection checkouts.", "counter"),
+    ("timeouts", "db_pool_timeouts_total", "Checkouts that timed out.", "counter"),
+    (
+        "wait_seconds_total",
+        "db_pool_wait_seconds_total",
+        "Time checkouts waited for a free connection.",
+        "counter",
+    ),
+    (
+        "wait_seconds_max",
+        "db_pool_wait_seconds_max",
+        "Longest wait for a free connection.",
+        KGAUGE,
+    ),
+    ("checked_out", "db_pool_checked_out", "Connections in use.", KGAUGE),
+    ("overflow", "db_pool_overflow", "Connections above pool_size.", KGAUGE),
+)
+# stats key, metric name, help, type
+AUTH_CACHE_METRICS = (  # noqa: WPS407
+    ("hits", "auth_cache_hits", "Lookups answered by the auth cache.", KGAUGE),
+    ("misses", "auth_cache_misses", "Lookups missing the auth cache.", KGAUGE),
+    ("size", "auth_cache_size", "Entries in the auth cache.", KGAUGE),
+)
+
+router = APIRouter()
+
+
+class MetricsMiddleware(object):
+    """Time every HTTP request and count the SQL it runs, per route.
+
+    A pure ASGI middleware: the route is read from the scope once the
+    router has matched it, so the histograms are keyed by path template
+    and not by raw path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app (ASGIApp): the wrapped application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request and record its statistics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request = RequestStats()
+        token = current_request.set(request)
+        started = time.perf_counter()
+        try:  # noqa: WPS501
+            await self.app(scope, receive, send)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request.reset(token)
+            path = getattr(scope.get("route"), "path", KUNMATCHED)
+            registry.route(scope["method"], path).observe(elapsed, request)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Route to the metrics in the Prometheus text format."""
+    lines = registry.render()
+    lines.extend(pool_lines())
+    lines.extend(auth_cache_lines())
+    lines.append("")
+    return PlainTextResponse(
+        "\n".join(lines),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+def pool_lines() -> List[str]:
+    """Return the connection pool statistics as exposition lines."""
+    snapshots = pool_snapshot()
+    lines: List[str] = []
+    for key, *spec in POOL_METRICS:
+        lines.extend(header(*spec))
+        lines.extend(_pool_samples(snapshots, key, spec[0]))
+    return lines
+
+
+def auth_cache_lines() -> List[str]:
+    """Return the token and user cache counters of the process as gauges."""
+    caches = auth_cache.stats()
+    lines: List[str] = []
+    for key, *spec in AUTH_CACHE_METRICS:
+        lines.extend(header(*spec))
+        lines.extend(_cache_samples(caches, key, spec[0]))
+    return lines
+
+
+def _cache_samples(
+    caches: Dict[str, Dict[str, int]],
+    key: str,
+    name: str,
+) -> List[str]:
+    return [
+        '{0}{{cache="{1}"}} {2}'.format(name, cache, counters[key])
+        for cache, counters in caches.items()
+    ]
+
+
+def _pool_samples(
+    snapshots: Dict[str, Optional[PoolSnapshot]],
+    key: str,
+    name: str,
+) -> List[str]:
+    return [
+        '{0}{{engine="{1}"}} {2}'.format(name, engine, snapshot[key])
+        for engine, snapshot in snapshots.items()
+        if snapshot is not None and key in snapshot
+    ]
@@ -0,0 +1,70 @@
+"""Parsing of the Accept and Accept-Encoding request headers."""
+import re
+from typing import Dict, Optional, Sequence, Tuple
+
+# weight parameter of an element, a malformed one counts as absent
+KQUALITY = re.compile(r";\s*q=([01](?:\.\d{0,3})?)\s*(?:;|$)", re.IGNORECASE)
+
+
+def qvalues(header: str) -> Dict[str, float]:
+    """Return the quality of every element of an Accept-like header.
+
+    Args:
+        header (str): e.g. "gzip;q=0.8, br"
+
+    Returns:
+        Dict[str, float]: lower case token or media range -> q, 1 if not given
+    """
+    qualities: Dict[str, float] = {}
+    for element in header.split(","):
+        token, quality = _element(element)
+        if token:
+            qualities[token] = quality
+    return qualities
+
+
+def negotiate(header: str, offers: Sequence[str]) -> Optional[str]:
+    """Return the offer the client accepts best, the earliest on a tie.
+
+    Args:
+        header (str): Accept-Encoding header
+        offers (Sequence[str]): available content codings, preferred first
+
+    Returns:
+        Optional[str]: the offer, None when the client accepts none
+    """
+    qualities = qvalues(header)
+    default = qualities.get("*", 0)
+    accepted = [offer for offer in offers if qualities.get(offer, default) > 0]
+    if not accepted:
+        return None
+    # max keeps the first of equal offers
+    return max(accepted, key=lambda offer: qualities.get(offer, default))
+
+
+def prefers(header: str, media_type: str, fallback: str) -> bool:
+    """Tell whether the Accept header ranks `media_type` at least as `fallback`.
+
+    Args:
+        header (str): Accept header
+        media_type (str): alternative representation, only sent if named
+        fallback (str): the representation sent otherwise
+
+    Returns:
+        bool: `media_type` is named with a q no lower than the fallback's
+    """
+    qualities = qvalues(header)
+    wanted = qualities.get(media_type, 0)
+    kind = fallback.partition("/")[0]
+    usual = max(
+        qualities.get(fallback, 0),
+        qualities.get("{0}/*".format(kind), 0),
+        qualities.get("*/*", 0),
+    )
+    return wanted > 0 and wanted >= usual
+
+
+def _element(element: str) -> Tuple[str, float]:
+    token = element.partition(";")[0].strip().lower()
+    quality = KQUALITY.search(element)
+    return token, 1.0 if quality is None else float(quality.group(1))
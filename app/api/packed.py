@@ -0,0 +1,37 @@
+"""MessagePack item lists, for clients that ask for them in Accept."""
+from datetime import datetime
+from importlib.util import find_spec
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.api.negotiation import prefers
+
+KMSGPACK = "application/msgpack"
+KJSON = "application/json"
+# msgpack is an optional dependency, without it lists are always JSON
+AVAILABLE = find_spec("msgpack") is not None
+
+
+class MsgPackResponse(Response):
+    """A body encoded as MessagePack, datetimes as ISO 8601 like in JSON."""
+
+    media_type = KMSGPACK
+
+    def render(self, content: Any) -> bytes:  # noqa: WPS110
+        """Return the encoded content."""
+        import msgpack  # type: ignore [import]  # noqa: WPS433
+
+        return msgpack.packb(content, default=_encode)
+
+
+def wanted(request: Request) -> bool:
+    """Tell whether the client ranks MessagePack at least as high as JSON."""
+    return AVAILABLE and prefers(request.headers.get("accept", ""), KMSGPACK, KJSON)
+
+
+def _encode(unknown: Any) -> Any:
+    if isinstance(unknown, datetime):
+        return unknown.isoformat()
+    raise TypeError("cannot serialize {0!r}".format(type(unknown)))
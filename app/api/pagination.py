@@ -0,0 +1,94 @@
+"""Opaque keyset cursors for the list endpoints."""
+import base64
+import binascii
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, Request, Response
+
+KCURSOR_PREFIX = "id:"
+
+
+@dataclass(frozen=True)
+class Page(object):
+    """Paging parameters of a list request."""
+
+    skip: int
+    limit: int
+    after: Optional[int]
+
+
+async def page_params(
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> Page:
+    """Dependency collecting skip/limit paging and the `after` cursor."""
+    return Page(skip=skip, limit=limit, after=decode_cursor(after))
+
+
+def encode_cursor(last_id: int) -> str:
+    """Return the opaque cursor pointing after the given id.
+
+    Args:
+        last_id (int): id of the last row of the page
+
+    Returns:
+        str: url safe cursor
+    """
+    raw = "{0}{1}".format(KCURSOR_PREFIX, last_id).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Return the id encoded in a cursor.
+
+    Args:
+        cursor (Optional[str]): cursor received from the client
+
+    Raises:
+        HTTPException: if the cursor is malformed
+
+    Returns:
+        Optional[int]: keyset bound or None without a cursor
+    """
+    if not cursor:
+        return None
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(cursor + padding).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raw = ""
+    prefix, _, last_id = raw.partition(KCURSOR_PREFIX)
+    if prefix or not last_id.isdigit():
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Invalid cursor")
+    return int(last_id)
+
+
+def set_next_page(
+    request: Request,
+    response: Response,
+    rows: Sequence[Any],
+    limit: int,
+) -> None:
+    """Advertise the next page through the Link and X-Next-Cursor headers.
+
+    Nothing is set when the page is shorter than the limit, the client has
+    then reached the end of the listing.
+
+    Args:
+        request (Request): incoming request
+        response (Response): response whose headers are updated
+        rows (Sequence[Any]): rows of the current page, ordered by id
+        limit (int): page size requested by the client
+    """
+    if not rows or len(rows) < limit:
+        return
+    cursor = encode_cursor(rows[-1].id)
+    next_url = request.url.remove_query_params("skip").include_query_params(
+        after=cursor,
+        limit=limit,
+    )
+    response.headers["X-Next-Cursor"] = cursor
+    response.headers["Link"] = '<{0}>; rel="next"'.format(next_url)
@@ -0,0 +1,119 @@
+"""Background deletion of expired items and old change log entries."""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.config import settings
+from app.db import session
+
+logger = logging.getLogger(__name__)
+
+# deletes a batch of rows in its own transaction and counts them
+Batch = Callable[[AsyncSession], Awaitable[int]]
+
+
+class Reaper(object):
+    """Delete expired items in small transactions from one background task.
+
+    A pass deletes the items expired when it started, then compacts the
+    change log entries older than `retention` seconds; `batch_size` rows
+    per transaction and no more than `rows_per_second`, so that it never
+    holds many locks nor competes with requests for long. A short batch
+    ends a pass, the next one runs `interval` seconds later.
+
+    Reads already hide expired items, the reaper only bounds the growth of
+    the tables and of their indexes.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        batch_size: int,
+        rows_per_second: float,
+        retention: float,
+    ) -> None:
+        """Configure the reaper, the task is started by `start`.
+
+        Args:
+            interval (float): seconds between passes
+            batch_size (int): largest number of rows per transaction
+            rows_per_second (float): highest deletion rate, 0 for no limit
+            retention (float): seconds change log entries are kept
+        """
+        self.interval = interval
+        self.batch_size = batch_size
+        self.rows_per_second = rows_per_second
+        self.retention = retention
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start reaping, from the event loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop reaping, a batch in flight is rolled back."""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def reap(self) -> int:
+        """Delete the items expired now.
+
+        Returns:
+            int: number of deleted items
+        """
+        now = datetime.utcnow()
+        return await self._batches(
+            lambda db: crud.acitem.remove_expired(db, now=now, limit=self.batch_size),
+        )
+
+    async def compact(self) -> int:
+        """Compact the change log entries older than the retention.
+
+        Returns:
+            int: number of removed entries
+        """
+        before = datetime.utcnow() - timedelta(seconds=self.retention)
+        return await self._batches(
+            lambda db: crud.achange.compact(db, before=before, limit=self.batch_size),
+        )
+
+    async def _batches(self, batch: Batch) -> int:
+        pause: float = 0
+        if self.rows_per_second > 0:
+            pause = self.batch_size / self.rows_per_second
+        deleted = 0
+        while True:  # noqa: WPS457
+            async with session.AsyncSessionLocal() as db:
+                count = await batch(db)
+            deleted += count
+            if count < self.batch_size:
+                return deleted
+            await asyncio.sleep(pause)
+
+    async def _run(self) -> None:
+        while True:  # noqa: WPS457
+            try:
+                reaped = await self.reap()
+                compacted = await self.compact()
+            except Exception:
+                logger.exception("reaping expired items failed")
+            else:
+                logger.debug(
+                    "reaped {0} items, compacted {1} changes".format(reaped, compacted),
+                )
+            await asyncio.sleep(self.interval)
+
+
+reaper = Reaper(
+    interval=settings.ITEMS_REAP_INTERVAL_SECONDS,
+    batch_size=settings.ITEMS_REAP_BATCH,
+    rows_per_second=settings.ITEMS_REAP_ROWS_PER_SECOND,
+    retention=settings.ITEMS_CHANGES_RETENTION_SECONDS,
+)
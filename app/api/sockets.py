@@ -0,0 +1,93 @@
+"""Item events sent as WebSocket messages."""
+import asyncio
+import json
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, WebSocket, status
+
+from app import crud
+from app.api import deps
+from app.api.stream import KREADY, KRESYNC, pending, subscribe
+from app.core.broadcaster import broadcaster
+from app.core.events import Subscription
+from app.db import session
+
+KEVENT = "event"
+KPING_MESSAGE = json.dumps({KEVENT: "ping"})
+
+
+async def websocket_subscribe(
+    websocket: WebSocket,
+    token: Optional[str],
+) -> Optional[Tuple[Subscription, int]]:
+    """Authenticate a WebSocket client and subscribe it, like `subscribe`.
+
+    Args:
+        websocket (WebSocket): connection, not accepted yet
+        token (Optional[str]): the `token` query parameter
+
+    Returns:
+        Optional[Tuple[Subscription, int]]: None for an invalid token or an
+        inactive user
+    """
+    if token is None:
+        scheme, _, credentials = websocket.headers.get("Authorization", "").partition(
+            " ",
+        )
+        token = credentials if scheme.lower() == "bearer" else ""
+    async with session.AsyncSessionLocal() as db:
+        try:
+            current_user = await deps.user_of_token(db, token)
+        except HTTPException:
+            return None
+        if crud.auser.disabled(current_user):
+            return None
+        return await subscribe(db, current_user)
+
+
+async def websocket_events(
+    websocket: WebSocket,
+    subscription: Subscription,
+    version: int,
+) -> None:
+    """Send the subscription as JSON text messages, like `sse_events`.
+
+    Heartbeats are {"event": "ping"} messages. After the `resync` message
+    the connection is closed with code 1013 (try again later).
+
+    Args:
+        websocket (WebSocket): accepted connection
+        subscription (Subscription): open subscription, closed at the end
+        version (int): change log head when it was opened
+    """
+    # nothing is expected from the client, reading only notices it leaving
+    tasks = {
+        asyncio.create_task(_send_events(websocket, subscription, version)),
+        asyncio.create_task(_read_until_closed(websocket)),
+    }
+    try:  # noqa: WPS501
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        broadcaster.unsubscribe(subscription)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _read_until_closed(websocket: WebSocket) -> None:
+    while True:  # noqa: WPS457
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+async def _send_events(
+    websocket: WebSocket,
+    subscription: Subscription,
+    version: int,
+) -> None:
+    await websocket.send_text(json.dumps({KEVENT: KREADY, "version": version}))
+    async for event in pending(subscription):
+        await websocket.send_text(KPING_MESSAGE if event is None else event.text)
+    await websocket.send_text(json.dumps({KEVENT: KRESYNC}))
+    await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
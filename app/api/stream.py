@@ -0,0 +1,99 @@
+"""Item events streamed as server-sent events or WebSocket messages."""
+import asyncio
+import json
+from typing import AsyncIterator, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.core.broadcaster import broadcaster
+from app.core.config import settings
+from app.core.events import Event, Subscription
+
+KREADY = "ready"
+KRESYNC = "resync"
+# an SSE comment, ignored by clients, keeps proxies from timing out
+KPING_FRAME = ": ping\n\n"
+
+
+async def subscribe(
+    db: AsyncSession,
+    current_user: schemas.UserSnapshot,
+) -> Tuple[Subscription, int]:
+    """Subscribe to the events the user may read and return the feed head.
+
+    The subscription is opened first: every write after the returned
+    change log version reaches the stream, the client catches up to that
+    version from /items/changes.
+
+    Args:
+        db (AsyncSession): database session
+        current_user (schemas.UserSnapshot): subscriber
+
+    Returns:
+        Tuple[Subscription, int]: the subscription and the change log head
+    """
+    owner_id = None if crud.auser.is_superuser(current_user) else current_user.id
+    subscription = broadcaster.subscribe(owner_id)
+    try:
+        version = await crud.achange.head(db)
+    except Exception:
+        broadcaster.unsubscribe(subscription)
+        raise
+    return subscription, version
+
+
+async def pending(subscription: Subscription) -> AsyncIterator[Optional[Event]]:
+    """Yield the events of the subscription until it is closed.
+
+    None is yielded after EVENTS_HEARTBEAT_SECONDS without an event.
+
+    Args:
+        subscription (Subscription): open subscription
+
+    Yields:
+        Optional[Event]: the next event, None when a heartbeat is due
+    """
+    while True:  # noqa: WPS457
+        try:
+            event = await asyncio.wait_for(
+                subscription.get(),
+                settings.EVENTS_HEARTBEAT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            yield None
+            continue
+        if event is None:
+            return
+        yield event
+
+
+def sse_frame(kind: str, text: str) -> str:
+    """Return a server-sent event."""
+    return "event: {0}\ndata: {1}\n\n".format(kind, text)
+
+
+async def sse_events(subscription: Subscription, version: int) -> AsyncIterator[str]:
+    """Stream the subscription as server-sent events.
+
+    A `ready` event carries the change log version the stream starts
+    after. A `resync` event ends a stream that fell behind or was shut
+    down, the client reconnects and catches up from the change feed.
+
+    Args:
+        subscription (Subscription): open subscription, closed at the end
+        version (int): change log head when it was opened
+
+    Yields:
+        str: event frames and heartbeat comments
+    """
+    try:  # noqa: WPS501
+        yield sse_frame(KREADY, json.dumps({"version": version}))
+        async for event in pending(subscription):
+            if event is None:
+                yield KPING_FRAME
+            else:
+                yield sse_frame(event.kind, event.text)
+        yield sse_frame(KRESYNC, "{}")
+    finally:
+        broadcaster.unsubscribe(subscription)
@@ -0,0 +1,50 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.core.xkcd import Payload, XkcdClient
+
+if TYPE_CHECKING:
+    import httpx
+
+router = APIRouter()
+
+
+async def get_xkcd(http_request: Request) -> XkcdClient:
+    """Returns the xkcd client opened by the lifespan hook."""
+    return http_request.app.state.xkcd
+
+
+async def fetch_comic(xkcd: XkcdClient, comic_id: Optional[int]) -> Payload:
+    """Fetch a comic, mapping upstream failures to gateway errors."""
+    # loaded with the client pool
+    import httpx  # noqa: WPS433, WPS442
+
+    try:
+        return await xkcd.comic(comic_id)
+    except httpx.HTTPError as exc:
+        raise HTTPException(status_code=_gateway_status(exc), detail=str(exc))
+
+
+@router.get("/xkcd")
+async def xkcd_current(xkcd: XkcdClient = Depends(get_xkcd)) -> Any:
+    """Route to xkcd."""
+    return await fetch_comic(xkcd, None)
+
+
+@router.get("/xkcd/{comic_id}")
+async def xkcd_comic(comic_id: int, xkcd: XkcdClient = Depends(get_xkcd)) -> Any:
+    """Route to xkcd_comic."""
+    return await fetch_comic(xkcd, comic_id)
+
+
+def _gateway_status(exc: "httpx.HTTPError") -> HTTPStatus:
+    import httpx  # noqa: WPS433, WPS442
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        if exc.response.status_code == HTTPStatus.NOT_FOUND:
+            return HTTPStatus.NOT_FOUND
+    if isinstance(exc, httpx.TimeoutException):
+        return HTTPStatus.GATEWAY_TIMEOUT
+    return HTTPStatus.BAD_GATEWAY
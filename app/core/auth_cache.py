@@ -0,0 +1,67 @@
+"""Caches sparing get_current_user a JWT decode and a SELECT per request.
+
+Invalidation only reaches the current process, other workers pick up a
+changed user once AUTH_USER_CACHE_SECONDS have elapsed.
+"""
+import time
+from typing import Any, Dict, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models import User
+from app.schemas import TokenPayload, UserSnapshot
+
+token_cache: TTLCache[str, TokenPayload] = TTLCache(
+    maxsize=settings.AUTH_CACHE_SIZE,
+    ttl=settings.AUTH_TOKEN_CACHE_SECONDS,
+)
+user_cache: TTLCache[int, UserSnapshot] = TTLCache(
+    maxsize=settings.AUTH_CACHE_SIZE,
+    ttl=settings.AUTH_USER_CACHE_SECONDS,
+)
+
+
+def remember_token(token: str, payload: Dict[str, Any]) -> TokenPayload:
+    """Cache the validated claims of a token, never past its expiry.
+
+    Args:
+        token (str): encoded token
+        payload (Dict[str, Any]): decoded claims
+
+    Returns:
+        TokenPayload: validated claims
+    """
+    token_data = TokenPayload(**payload)
+    expires = payload.get("exp")
+    ttl = None if expires is None else float(expires) - time.time()
+    token_cache.set(token, token_data, ttl)
+    return token_data
+
+
+def remember_user(user: User) -> UserSnapshot:
+    """Cache an immutable snapshot of the user.
+
+    Args:
+        user (User): user loaded from the database
+
+    Returns:
+        UserSnapshot: snapshot stored in the cache
+    """
+    snapshot = UserSnapshot.from_orm(user)
+    user_cache.set(snapshot.id, snapshot)
+    return snapshot
+
+
+def invalidate_user(user_id: Optional[int]) -> None:
+    """Forget the cached snapshot of a user.
+
+    Args:
+        user_id (Optional[int]): user id
+    """
+    if user_id is not None:
+        user_cache.pop(user_id)
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    """Return the hit and miss counters of both caches."""
+    return {"token": token_cache.stats(), "user": user_cache.stats()}
@@ -0,0 +1,171 @@
+"""In-process index answering "is this address banned?" without a query."""
+import ipaddress
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+Address = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+# network address (as an int) -> ids of the items banning that network
+Bucket = Dict[int, Set[int]]
+# (ip version, prefix length)
+BucketKey = Tuple[int, int]
+
+
+class BanEntry(NamedTuple):
+    """An item whose title is a banned address or network."""
+
+    item_id: int
+    owner_id: int
+    network: Network
+    expires_at: Optional[datetime] = None
+
+
+class BanIndex(object):
+    """Banned networks bucketed by IP version and prefix length.
+
+    A lookup masks the address once per prefix length in use and probes a
+    dict, so its cost depends on the number of distinct prefix lengths
+    (a handful in practice), not on the number of bans. Item titles that
+    are not an address or a CIDR network are not indexed.
+
+    The index belongs to one process, it is loaded at startup and kept
+    current by `AsyncCRUDItem` and by the item events of the other workers.
+    Expired entries are skipped by lookups until the reaper deletes their
+    rows. It is meant to be used from the event loop and does no locking.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._entries: Dict[int, BanEntry] = {}
+        self._buckets: Dict[BucketKey, Bucket] = {}
+        self._prefixes: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed items."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Forget every entry."""
+        self._entries.clear()
+        self._buckets.clear()
+        self._prefixes.clear()
+
+    def put(
+        self,
+        item_id: int,
+        owner_id: int,
+        title: Optional[str],
+        expires_at: Optional[datetime] = None,
+    ) -> bool:
+        """Index the item, replacing a previous entry for the same id.
+
+        Args:
+            item_id (int): item id
+            owner_id (int): owner of the item
+            title (Optional[str]): address or CIDR network of the ban
+            expires_at (Optional[datetime]): UTC end of the ban, None for never
+
+        Returns:
+            bool: False when the title is not an address or network
+        """
+        self.discard(item_id)
+        network = parse_network(title)
+        if network is None:
+            return False
+        self._entries[item_id] = BanEntry(item_id, owner_id, network, expires_at)
+        key = (network.version, network.prefixlen)
+        if key not in self._buckets:
+            self._buckets[key] = {}
+            self._prefixes[network.version] = _prefixlens(
+                self._buckets,
+                network.version,
+            )
+        bucket = self._buckets[key]
+        bucket.setdefault(int(network.network_address), set()).add(item_id)
+        return True
+
+    def discard(self, item_id: int) -> None:
+        """Remove the item from the index if it is there.
+
+        Args:
+            item_id (int): item id
+        """
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return
+        network = entry.network
+        key = (network.version, network.prefixlen)
+        bucket = self._buckets[key]
+        netint = int(network.network_address)
+        bucket[netint].discard(item_id)
+        if not bucket[netint]:
+            del bucket[netint]  # noqa: WPS420
+        if not bucket:
+            del self._buckets[key]  # noqa: WPS420
+            self._prefixes[network.version] = _prefixlens(
+                self._buckets,
+                network.version,
+            )
+
+    def lookup(
+        self,
+        address: Address,
+        now: Optional[datetime] = None,
+    ) -> List[BanEntry]:
+        """Return the unexpired entries whose network contains the address.
+
+        IPv4-mapped IPv6 addresses are looked up as IPv4.
+
+        Args:
+            address (Address): address to check
+            now (Optional[datetime]): UTC time of the lookup, defaults to now
+
+        Returns:
+            List[BanEntry]: matching entries, most specific network first
+        """
+        if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        now = now or datetime.utcnow()
+        matches: List[BanEntry] = []
+        for prefixlen in self._prefixes.get(address.version, ()):
+            matches.extend(
+                entry
+                for entry in self._probe(address, prefixlen)
+                if entry.expires_at is None or entry.expires_at > now
+            )
+        return matches
+
+    def _probe(self, address: Address, prefixlen: int) -> List[BanEntry]:
+        hostbits = address.max_prefixlen - prefixlen
+        netint = int(address) >> hostbits << hostbits
+        item_ids = self._buckets[address.version, prefixlen].get(netint, ())
+        return [self._entries[item_id] for item_id in sorted(item_ids)]
+
+
+def parse_network(title: Optional[str]) -> Optional[Network]:
+    """Parse an item title as an address or CIDR network.
+
+    Host bits are ignored, so "192.0.2.7/24" bans 192.0.2.0/24.
+
+    Args:
+        title (Optional[str]): item title
+
+    Returns:
+        Optional[Network]: the network, None when the title is not one
+    """
+    if not title:
+        return None
+    try:
+        return ipaddress.ip_network(title.strip(), strict=False)
+    except ValueError:
+        return None
+
+
+def _prefixlens(buckets: Dict[BucketKey, Bucket], version: int) -> List[int]:
+    return sorted(
+        (prefixlen for ver, prefixlen in buckets if ver == version),
+        reverse=True,
+    )
+
+
+ban_index = BanIndex()
@@ -0,0 +1,75 @@
+"""Fan-out of item events to the stream subscribers of every worker."""
+from typing import List, Sequence, Union
+
+from app.core.buses import LocalBus, PostgresBus
+from app.core.config import settings
+from app.core.events import Deliver, Event, Fanout
+from app.db.urls import dsn_url
+
+KPOSTGRES = "postgres"
+KLOCAL = "local"
+
+
+class Broadcaster(Fanout):
+    """Hand every item event to the open subscriptions of the process.
+
+    Writes `publish` their events on the bus once committed, the bus
+    delivers them to the broadcaster of each worker, which hands them to
+    its watchers, then offers them to the matching subscriptions.
+    """
+
+    def __init__(self, buffer: int, bus: str, dsn: str, channel: str) -> None:
+        """Create a broadcaster on the local bus, `start` connects the shared one.
+
+        Args:
+            buffer (int): events a subscriber may fall behind before it is closed
+            bus (str): "postgres" to relay the events between the workers
+            dsn (str): postgres connection url, without driver
+            channel (str): notification channel
+        """
+        super().__init__(buffer)
+        self.bus_name = bus
+        self.dsn = dsn
+        self.channel = channel
+        self.bus: Union[LocalBus, PostgresBus] = LocalBus(self.deliver)
+        self.watchers: List[Deliver] = []
+
+    def watch(self, watcher: Deliver) -> None:
+        """Hand every delivered event to `watcher` first, once registered."""
+        if watcher not in self.watchers:
+            self.watchers.append(watcher)
+
+    def deliver(self, events: Sequence[Event]) -> None:
+        """Hand the events of any worker to the watchers and subscribers."""
+        for watcher in self.watchers:
+            watcher(events)
+        super().deliver(events)
+
+    def start(self) -> None:
+        """Connect the bus shared by the workers, from the event loop."""
+        if self.bus_name == KPOSTGRES:
+            self.bus = PostgresBus(
+                self.dsn,
+                self.channel,
+                self.deliver,
+                settings.EVENTS_QUEUE_SIZE,
+            )
+        self.bus.start()
+
+    async def stop(self) -> None:
+        """Disconnect the bus and end every stream."""
+        await self.bus.stop()
+        self.bus = LocalBus(self.deliver)
+        self.close_all()
+
+    async def publish(self, events: Sequence[Event]) -> None:
+        """Send committed events to the subscribers of every worker."""
+        await self.bus.publish(events)
+
+
+broadcaster = Broadcaster(
+    buffer=settings.EVENTS_BUFFER,
+    bus=settings.EVENTS_BUS or KLOCAL,
+    dsn=dsn_url(settings.DB_CONNECTION),
+    channel=settings.EVENTS_CHANNEL,
+)
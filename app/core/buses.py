@@ -0,0 +1,225 @@
+"""Buses carrying the item events of a write to the workers."""
+import asyncio
+import logging
+from typing import Any, List, Optional, Sequence, Tuple
+
+from app.core.events import Deliver, Event
+
+logger = logging.getLogger(__name__)
+
+KDROPPED = "dropped {0} item events, too many waiting to be sent"
+
+
+class LocalBus(object):
+    """Bus of a single process, events are delivered as they are published."""
+
+    def __init__(self, deliver: Deliver) -> None:
+        """Create the bus.
+
+        Args:
+            deliver (Deliver): fan-out of the events to the subscribers
+        """
+        self.deliver = deliver
+
+    def start(self) -> None:
+        """Nothing to connect."""
+
+    async def stop(self) -> None:
+        """Nothing to disconnect."""
+
+    async def publish(self, events: Sequence[Event]) -> None:
+        """Deliver the events to the subscribers of this process."""
+        self.deliver(events)
+
+
+class PostgresNotifier(object):
+    """Send notifications from one connection and one background task.
+
+    Writes only queue their events, the task sends what has accumulated
+    in one round trip while the next writes go on. Events are dropped, and
+    only found in the change feed, when `queue_size` of them are waiting
+    or the connection fails; it is opened again for the next ones.
+    """
+
+    def __init__(self, dsn: str, channel: str, queue_size: int) -> None:
+        """Configure the sender, it starts in `start`.
+
+        Args:
+            dsn (str): postgres connection url, without driver
+            channel (str): notification channel
+            queue_size (int): largest number of events waiting to be sent
+        """
+        self.dsn = dsn
+        self.channel = channel
+        self.queue_size = queue_size
+        self._queue: Optional["asyncio.Queue[Event]"] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._connection: Any = None
+
+    def start(self, asyncpg: Any) -> None:
+        """Start sending, from the event loop.
+
+        Args:
+            asyncpg (Any): the asyncpg module
+        """
+        self._queue = asyncio.Queue(self.queue_size)
+        self._task = asyncio.create_task(self._drain(asyncpg, self._queue))
+
+    def notify(self, events: Sequence[Event]) -> None:
+        """Queue the events for the channel, without waiting.
+
+        Args:
+            events (Sequence[Event]): committed events
+        """
+        if self._queue is None:
+            return
+        for index, event in enumerate(events):
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(KDROPPED.format(len(events) - index))
+                return
+
+    async def stop(self) -> None:
+        """Send the waiting events, then stop and disconnect."""
+        queue, task = self._queue, self._task
+        self._queue = None
+        self._task = None
+        if queue is not None and task is not None:
+            await queue.join()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self._close()
+
+    async def _drain(self, asyncpg: Any, queue: "asyncio.Queue[Event]") -> None:
+        while True:  # noqa: WPS457
+            events = [await queue.get()]
+            while not queue.empty():
+                events.append(queue.get_nowait())
+            args = [(self.channel, event.text) for event in events]
+            try:
+                await self._send(asyncpg, args)
+            except Exception:
+                logger.exception("could not publish {0} item events".format(len(args)))
+                await self._close()
+            finally:
+                for _ in events:
+                    queue.task_done()
+
+    async def _send(self, asyncpg: Any, args: List[Tuple[str, str]]) -> None:
+        if self._connection is None:
+            self._connection = await asyncpg.connect(self.dsn)
+        await self._connection.executemany("SELECT pg_notify($1, $2)", args)
+
+    async def _close(self) -> None:
+        connection = self._connection
+        self._connection = None
+        if connection is not None:
+            await connection.close()
+
+
+class PostgresListener(object):
+    """Deliver the notifications of a channel, listening on one connection.
+
+    A lost connection is opened again a second later, the events missed
+    in between are only found in the change feed.
+    """
+
+    def __init__(self, dsn: str, channel: str, deliver: Deliver) -> None:
+        """Configure the listener, it connects in `start`.
+
+        Args:
+            dsn (str): postgres connection url, without driver
+            channel (str): notification channel
+            deliver (Deliver): fan-out of the events to the subscribers
+        """
+        self.dsn = dsn
+        self.channel = channel
+        self.deliver = deliver
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self, asyncpg: Any) -> None:
+        """Start listening, from the event loop.
+
+        Args:
+            asyncpg (Any): the asyncpg module
+        """
+        self._task = asyncio.create_task(self._listen(asyncpg))
+
+    async def stop(self) -> None:
+        """Stop listening and disconnect."""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _listen(self, asyncpg: Any) -> None:
+        while True:  # noqa: WPS457
+            try:
+                await self._listen_once(asyncpg)
+            except Exception:
+                logger.exception("item event listener failed")
+            await asyncio.sleep(1)
+
+    async def _listen_once(self, asyncpg: Any) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        try:  # noqa: WPS501
+            await connection.add_listener(self.channel, self._notified)
+            await lost.wait()
+        finally:
+            await connection.close()
+
+    def _notified(self, connection: Any, pid: int, channel: str, text: str) -> None:
+        self.deliver([Event.from_text(text)])
+
+
+class PostgresBus(object):
+    """Bus between the workers of a deployment over Postgres LISTEN/NOTIFY.
+
+    Every worker listens on `channel` from one dedicated connection and
+    delivers what it hears, its own events included, to its subscribers.
+    Notifications are sent from a second connection by a background task,
+    writes never wait for them.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        deliver: Deliver,
+        queue_size: int,
+    ) -> None:
+        """Configure the bus, it connects in `start`.
+
+        Args:
+            dsn (str): postgres connection url, without driver
+            channel (str): notification channel
+            deliver (Deliver): fan-out of the events to the subscribers
+            queue_size (int): largest number of events waiting to be sent
+        """
+        self.listener = PostgresListener(dsn, channel, deliver)
+        self.notifier = PostgresNotifier(dsn, channel, queue_size)
+
+    def start(self) -> None:
+        """Start listening, from the event loop."""
+        import asyncpg  # type: ignore [import]  # noqa: WPS433
+
+        self.listener.start(asyncpg)
+        self.notifier.start(asyncpg)
+
+    async def stop(self) -> None:
+        """Stop listening and disconnect."""
+        await self.listener.stop()
+        await self.notifier.stop()
+
+    async def publish(self, events: Sequence[Event]) -> None:
+        """Notify every listening worker of the events.
+
+        The write is already committed, the events are queued for the
+        notifier and a failure to send them is logged; they are then only
+        found in the change feed.
+        """
+        self.notifier.notify(events)
@@ -0,0 +1,108 @@
+"""Small in-process caches."""
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[KeyType, ValueType]):  # noqa: WPS214
+    """Bounded LRU mapping whose entries expire after a time to live.
+
+    The cache is meant to be used from the event loop and does no locking.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize (int): maximum number of entries, least recently used go first
+            ttl (float): default time to live of an entry in seconds
+            timer (Callable[[], float]): clock used to expire entries
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[KeyType, Tuple[float, ValueType]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of entries, expired ones included."""
+        return len(self._entries)
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        """Return the cached value or None when missing or expired.
+
+        Args:
+            key (KeyType): cache key
+
+        Returns:
+            Optional[ValueType]: cached value
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.timer():
+            if entry is not None:
+                del self._entries[key]  # noqa: WPS420
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def peek(self, key: KeyType) -> Optional[ValueType]:
+        """Return the cached value, without counting it nor refreshing it.
+
+        Args:
+            key (KeyType): cache key
+
+        Returns:
+            Optional[ValueType]: cached value, None when missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.timer():
+            return None
+        return entry[1]
+
+    def set(  # noqa: WPS125
+        self,
+        key: KeyType,
+        cache_value: ValueType,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key (KeyType): cache key
+            cache_value (ValueType): value to store
+            ttl (Optional[float]): time to live overriding the default
+        """
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            return
+        self._entries[key] = (self.timer() + lifetime, cache_value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: KeyType) -> None:
+        """Drop an entry if present.
+
+        Args:
+            key (KeyType): cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit and miss counters and the current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
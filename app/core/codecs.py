@@ -0,0 +1,99 @@
+"""Streaming encoders of the HTTP content codings the API can send."""
+import zlib
+from importlib.util import find_spec
+from typing import Callable, Dict, List, Sequence, Union
+
+from app.core.config import settings
+
+# the 15 bits window of zlib.MAX_WBITS, plus 16 for a gzip header and trailer
+KGZIP_WBITS = 31
+
+
+class GzipEncoder(object):
+    """gzip stream, flushed after every chunk so that a client reads it as sent."""
+
+    def __init__(self) -> None:
+        """Start a gzip member at COMPRESSION_GZIP_LEVEL."""
+        self._zlib = zlib.compressobj(
+            settings.COMPRESSION_GZIP_LEVEL,
+            zlib.DEFLATED,
+            KGZIP_WBITS,
+        )
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Return the compressed chunk."""
+        return self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """Return the end of the stream."""
+        return self._zlib.flush()
+
+
+class BrotliEncoder(object):
+    """Brotli stream, needs the brotli package."""
+
+    def __init__(self) -> None:
+        """Start a stream at COMPRESSION_BROTLI_QUALITY."""
+        import brotli  # type: ignore [import]  # noqa: WPS433
+
+        self._brotli = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Return the compressed chunk."""
+        return self._brotli.process(chunk) + self._brotli.flush()
+
+    def finish(self) -> bytes:
+        """Return the end of the stream."""
+        return self._brotli.finish()
+
+
+class ZstdEncoder(object):
+    """Zstandard stream, needs the zstandard package."""
+
+    def __init__(self) -> None:
+        """Start a frame at COMPRESSION_ZSTD_LEVEL."""
+        import zstandard  # type: ignore [import]  # noqa: WPS433
+
+        compressor = zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL)
+        self._block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._zstd = compressor.compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Return the compressed chunk."""
+        return self._zstd.compress(chunk) + self._zstd.flush(self._block)
+
+    def finish(self) -> bytes:
+        """Return the end of the stream."""
+        return self._zstd.flush()
+
+
+Encoder = Union[GzipEncoder, BrotliEncoder, ZstdEncoder]
+
+# content coding -> encoder
+ENCODERS: Dict[str, Callable[[], Encoder]] = {  # noqa: WPS407
+    "gzip": GzipEncoder,
+    "br": BrotliEncoder,
+    "zstd": ZstdEncoder,
+}
+
+# content coding -> optional package its encoder imports
+PACKAGES = {"br": "brotli", "zstd": "zstandard"}  # noqa: WPS407
+
+
+def available_codings(preference: Sequence[str]) -> List[str]:
+    """Return the known codings of `preference` whose package is installed.
+
+    Args:
+        preference (Sequence[str]): content codings, preferred first
+
+    Returns:
+        List[str]: the codings that can be sent, in the same order
+    """
+    return [coding for coding in preference if _installed(coding)]
+
+
+def _installed(coding: str) -> bool:
+    if coding not in ENCODERS:
+        return False
+    package = PACKAGES.get(coding)
+    return package is None or find_spec(package) is not None
@@ -1,12 +1,12 @@
+import re
 import secrets
-from os import getenv
+from os import cpu_count
 from typing import Any, Dict, Optional
 
-from dotenv import load_dotenv
 from pydantic import AnyHttpUrl, BaseSettings, EmailStr, validator
 from pydantic.tools import parse_obj_as
 
-load_dotenv()  # take environment variables from .env.
+from app.constants import KUNDEFINED
 
 KSECRETLEN = 32
 
@@ -17,25 +17,155 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     SECRET_KEY: str = secrets.token_urlsafe(KSECRETLEN)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
-    SERVER_NAME: Optional[str] = getenv("SERVER_NAME", "example.com")
-    SERVER_HOST: Optional[AnyHttpUrl] = parse_obj_as(
-        AnyHttpUrl,
-        getenv("SERVER_HOST", "http://example.com"),
-    )
+    SERVER_NAME: Optional[str] = "example.com"
+    SERVER_HOST: Optional[AnyHttpUrl] = parse_obj_as(AnyHttpUrl, "http://example.com")
 
     PROJECT_NAME: str = "banned"
 
+    # gunicorn settings of app.server
+    WEB_BIND: str = "0.0.0.0:5000"  # noqa: S104
+    # the workers keep their ban index and recent reports current from the
+    # item events of EVENTS_BUS; the local bus only carries a worker's own
+    WEB_CONCURRENCY: int = cpu_count() or 1
+    WEB_GRACEFUL_TIMEOUT: int = 30
+    WEB_KEEPALIVE: int = 5
+
+    DB_CONNECTION: str = KUNDEFINED
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: float = 30
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    DB_SQLITE_WAL: bool = True
+    DB_SQLITE_SYNCHRONOUS: str = "NORMAL"
+    DB_SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
+    # bcrypt processes of each web worker, unset shares the CPUs between the
+    # WEB_CONCURRENCY workers, 0 hashes on the event loop's thread pool
+    HASH_WORKERS: Optional[int] = None
+    HASH_QUEUE_DEPTH: int = 64
+    HASH_RETRY_AFTER_SECONDS: int = 1
+
+    AUTH_CACHE_SIZE: int = 4096
+    AUTH_TOKEN_CACHE_SECONDS: int = 300
+    AUTH_USER_CACHE_SECONDS: int = 30
+
+    # "jose" or "pyjwt" (the pyjwt extra), EdDSA needs pyjwt
+    TOKEN_BACKEND: str = "jose"
+    TOKEN_ALGORITHM: str = "HS256"
+    # PEM text or path, only read for asymmetric algorithms; replicas that
+    # only verify tokens leave the private key unset
+    TOKEN_PRIVATE_KEY: Optional[str] = None
+    TOKEN_PUBLIC_KEY: Optional[str] = None
+
+    # request latency and SQL histograms served at /metrics
+    METRICS_ENABLED: bool = True
+
+    # serialise list responses from column tuples with orjson
+    FAST_JSON_RESPONSES: bool = False
+
+    ITEMS_BULK_MAX: int = 10000
+    # bulk bodies are refused above ITEMS_BULK_MAX rows of this many bytes
+    ITEMS_BULK_ROW_BYTES: int = 1024
+    ITEMS_BULK_CHUNK: int = 1000
+    # repeats of a report within this many seconds are counted by an UPDATE
+    # of the remembered row id, 0 sends every report through the upsert
+    ITEMS_RECENT_SECONDS: float = 5
+    ITEMS_RECENT_SIZE: int = 10000
+
+    # False answers POST /items/ with 202 once the item is queued and
+    # commits it with others in a batch; queued items are lost on a crash
+    # and their receipts are only known to the worker that queued them
+    ITEMS_DURABLE_WRITES: bool = True
+    ITEMS_INGEST_QUEUE_SIZE: int = 10000
+    ITEMS_INGEST_BATCH: int = 500
+    ITEMS_INGEST_FLUSH_SECONDS: float = 0.05
+    ITEMS_INGEST_RECEIPT_SECONDS: int = 300
+
+    # expired items are deleted ITEMS_REAP_BATCH rows per transaction, at
+    # most ITEMS_REAP_ROWS_PER_SECOND (0 for no limit), then again after the
+    # interval; an interval of 0 disables the reaper
+    ITEMS_REAP_INTERVAL_SECONDS: float = 60
+    ITEMS_REAP_BATCH: int = 500
+    ITEMS_REAP_ROWS_PER_SECOND: float = 5000
+
+    # the change feed only serves entries older than the settle delay, so
+    # that a transaction committing after a newer one is not skipped
+    ITEMS_CHANGES_SETTLE_SECONDS: float = 1
+    ITEMS_CHANGES_LIMIT: int = 1000
+    # the reaper compacts superseded entries and deletions older than this,
+    # consumers that fall further behind list the items again
+    ITEMS_CHANGES_RETENTION_SECONDS: int = 604800
+
+    # item writes pushed to the /items/stream subscribers and the caches of
+    # the workers; "postgres" relays them between the workers with
+    # LISTEN/NOTIFY on EVENTS_CHANNEL, "local" only reaches the same process;
+    # unset picks "postgres" for a Postgres DB_CONNECTION
+    EVENTS_BUS: Optional[str] = None
+    EVENTS_CHANNEL: str = "item_events"
+    # a stream falling this many events behind is closed
+    EVENTS_BUFFER: int = 1000
+    EVENTS_HEARTBEAT_SECONDS: float = 15
+    # events waiting for the postgres bus's sender before new ones are dropped
+    EVENTS_QUEUE_SIZE: int = 10000
+
+    # bodies of at least COMPRESSION_MINIMUM_SIZE bytes, and streamed ones
+    # except server-sent events, are compressed with the first coding of
+    # COMPRESSION_CODINGS the client accepts; "br" and "zstd" are skipped
+    # unless the brotli and zstandard packages are installed
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_CODINGS: str = "zstd,br,gzip"
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    XKCD_BASE_URL: str = "https://xkcd.com"
+    XKCD_TIMEOUT_SECONDS: float = 5
+    XKCD_CACHE_SECONDS: int = 300
+    XKCD_MAX_CONNECTIONS: int = 10
+
     SMTP_TLS: bool = True
     SMTP_PORT: Optional[int] = None
     SMTP_HOST: Optional[str] = None
     SMTP_USER: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
+    SMTP_TIMEOUT_SECONDS: float = 10
+    # SMTP connections kept open by the background mailer
+    SMTP_POOL_SIZE: int = 2
+    EMAIL_BATCH: int = 50
+    EMAIL_QUEUE_SIZE: int = 1000
     EMAILS_FROM_EMAIL: Optional[EmailStr] = None
     EMAILS_FROM_NAME: Optional[str] = None
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48
     EMAIL_TEMPLATES_DIR: str = "/banned/app/email-template/build"
     EMAILS_ENABLED: bool = False
 
+    @validator("HASH_WORKERS", always=True)
+    def get_hash_workers(
+        cls,  # noqa: N805
+        value: Optional[int],
+        values: Dict[str, Any],
+    ) -> int:
+        """Return the hashing processes of a worker, its share of the CPUs."""
+        if value is not None:
+            return value
+        web_workers = max(1, values.get("WEB_CONCURRENCY") or 1)
+        return max(1, (cpu_count() or 1) // web_workers)
+
+    @validator("EVENTS_BUS", always=True)
+    def get_events_bus(
+        cls,  # noqa: N805
+        value: Optional[str],
+        values: Dict[str, Any],
+    ) -> str:
+        """Return the bus of the item events, shared by Postgres deployments."""
+        if value:
+            return value
+        if re.match("postgres", values.get("DB_CONNECTION") or ""):
+            return "postgres"
+        return "local"
+
     @validator("EMAILS_FROM_NAME")
     def get_project_name(
         cls,  # noqa: N805
@@ -61,14 +191,14 @@ class Settings(BaseSettings):
         return False
 
     EMAIL_TEST_USER: EmailStr = EmailStr("test@example.com")
-    FIRST_SUPERUSER: EmailStr = EmailStr(
-        getenv("FIRST_SUPERUSER", "admin@example.com"),
-    )
-    FIRST_SUPERUSER_PASSWORD: str = getenv("FIRST_SUPERUSER_PASSWORD", "password")
+    FIRST_SUPERUSER: EmailStr = EmailStr("admin@example.com")
+    FIRST_SUPERUSER_PASSWORD: str = "password"
     USERS_OPEN_REGISTRATION: bool = False
 
     class Config:  # noqa: WPS306
         case_sensitive = True
+        # read by pydantic, the process environment takes precedence
+        env_file = ".env"
 
 
 settings = Settings()
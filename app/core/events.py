@@ -0,0 +1,140 @@
+"""Item events and their fan-out to the stream subscribers of a process."""
+import asyncio
+import json
+import logging
+from typing import Callable, NamedTuple, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+KUPSERT = "upsert"
+KDELETE = "delete"
+
+
+class Event(NamedTuple):
+    """An item write, `text` is its JSON, encoded once for every reader."""
+
+    kind: str
+    owner_id: int
+    text: str
+
+    @classmethod
+    def from_text(cls, text: str) -> "Event":
+        """Return the event of a JSON text received from the bus."""
+        payload = json.loads(text)
+        return cls(kind=payload["event"], owner_id=payload["owner_id"], text=text)
+
+
+Deliver = Callable[[Sequence[Event]], None]
+
+
+class Subscription(object):
+    """The events waiting for one stream, at most `buffer` of them.
+
+    A subscriber that falls `buffer` events behind is closed: its backlog
+    is dropped and `get` answers None, the stream then tells its client
+    to catch up from the change feed.
+    """
+
+    def __init__(self, buffer: int, owner_id: Optional[int]) -> None:
+        """Create an open subscription.
+
+        Args:
+            buffer (int): largest number of waiting events
+            owner_id (Optional[int]): only events of this owner when given
+        """
+        self.owner_id = owner_id
+        self.closed = False
+        # one more slot for the end of stream marker
+        self._queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(buffer + 1)
+        self._buffer = buffer
+
+    def wants(self, event: Event) -> bool:
+        """Tell whether the event is for this subscriber."""
+        return self.owner_id is None or self.owner_id == event.owner_id
+
+    def offer(self, event: Event) -> bool:
+        """Queue the event, closing the subscription when it is full.
+
+        Args:
+            event (Event): item event
+
+        Returns:
+            bool: False when the subscription is closed
+        """
+        if self.closed:
+            return False
+        if self._queue.qsize() >= self._buffer:
+            self.close()
+            return False
+        self._queue.put_nowait(event)
+        return True
+
+    def close(self) -> None:
+        """Drop the waiting events and end the stream."""
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def get(self) -> Optional[Event]:
+        """Wait for the next event, None once the subscription is closed."""
+        return await self._queue.get()
+
+
+class Fanout(object):
+    """The open subscriptions of the process.
+
+    Events are offered to the matching subscriptions without ever waiting
+    on a slow one, which is closed instead.
+    """
+
+    def __init__(self, buffer: int) -> None:
+        """Create a fan-out without subscriptions.
+
+        Args:
+            buffer (int): events a subscriber may fall behind before it is closed
+        """
+        self.buffer = buffer
+        self._subscriptions: Set[Subscription] = set()
+
+    def __len__(self) -> int:
+        """Return the number of open subscriptions."""
+        return len(self._subscriptions)
+
+    def subscribe(self, owner_id: Optional[int] = None) -> Subscription:
+        """Open a subscription to the events, of one owner when given."""
+        subscription = Subscription(self.buffer, owner_id)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Close the subscription and forget it."""
+        subscription.close()
+        self._subscriptions.discard(subscription)
+
+    def deliver(self, events: Sequence[Event]) -> None:
+        """Offer the events to the subscriptions of this process."""
+        closed = [
+            subscription
+            for subscription in self._subscriptions
+            if not _offer(subscription, events)
+        ]
+        for slow in closed:
+            logger.info("closed an item event stream that fell behind")
+            self._subscriptions.discard(slow)
+
+    def close_all(self) -> None:
+        """End every stream."""
+        for subscription in list(self._subscriptions):
+            subscription.close()
+        self._subscriptions.clear()
+
+
+def _offer(subscription: Subscription, events: Sequence[Event]) -> bool:
+    # False once the subscription is closed
+    for event in events:
+        if subscription.wants(event) and not subscription.offer(event):
+            return False
+    return True
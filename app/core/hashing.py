@@ -0,0 +1,111 @@
+"""Password hashing offloaded from the event loop to a bounded executor."""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core import security
+from app.core.config import settings
+
+ResultType = TypeVar("ResultType")
+
+
+class HashingBusyError(Exception):
+    """Raised when the hashing queue is full."""
+
+    def __init__(self, retry_after: int) -> None:
+        """Remember how long the client should back off.
+
+        Args:
+            retry_after (int): seconds to wait before retrying
+        """
+        super().__init__("password hashing queue is full")
+        self.retry_after = retry_after
+
+
+class HashingService(object):
+    """Run bcrypt hashing and verification on a dedicated process pool.
+
+    At most `workers + queue_depth` jobs are admitted at once, further
+    calls fail fast with `HashingBusyError` instead of piling up behind
+    a login storm. With `workers` set to 0 the jobs run on the event
+    loop's default thread pool, which keeps them off the loop but inside
+    the current process.
+    """
+
+    def __init__(self, workers: int, queue_depth: int, retry_after: int) -> None:
+        """Configure the service, the pool itself is started on first use.
+
+        Args:
+            workers (int): number of hashing processes
+            queue_depth (int): number of jobs allowed to wait for a worker
+            retry_after (int): Retry-After seconds reported when busy
+        """
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+        self.pending = 0
+        self._executor: Optional[Executor] = None
+
+    async def hash(self, password: str) -> str:  # noqa: WPS125
+        """Return the hash of the password.
+
+        Args:
+            password (str): password to hash
+
+        Returns:
+            str: hash of the password
+        """
+        return await self._run(security.get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password.
+
+        Args:
+            plain_password (str): password received from the client
+            hashed_password (str): stored password hash
+
+        Returns:
+            bool: True if the password matches the hash
+        """
+        return await self._run(
+            security.verify_password,
+            plain_password,
+            hashed_password,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(
+        self,
+        func: Callable[..., ResultType],
+        *args: Any,
+    ) -> ResultType:
+        if self.pending >= self.workers + self.queue_depth:
+            raise HashingBusyError(self.retry_after)
+        self.pending += 1
+        try:  # noqa: WPS501
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.pending -= 1
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.workers and self._executor is None:
+            # forking a process running threads and an event loop is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context("spawn"),
+            )
+        return self._executor
+
+
+hasher = HashingService(
+    workers=settings.HASH_WORKERS or 0,
+    queue_depth=settings.HASH_QUEUE_DEPTH,
+    retry_after=settings.HASH_RETRY_AFTER_SECONDS,
+)
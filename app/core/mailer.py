@@ -0,0 +1,224 @@
+"""Background email delivery over reused SMTP connections."""
+import asyncio
+import logging
+import smtplib
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+logger = logging.getLogger(__name__)
+
+KTEMPLATES = ("test_email.html", "reset_password.html", "new_account.html")
+
+
+class SmtpOptions(NamedTuple):
+    """Where and how to submit messages."""
+
+    host: str
+    port: int
+    tls: bool
+    user: Optional[str]
+    password: Optional[str]
+    timeout: float
+
+
+class SmtpConnection(object):
+    """One SMTP session, opened on first use and kept for later batches.
+
+    Its methods block, the mailer calls them from the default executor.
+    """
+
+    def __init__(self, options: SmtpOptions) -> None:
+        """Remember the options, nothing is connected yet.
+
+        Args:
+            options (SmtpOptions): server and credentials
+        """
+        self.options = options
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def send(self, messages: List[EmailMessage]) -> int:
+        """Submit the messages, reconnecting once if the server hung up.
+
+        Args:
+            messages (List[EmailMessage]): messages to submit
+
+        Returns:
+            int: number of messages the server refused
+        """
+        refused = 0
+        for message in messages:
+            try:
+                self._submit(message)
+            except (smtplib.SMTPException, OSError):
+                logger.exception("could not send email to {0}".format(message["To"]))
+                self.close()
+                refused += 1
+        return refused
+
+    def close(self) -> None:
+        """End the session, if any."""
+        smtp = self._smtp
+        self._smtp = None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
+    def _submit(self, message: EmailMessage) -> None:
+        try:
+            self._connected().send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            self._connected().send_message(message)
+
+    def _connected(self) -> smtplib.SMTP:
+        if self._smtp is None:
+            options = self.options
+            smtp = smtplib.SMTP(options.host, options.port, timeout=options.timeout)
+            if options.tls:
+                smtp.starttls()
+            if options.user:
+                smtp.login(options.user, options.password or "")
+            self._smtp = smtp
+        return self._smtp
+
+
+class Mailer(object):
+    """Render templated emails and deliver them from background workers.
+
+    Templates are compiled once by `start`. Queued messages are picked
+    up by `workers` tasks, each owning one SMTP connection and submitting
+    up to `batch_size` waiting messages per session round trip, so a
+    request only pays for rendering and enqueueing.
+    """
+
+    def __init__(self, workers: int, batch_size: int, queue_size: int) -> None:
+        """Configure the mailer, the workers are started by `start`.
+
+        Args:
+            workers (int): number of SMTP connections
+            batch_size (int): messages handed to a connection at once
+            queue_size (int): messages allowed to wait for delivery
+        """
+        self.workers = workers
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.templates: Dict[str, "Template"] = {}
+        self._queue: Optional["asyncio.Queue[EmailMessage]"] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    def start(self) -> None:
+        """Compile the templates and start the workers, from the event loop."""
+        from jinja2 import (  # noqa: WPS433
+            Environment,
+            FileSystemLoader,
+            select_autoescape,
+        )
+
+        environment = Environment(
+            loader=FileSystemLoader(settings.EMAIL_TEMPLATES_DIR),
+            autoescape=select_autoescape(),
+        )
+        self.templates = {name: environment.get_template(name) for name in KTEMPLATES}
+        options = SmtpOptions(
+            host=settings.SMTP_HOST or "localhost",
+            port=settings.SMTP_PORT or 0,
+            tls=settings.SMTP_TLS,
+            user=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
+        )
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [
+            asyncio.create_task(self._work(self._queue, SmtpConnection(options)))
+            for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop accepting messages, deliver the queued ones and disconnect."""
+        queue, tasks = self._queue, self._tasks
+        self._queue = None
+        self._tasks = []
+        if queue is None:
+            return
+        await queue.join()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def send(
+        self,
+        email_to: str,
+        subject: str,
+        template: str,
+        environment: Dict[str, Any],
+    ) -> bool:
+        """Render a message and queue it for delivery.
+
+        Args:
+            email_to (str): recipient
+            subject (str): subject line
+            template (str): name of a compiled template
+            environment (Dict[str, Any]): template variables
+
+        Returns:
+            bool: False when the mailer is stopped or its queue is full
+        """
+        if self._queue is None:
+            return False
+        message = EmailMessage()
+        message["Subject"] = subject
+        message["From"] = formataddr(
+            (settings.EMAILS_FROM_NAME, str(settings.EMAILS_FROM_EMAIL)),
+        )
+        message["To"] = email_to
+        message.set_content(
+            self.templates[template].render(environment),
+            subtype="html",
+        )
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _work(
+        self,
+        queue: "asyncio.Queue[EmailMessage]",
+        connection: SmtpConnection,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:  # noqa: WPS501
+            while True:  # noqa: WPS457
+                await self._deliver_batch(queue, connection)
+        finally:
+            await loop.run_in_executor(None, connection.close)
+
+    async def _deliver_batch(
+        self,
+        queue: "asyncio.Queue[EmailMessage]",
+        connection: SmtpConnection,
+    ) -> None:
+        batch = [await queue.get()]
+        while len(batch) < self.batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+        loop = asyncio.get_running_loop()
+        try:  # noqa: WPS501
+            await loop.run_in_executor(None, connection.send, batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+mailer = Mailer(
+    workers=settings.SMTP_POOL_SIZE,
+    batch_size=settings.EMAIL_BATCH,
+    queue_size=settings.EMAIL_QUEUE_SIZE,
+)
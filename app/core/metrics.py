@@ -0,0 +1,200 @@
+"""In-process request and database metrics in the Prometheus text format."""
+from bisect import bisect_left
+from contextvars import ContextVar
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+
+KLATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+KQUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+# RouteStats attribute, metric name, help
+ROUTE_HISTOGRAMS = (  # noqa: WPS407
+    (
+        "latency",
+        "http_request_duration_seconds",
+        "Time from request start to the end of the response.",
+    ),
+    ("queries", "http_request_queries", "SQL statements per request."),
+    ("sql", "http_request_sql_seconds", "Time spent in SQL per request."),
+)
+
+
+class Histogram(object):
+    """Cumulative histogram with fixed upper bounds.
+
+    Observations only increment preallocated counters, nothing is locked:
+    the event loop is single threaded and a lost increment from a thread
+    pool race is acceptable for monitoring.
+    """
+
+    __slots__ = ("buckets", "bounds", "counts", "total")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Create an empty histogram.
+
+        Args:
+            buckets (Sequence[float]): sorted upper bounds, +Inf is implied
+        """
+        self.buckets = tuple(buckets)
+        self.bounds = [*self.buckets, "+Inf"]
+        self.counts = [0 for _ in range(len(self.buckets) + 1)]
+        self.total: float = 0
+
+    def observe(self, amount: float) -> None:
+        """Record one observation.
+
+        Args:
+            amount (float): observed value
+        """
+        self.counts[bisect_left(self.buckets, amount)] += 1
+        self.total += amount
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        """Return the exposition lines of the histogram.
+
+        Args:
+            name (str): metric name
+            labels (str): rendered labels, without braces, may be empty
+
+        Returns:
+            List[str]: bucket, sum and count sample lines
+        """
+        prefix = "{0},".format(labels) if labels else ""
+        lines = [
+            '{0}_bucket{{{1}le="{2}"}} {3}'.format(name, prefix, bound, cumulative)
+            for bound, cumulative in zip(self.bounds, accumulate(self.counts))
+        ]
+        braces = "{{{0}}}".format(labels) if labels else ""
+        lines.append("{0}_sum{1} {2}".format(name, braces, self.total))
+        lines.append("{0}_count{1} {2}".format(name, braces, sum(self.counts)))
+        return lines
+
+
+class RequestStats(object):
+    """Database work done while serving the current request."""
+
+    __slots__ = ("queries", "sql_seconds")
+
+    def __init__(self) -> None:
+        """Start with no queries."""
+        self.queries = 0
+        self.sql_seconds: float = 0
+
+
+class RouteStats(object):
+    """Histograms of one route, labels are rendered once at creation."""
+
+    __slots__ = ("labels", "latency", "queries", "sql")
+
+    def __init__(self, method: str, route: str) -> None:
+        """Create the histograms of a route.
+
+        Args:
+            method (str): HTTP method
+            route (str): path template of the route
+        """
+        self.labels = 'method="{0}",route="{1}"'.format(method, route)
+        self.latency = Histogram(KLATENCY_BUCKETS)
+        self.queries = Histogram(KQUERY_BUCKETS)
+        self.sql = Histogram(KLATENCY_BUCKETS)
+
+    def observe(self, elapsed: float, request: RequestStats) -> None:
+        """Record a finished request.
+
+        Args:
+            elapsed (float): seconds between request start and response end
+            request (RequestStats): database work of the request
+        """
+        self.latency.observe(elapsed)
+        self.queries.observe(request.queries)
+        self.sql.observe(request.sql_seconds)
+
+
+class MetricsRegistry(object):
+    """Route histograms plus the histogram of every SQL statement."""
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self.statements = Histogram(KLATENCY_BUCKETS)
+        self._routes: Dict[Tuple[str, str], RouteStats] = {}
+
+    def route(self, method: str, route: str) -> RouteStats:
+        """Return the statistics of a route, created on first use.
+
+        Args:
+            method (str): HTTP method
+            route (str): path template of the route
+
+        Returns:
+            RouteStats: the route's histograms
+        """
+        key = (method, route)
+        stats = self._routes.get(key)
+        if stats is None:
+            stats = RouteStats(method, route)
+            self._routes[key] = stats
+        return stats
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of every histogram.
+
+        Returns:
+            List[str]: lines in the Prometheus text format
+        """
+        lines: List[str] = []
+        for attribute, name, description in ROUTE_HISTOGRAMS:
+            lines.extend(header(name, description))
+            lines.extend(self._route_samples(attribute, name))
+        lines.extend(header("db_statement_seconds", "Duration of SQL statements."))
+        lines.extend(self.statements.samples("db_statement_seconds", ""))
+        return lines
+
+    def _route_samples(self, attribute: str, name: str) -> List[str]:
+        samples: List[str] = []
+        for route_stats in list(self._routes.values()):
+            histogram = getattr(route_stats, attribute)
+            samples.extend(histogram.samples(name, route_stats.labels))
+        return samples
+
+
+current_request: ContextVar[Optional[RequestStats]] = ContextVar(
+    "current_request",
+    default=None,
+)
+
+
+def record_statement(elapsed: float) -> None:
+    """Account for an executed SQL statement.
+
+    Args:
+        elapsed (float): seconds the statement took
+    """
+    registry.statements.observe(elapsed)
+    request = current_request.get()
+    if request is not None:
+        request.queries += 1
+        request.sql_seconds += elapsed
+
+
+def header(name: str, description: str, kind: str = "histogram") -> List[str]:
+    """Return the HELP and TYPE lines of a metric."""
+    return [
+        "# HELP {0} {1}".format(name, description),
+        "# TYPE {0} {1}".format(name, kind),
+    ]
+
+
+registry = MetricsRegistry()
@@ -1,14 +1,20 @@
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
-
-from jose import jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from app.core.config import settings
+from app.core.tokens import token_service
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=None)
+def pwd_context() -> "CryptContext":
+    """Return the password hashing context, passlib is loaded on first use."""
+    from passlib.context import CryptContext  # noqa: WPS433, WPS442
 
-ALGORITHM = "HS256"
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def create_access_token(
@@ -23,12 +29,12 @@ def create_access_token(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
         )
     to_encode = {"exp": expire, "sub": str(subject)}
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
+    return token_service().encode(to_encode)
 
 
 def verify_password(plain_password, hashed_password) -> bool:
     """Verify password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password) -> str:
@@ -40,4 +46,4 @@ def get_password_hash(password) -> str:
     Returns:
         str: hash of the password
     """
-    return pwd_context.hash(password)
+    return pwd_context().hash(password)
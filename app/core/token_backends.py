@@ -0,0 +1,117 @@
+"""JWT libraries behind one signing and verification contract."""
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Type
+
+Claims = Dict[str, Any]
+
+
+class TokenError(Exception):
+    """Raised when a token cannot be issued or does not verify."""
+
+
+class TokenBackend(ABC):
+    """Signing and verification shared by the JWT libraries.
+
+    Both libraries expose `encode(claims, key, algorithm=...)` and
+    `decode(token, key, algorithms=[...])`; a backend hands over its jwt
+    module and base error, and parses keys its own way.
+    """
+
+    def __init__(self, jwt: Any, error: Type[Exception]) -> None:
+        """Keep the jwt module of the library.
+
+        Args:
+            jwt (Any): the library's jwt module
+            error (Type[Exception]): base class of the library's errors
+        """
+        self._jwt = jwt
+        self._error = error
+
+    @abstractmethod
+    def prepare_key(self, key: str, algorithm: str) -> Any:
+        """Return the key parsed for the algorithm.
+
+        Args:
+            key (str): shared secret or PEM key
+            algorithm (str): JWS algorithm
+
+        Returns:
+            Any: the key object the backend signs or verifies with
+        """
+
+    def encode(self, claims: Claims, key: Any, algorithm: str) -> str:
+        """Return the signed token of the claims.
+
+        Args:
+            claims (Claims): token claims
+            key (Any): prepared signing key
+            algorithm (str): JWS algorithm
+
+        Raises:
+            TokenError: if signing fails
+
+        Returns:
+            str: compact JWS
+        """
+        try:
+            return self._jwt.encode(claims, key, algorithm=algorithm)
+        except self._error as exc:
+            raise TokenError(str(exc)) from exc
+
+    def decode(self, token: str, key: Any, algorithm: str) -> Claims:
+        """Return the claims of a token whose signature and dates are valid.
+
+        Args:
+            token (str): compact JWS
+            key (Any): prepared verification key
+            algorithm (str): the only accepted JWS algorithm
+
+        Raises:
+            TokenError: if the token does not verify
+
+        Returns:
+            Claims: token claims
+        """
+        try:
+            return self._jwt.decode(token, key, algorithms=[algorithm])
+        except self._error as exc:
+            raise TokenError(str(exc)) from exc
+
+
+class JoseBackend(TokenBackend):
+    """python-jose, pure Python apart from the asymmetric primitives."""
+
+    def __init__(self) -> None:
+        """Import python-jose, only the configured backend gets loaded."""
+        from jose import exceptions, jwk, jwt  # noqa: WPS433
+
+        super().__init__(jwt, exceptions.JOSEError)
+        self._jwk = jwk
+
+    def prepare_key(self, key: str, algorithm: str) -> Any:  # noqa: D102
+        return self._jwk.construct(key, algorithm)
+
+
+class PyJWTBackend(TokenBackend):
+    """PyJWT, HMAC through the C hashlib and EdDSA support."""
+
+    def __init__(self) -> None:
+        """Import PyJWT, the optional dependency.
+
+        Raises:
+            TokenError: if PyJWT is missing
+        """
+        try:
+            import jwt  # noqa: WPS433
+        except ImportError as exc:  # pragma: no cover
+            raise TokenError("TOKEN_BACKEND=pyjwt needs the pyjwt extra") from exc
+        super().__init__(jwt, jwt.PyJWTError)
+
+    def prepare_key(self, key: str, algorithm: str) -> Any:  # noqa: D102
+        return self._jwt.get_algorithm_by_name(algorithm).prepare_key(key)
+
+
+BACKENDS: Dict[str, Callable[[], TokenBackend]] = {  # noqa: WPS407
+    "jose": JoseBackend,
+    "pyjwt": PyJWTBackend,
+}
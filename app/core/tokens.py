@@ -0,0 +1,117 @@
+"""JWT signing and verification with key material prepared once."""
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+from app.core.token_backends import BACKENDS, Claims, TokenBackend, TokenError
+
+KPEM_PREFIX = "-----BEGIN"
+
+
+class TokenService(object):
+    """Sign and verify tokens with one algorithm and pre-parsed keys.
+
+    A service built without a signing key verifies only, which is how
+    read replicas holding just the public half of an EdDSA or ES256 key
+    pair are configured.
+    """
+
+    def __init__(
+        self,
+        backend: TokenBackend,
+        algorithm: str,
+        verify_key: str,
+        signing_key: Optional[str] = None,
+    ) -> None:
+        """Parse the keys for the algorithm.
+
+        Args:
+            backend (TokenBackend): JWT implementation
+            algorithm (str): JWS algorithm
+            verify_key (str): shared secret or public key
+            signing_key (Optional[str]): shared secret or private key
+        """
+        self.backend = backend
+        self.algorithm = algorithm
+        self._verify_key = backend.prepare_key(verify_key, algorithm)
+        self._signing_key = None
+        if signing_key is not None:
+            self._signing_key = backend.prepare_key(signing_key, algorithm)
+
+    @property
+    def can_sign(self) -> bool:
+        """Tell whether the service holds a signing key."""
+        return self._signing_key is not None
+
+    def encode(self, claims: Claims) -> str:
+        """Return the signed token of the claims.
+
+        Args:
+            claims (Claims): token claims
+
+        Raises:
+            TokenError: if the service verifies only
+
+        Returns:
+            str: compact JWS
+        """
+        if self._signing_key is None:
+            raise TokenError("this instance only verifies tokens")
+        return self.backend.encode(claims, self._signing_key, self.algorithm)
+
+    def decode(self, token: str) -> Claims:
+        """Return the claims of a valid token.
+
+        Args:
+            token (str): compact JWS
+
+        Returns:
+            Claims: token claims
+        """
+        return self.backend.decode(token, self._verify_key, self.algorithm)
+
+
+def service_from_settings() -> TokenService:
+    """Build the token service from the TOKEN_* settings.
+
+    HMAC algorithms sign and verify with SECRET_KEY. Other algorithms
+    verify with TOKEN_PUBLIC_KEY and sign with TOKEN_PRIVATE_KEY when it
+    is set; both take a PEM key or the path of a PEM file.
+
+    Raises:
+        TokenError: if an asymmetric algorithm has no public key
+
+    Returns:
+        TokenService: the configured service
+    """
+    backend = BACKENDS[settings.TOKEN_BACKEND]()
+    algorithm = settings.TOKEN_ALGORITHM
+    if algorithm.startswith("HS"):
+        secret = settings.SECRET_KEY
+        return TokenService(backend, algorithm, secret, secret)
+    if not settings.TOKEN_PUBLIC_KEY:
+        raise TokenError("{0} needs TOKEN_PUBLIC_KEY".format(algorithm))
+    private_key = settings.TOKEN_PRIVATE_KEY
+    return TokenService(
+        backend,
+        algorithm,
+        _read_key(settings.TOKEN_PUBLIC_KEY),
+        _read_key(private_key) if private_key else None,
+    )
+
+
+def _read_key(pem_or_path: str) -> str:
+    if pem_or_path.lstrip().startswith(KPEM_PREFIX):
+        return pem_or_path
+    return Path(pem_or_path).read_text()
+
+
+@lru_cache(maxsize=None)
+def token_service() -> TokenService:
+    """Return the service of the settings, built on first use.
+
+    Returns:
+        TokenService: the configured service
+    """
+    return service_from_settings()
@@ -0,0 +1,107 @@
+"""Pooled, cached asyncio client for the xkcd JSON api."""
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from app.core.cache import TTLCache
+
+if TYPE_CHECKING:
+    import httpx
+
+Payload = Dict[str, Any]
+
+KCURRENT = 0
+
+
+class XkcdClient(object):
+    """Fetch comic metadata over a shared connection pool.
+
+    Responses are cached per comic id and concurrent misses for the same
+    comic share a single upstream request. httpx is imported and the pool
+    opened by the first request, not at application startup.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        base_url: str,
+        timeout: float,
+        cache_ttl: float,
+        max_connections: int = 10,
+        cache_size: int = 512,
+    ) -> None:
+        """Configure the client, requests are allowed by `start`.
+
+        Args:
+            base_url (str): xkcd base url
+            timeout (float): connect/read/write/pool timeout in seconds
+            cache_ttl (float): seconds a comic stays cached
+            max_connections (int): size of the connection pool
+            cache_size (int): number of comics kept in the cache
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.cache: TTLCache[int, Payload] = TTLCache(
+            maxsize=cache_size,
+            ttl=cache_ttl,
+        )
+        self._inflight: Dict[int, "asyncio.Future[Payload]"] = {}
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._started = False
+
+    async def start(self) -> None:
+        """Allow requests, the first one opens the connection pool."""
+        self._started = True
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        self._started = False
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def comic(self, comic_id: Optional[int] = None) -> Payload:
+        """Return the metadata of a comic, the current one by default.
+
+        Args:
+            comic_id (Optional[int]): comic number
+
+        Raises:
+            httpx.HTTPError: if the upstream request fails
+
+        Returns:
+            Payload: decoded upstream JSON
+        """
+        key = comic_id or KCURRENT
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch(key))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    async def _fetch(self, key: int) -> Payload:
+        path = "/info.0.json" if key == KCURRENT else "/{0}/info.0.json".format(key)
+        response = await self._connected().get(path)
+        response.raise_for_status()
+        payload = response.json()
+        self.cache.set(key, payload)
+        return payload
+
+    def _connected(self) -> "httpx.AsyncClient":
+        if not self._started:
+            raise RuntimeError("XkcdClient.start() has not been awaited")
+        if self._client is None:
+            import httpx  # noqa: WPS433, WPS442
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
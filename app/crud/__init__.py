@@ -1,2 +1,3 @@
-from .crud_item import citem  # noqa: WPS300, F401
-from .crud_user import user  # noqa: WPS300, F401
+from .crud_item import acitem, citem  # noqa: WPS300, F401
+from .crud_item_change import achange  # noqa: WPS300, F401
+from .crud_user import auser, user  # noqa: WPS300, F401
@@ -1,47 +1,106 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
-from app.db.database import Base
+from app.crud.reads import AsyncReadBase, ModelType, ReadBase
+from app.crud.returning import (
+    delete_returning,
+    insert_returning,
+    select_refreshed,
+    supports_returning,
+    update_returning,
+    upsert_returning,
+)
+
+if TYPE_CHECKING:
+    from app.crud.returning import UpsertInsert
 
-ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+KINSERT = "insert"
+KVERSION = "version"
 
-class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
-    """Base class for CRUD."""
 
-    def __init__(self, model: Type[ModelType]):
-        """
-        CRUD object with default methods to Create, Read, Update, Delete (CRUD).
+def changed_columns(
+    model: Type[ModelType],
+    obj_in: Union[BaseModel, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Return the column values set by update data.
 
-        **Parameters**
+    Args:
+        model (Type[ModelType]): model class
+        obj_in (Union[BaseModel, Dict[str, Any]]): update data
 
-        * `model`: A SQLAlchemy model class
-        * `schema`: A Pydantic model (schema) class
-        """
-        self.model = model
+    Returns:
+        Dict[str, Any]: new values keyed by column attribute
+    """
+    if isinstance(obj_in, dict):
+        update_data = obj_in
+    else:
+        update_data = obj_in.dict(exclude_unset=True)
+    columns = model.__table__.columns  # type: ignore [attr-defined]
+    return {field: update_data[field] for field in update_data if field in columns}
 
-    def get(self, db: Session, iid: Any) -> Optional[ModelType]:
-        """Returns query result."""
-        return (
-            db.query(self.model)
-            .filter(self.model.id == iid)  # type: ignore [attr-defined]
-            .first()
-        )
 
-    def get_multi(
-        self,
-        db: Session,
-        *,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> List[ModelType]:
-        """Returns query results."""
-        return db.query(self.model).offset(skip).limit(limit).all()
+def bumped(
+    model: Type[ModelType],
+    changes: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Return the update values, bumping the row version of versioned models.
+
+    Args:
+        model (Type[ModelType]): model class
+        changes (Dict[str, Any]): new values keyed by column attribute
+
+    Returns:
+        Dict[str, Any]: the values, with `version = version + 1` if it has one
+    """
+    if KVERSION not in model.__table__.columns:  # type: ignore [attr-defined]
+        return changes
+    return {**changes, KVERSION: getattr(model, KVERSION) + 1}
+
+
+def at_version(
+    model: Type[ModelType],
+    version: Optional[int],
+) -> List["ColumnElement[bool]"]:
+    """Return the condition that the row is still at `version`, if given."""
+    if version is None:
+        return []
+    return [getattr(model, KVERSION) == version]
+
+
+class CRUDBase(
+    ReadBase[ModelType],
+    Generic[ModelType, CreateSchemaType, UpdateSchemaType],
+):
+    """Base class for CRUD."""
+
+    def record(self, db: Session, db_obj: ModelType, deleted: bool = False) -> None:
+        """Add the change log entry of a write to its transaction.
+
+        Nothing is logged by default, models with a change feed log here.
+
+        Args:
+            db (Session): database session
+            db_obj (ModelType): written model object
+            deleted (bool): the write deleted the object
+        """
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """Create a crud item.
@@ -53,12 +112,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             ModelType: model item
         """
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self._insert(db, obj_in.dict())
 
     def update(
         self,
@@ -77,16 +131,23 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             ModelType: model object
         """
-        obj_data = jsonable_encoder(db_obj)
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data.get(field))
+        changes = changed_columns(self.model, obj_in)
+        if not changes:
+            return db_obj
+        changes = bumped(self.model, changes)
+        if supports_returning(db, "update"):
+            stmt = update_returning(
+                self.model,
+                db_obj.id,  # type: ignore [attr-defined]
+                changes,
+            )
+            db_obj = db.scalars(stmt).one()
+            self._commit(db, db_obj)
+            return db_obj
+        for field, field_value in changes.items():
+            setattr(db_obj, field, field_value)
         db.add(db_obj)
-        db.commit()
+        self._commit(db, db_obj)
         db.refresh(db_obj)
         return db_obj
 
@@ -100,7 +161,188 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             ModelType: database model type
         """
-        qobj = db.query(self.model).get(iid)
-        db.delete(qobj)
+        if supports_returning(db, "delete"):
+            db_obj = db.scalars(delete_returning(self.model, iid)).one()
+        else:
+            db_obj = db.get_one(self.model, iid)
+            db.delete(db_obj)
+        self._commit(db, db_obj, deleted=True)
+        return db_obj
+
+    def _commit(self, db: Session, db_obj: ModelType, deleted: bool = False) -> None:
+        """Log the write of the object and commit its transaction."""
+        self.record(db, db_obj, deleted)
         db.commit()
-        return cast(ModelType, qobj)
+
+    def _insert(self, db: Session, row: Dict[str, Any]) -> ModelType:
+        """Insert a row with a single INSERT ... RETURNING when supported."""
+        if supports_returning(db, KINSERT):
+            db_obj = db.scalars(insert_returning(self.model, row)).one()
+            self._commit(db, db_obj)
+            return db_obj
+        db_obj = self.model(**row)
+        db.add(db_obj)
+        db.flush()
+        self._commit(db, db_obj)
+        db.refresh(db_obj)
+        return db_obj
+
+    def _upsert(
+        self,
+        db: Session,
+        stmt: "UpsertInsert",
+        key: Dict[str, Any],
+    ) -> ModelType:
+        """Run an INSERT ... ON CONFLICT and return the row matching `key`."""
+        if supports_returning(db, KINSERT):
+            db_obj = db.scalars(upsert_returning(self.model, stmt)).one()
+        else:
+            db.execute(stmt)
+            db_obj = db.scalars(select_refreshed(self.model, key)).one()
+        self._commit(db, db_obj)
+        return db_obj
+
+
+class AsyncCRUDBase(
+    AsyncReadBase[ModelType],
+    Generic[ModelType, CreateSchemaType, UpdateSchemaType],
+):
+    """Base class for CRUD on an asyncio session."""
+
+    async def record(
+        self,
+        db: AsyncSession,
+        db_obj: ModelType,
+        deleted: bool = False,
+    ) -> None:
+        """Add the change log entry of a write to its transaction.
+
+        Args:
+            db (AsyncSession): database session
+            db_obj (ModelType): written model object
+            deleted (bool): the write deleted the object
+        """
+
+    async def create(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: CreateSchemaType,
+    ) -> ModelType:
+        """Create a crud item.
+
+        Args:
+            db (AsyncSession): database session
+            obj_in (CreateSchemaType): item data
+
+        Returns:
+            ModelType: model item
+        """
+        return await self._insert(db, obj_in.dict())
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        if_version: Optional[int] = None,
+    ) -> ModelType:
+        """Update crud item.
+
+        Args:
+            db (AsyncSession): database session
+            db_obj (ModelType): model object
+            obj_in (Union[UpdateSchemaType, Dict[str, Any]]): update data
+            if_version (int, optional): only update the row at this version
+
+        Raises:
+            StaleDataError: the row is no longer at `if_version`
+
+        Returns:
+            ModelType: model object
+        """
+        changes = changed_columns(self.model, obj_in)
+        if not changes:
+            return db_obj
+        changes = bumped(self.model, changes)
+        if supports_returning(db, "update"):
+            stmt = update_returning(
+                self.model,
+                db_obj.id,  # type: ignore [attr-defined]
+                changes,
+                *at_version(self.model, if_version),
+            )
+            updated = (await db.scalars(stmt)).one_or_none()
+            if updated is None:
+                raise StaleDataError("the row was updated concurrently")
+            await self._commit(db, updated)
+            return updated
+        # without RETURNING, the version read with the object is compared
+        if if_version is not None and getattr(db_obj, KVERSION) != if_version:
+            raise StaleDataError("the row was updated concurrently")
+        for field, field_value in changes.items():
+            setattr(db_obj, field, field_value)
+        db.add(db_obj)
+        await self._commit(db, db_obj)
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, iid: int) -> ModelType:
+        """Remove and return a crud item from the database.
+
+        Args:
+            db (AsyncSession): database session
+            iid (int): item id
+
+        Returns:
+            ModelType: database model type
+        """
+        if supports_returning(db, "delete"):
+            rows = await db.scalars(delete_returning(self.model, iid))
+            db_obj = rows.one()
+        else:
+            db_obj = await db.get_one(self.model, iid)
+            await db.delete(db_obj)
+        await self._commit(db, db_obj, deleted=True)
+        return db_obj
+
+    async def _commit(
+        self,
+        db: AsyncSession,
+        db_obj: ModelType,
+        deleted: bool = False,
+    ) -> None:
+        """Log the write of the object and commit its transaction."""
+        await self.record(db, db_obj, deleted)
+        await db.commit()
+
+    async def _insert(self, db: AsyncSession, row: Dict[str, Any]) -> ModelType:
+        """Insert a row with a single INSERT ... RETURNING when supported."""
+        if supports_returning(db, KINSERT):
+            rows = await db.scalars(insert_returning(self.model, row))
+            db_obj = rows.one()
+            await self._commit(db, db_obj)
+            return db_obj
+        db_obj = self.model(**row)
+        db.add(db_obj)
+        await db.flush()
+        await self._commit(db, db_obj)
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def _upsert(
+        self,
+        db: AsyncSession,
+        stmt: "UpsertInsert",
+        key: Dict[str, Any],
+    ) -> ModelType:
+        """Run an INSERT ... ON CONFLICT and return the row matching `key`."""
+        if supports_returning(db, KINSERT):
+            rows = await db.scalars(upsert_returning(self.model, stmt))
+        else:
+            await db.execute(stmt)
+            rows = await db.scalars(select_refreshed(self.model, key))
+        db_obj = rows.one()
+        await self._commit(db, db_obj)
+        return db_obj
@@ -1,9 +1,14 @@
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
-from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Select, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.crud.base import CRUDBase
+from app.crud import expiry, item_sync, reads, recent, reports
+from app.crud.base import AsyncCRUDBase, CRUDBase
+from app.crud.crud_item_change import achange, change_of
+from app.crud.item_reads import AsyncItemReads
 from app.models.item import Item
 from app.schemas.item import ItemCreate, ItemUpdate
 
@@ -26,41 +31,243 @@ class CRUDItem(CRUDBase[Item, ItemCreate, ItemUpdate]):
             owner_id (int): owner id
 
         Returns:
-            Item: Item object created
+            Item: Item object created, or the owner's item with that title
         """
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data, owner_id=owner_id)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self._upsert(
+            db,
+            reports.report_upsert(db).values(**reports.report_row(owner_id, obj_in)),
+            {reports.KOWNER_ID: owner_id, reports.KTITLE: obj_in.title},
+        )
+
+    def visible(self, stmt: "Select[Any]") -> "Select[Any]":
+        """Return the select restricted to unexpired items."""
+        return expiry.live(stmt)
 
-    def get_multi_by_owner(
+    def record(self, db: Session, db_obj: Item, deleted: bool = False) -> None:
+        """Add the change log entry of a write to its transaction."""
+        db.add(change_of(db_obj, deleted))
+
+    def get_multi_by_owner(  # noqa: WPS211
         self,
         db: Session,
         *,
         owner_id: int,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[int] = None,
     ) -> List[Item]:
-        """Get a list of crud items.
+        """Get a list of crud items ordered by id.
 
         Args:
             db (Session): database session
             owner_id (int): owner id
             skip (int, optional): number of items to skip. Defaults to 0.
             limit (int, optional): number of items to return. Defaults to 100.
+            after (int, optional): only items with a greater id. Defaults to None.
 
         Returns:
             List[Item]: List of Item objects
         """
+        stmt = reads.paginate(
+            self.visible(select(self.model).filter(Item.owner_id == owner_id)),
+            self.model,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
+        return list(db.scalars(stmt).all())
+
+
+class AsyncCRUDItem(AsyncItemReads, AsyncCRUDBase[Item, ItemCreate, ItemUpdate]):
+    """CRUDItem class for asyncio sessions.
+
+    The writes keep the recent reports, the ban index and the event stream
+    in step through `item_sync` once they are committed.
+    """
+
+    async def create_with_owner(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: ItemCreate,
+        owner_id: int,
+    ) -> Item:
+        """Create a new crud item, or count one more report of an existing one.
+
+        A repeat of a report seen within ITEMS_RECENT_SECONDS, with the same
+        or no description, is found in `recent_reports` and counted with an
+        UPDATE by id instead of the upsert on (owner_id, title).
+
+        Args:
+            db (AsyncSession): database session
+            obj_in (ItemCreate): item to be created
+            owner_id (int): owner id
+
+        Returns:
+            Item: Item object created, or the owner's item with that title
+        """
+        key = (owner_id, obj_in.title)
+        cached = recent.recent_reports.get(key)
+        db_obj: Optional[Item] = None
+        if cached is not None and recent.repeats(cached, obj_in):
+            db_obj = await recent.count_hit(db, cached.id, key, obj_in)
+        if db_obj is None:
+            db_obj = await self._upsert(
+                db,
+                reports.report_upsert(db).values(reports.report_row(owner_id, obj_in)),
+                {reports.KOWNER_ID: owner_id, reports.KTITLE: obj_in.title},
+            )
+        else:
+            await self._commit(db, db_obj)
+        recent.remember(db_obj)
+        await item_sync.upserted(db_obj)
+        return db_obj
+
+    async def create_multi_with_owner(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[ItemCreate],
+        owner_id: int,
+        chunk_size: int = 1000,
+    ) -> Tuple[List[int], FrozenSet[int]]:
+        """Create many crud items in one transaction.
+
+        Each chunk is written by a single multi-row INSERT ... RETURNING.
+
+        Args:
+            db (AsyncSession): database session
+            objs_in (Sequence[ItemCreate]): items to be created
+            owner_id (int): owner id
+            chunk_size (int, optional): rows per statement. Defaults to 1000.
+
+        Returns:
+            Tuple[List[int], FrozenSet[int]]: ids of the created or updated
+            items, in input order, and the ids of the created ones
+        """
+        return await self.create_owned(
+            db,
+            owned=[(owner_id, obj_in) for obj_in in objs_in],
+            chunk_size=chunk_size,
+        )
+
+    async def create_owned(
+        self,
+        db: AsyncSession,
+        *,
+        owned: reports.Owned,
+        chunk_size: int = 1000,
+    ) -> Tuple[List[int], FrozenSet[int]]:
+        """Create crud items of possibly different owners in one transaction.
+
+        Reports repeating an owner's title, in the input or in the table,
+        update that item. Each chunk is written by a single multi-row
+        INSERT ... ON CONFLICT ... RETURNING.
+
+        Args:
+            db (AsyncSession): database session
+            owned (reports.Owned): owner id and item pairs
+            chunk_size (int, optional): rows per statement. Defaults to 1000.
+
+        Returns:
+            Tuple[List[int], FrozenSet[int]]: ids of the created or updated
+            items, in input order, and the ids of the created ones
+        """
+        rows = reports.report_rows(owned)
+        ids, created = await reports.write_reports(db, rows, chunk_size)
+        await achange.log(db, reports.changed(ids))
+        await db.commit()
+        await item_sync.reported(ids, rows)
         return (
-            db.query(self.model)
-            .filter(Item.owner_id == owner_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+            [ids[owner_id, obj_in.title] for owner_id, obj_in in owned],
+            frozenset(created),
+        )
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: Item,
+        obj_in: Union[ItemUpdate, Dict[str, Any]],
+        if_version: Optional[int] = None,
+    ) -> Item:
+        """Update crud item and its ban index entry.
+
+        Args:
+            db (AsyncSession): database session
+            db_obj (Item): model object
+            obj_in (Union[ItemUpdate, Dict[str, Any]]): update data
+            if_version (int, optional): only update the row at this version
+
+        Returns:
+            Item: model object
+        """
+        item_sync.forget(db_obj)
+        db_obj = await super().update(
+            db,
+            db_obj=db_obj,
+            obj_in=obj_in,
+            if_version=if_version,
         )
+        item_sync.forget(db_obj)
+        await item_sync.upserted(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, iid: int) -> Item:
+        """Remove and return a crud item, dropping its ban index entry.
+
+        Args:
+            db (AsyncSession): database session
+            iid (int): item id
+
+        Returns:
+            Item: database model type
+        """
+        db_obj = await super().remove(db, iid=iid)
+        await item_sync.removed(db_obj)
+        return db_obj
+
+    async def remove_expired(
+        self,
+        db: AsyncSession,
+        *,
+        now: datetime,
+        limit: int,
+    ) -> int:
+        """Delete up to `limit` items that expired before `now`.
+
+        The oldest expirations go first, found through the expires_at index.
+        Rows locked by another reaper are skipped on Postgres, so that the
+        workers of a deployment can reap side by side. The transaction
+        touches at most `limit` rows, keeping its locks short.
+
+        Args:
+            db (AsyncSession): database session
+            now (datetime): UTC reference time
+            limit (int): largest number of rows deleted by the transaction
+
+        Returns:
+            int: number of deleted items
+        """
+        rows = (await db.execute(expiry.expired_rows(now, limit))).all()
+        if rows:
+            reaped = Item.id.in_([row.id for row in rows])
+            await db.execute(delete(Item).where(reaped))
+            reaped_ids = [(row.id, row.owner_id) for row in rows]
+            await achange.log(db, reaped_ids, deleted=True)
+        await db.commit()
+        await item_sync.reaped(rows)
+        return len(rows)
+
+    async def record(
+        self,
+        db: AsyncSession,
+        db_obj: Item,
+        deleted: bool = False,
+    ) -> None:
+        """Add the change log entry of a write to its transaction."""
+        db.add(change_of(db_obj, deleted))
 
 
 citem = CRUDItem(Item)
+acitem = AsyncCRUDItem(Item)
@@ -0,0 +1,151 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import Row, case, delete, exists, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.crud.returning import dialect_insert
+from app.models.item import Item
+from app.models.item_change import ChangeHorizon, ItemChange
+from app.utils import ensure_int
+
+KITEM_LOG = "item"
+
+# (item id, owner id)
+Changed = Tuple[int, Optional[int]]
+
+
+class AsyncCRUDItemChange(object):
+    """Append, read and compact the item change log on an asyncio session.
+
+    Every write to an item adds an entry in the write's transaction, its
+    version orders the writes. Compaction drops entries that a newer one
+    for the same item supersedes, and old deletions; the newest version of
+    a dropped deletion becomes the horizon below which a consumer can no
+    longer be brought up to date and has to list the items again.
+    """
+
+    async def log(
+        self,
+        db: AsyncSession,
+        changed: Iterable[Changed],
+        deleted: bool = False,
+    ) -> None:
+        """Add one entry per item to the session's transaction.
+
+        Args:
+            db (AsyncSession): database session
+            changed (Iterable[Changed]): item and owner ids
+            deleted (bool): the items were deleted
+        """
+        rows = [entry(item_ids, deleted) for item_ids in changed]
+        if rows:
+            await db.execute(insert(ItemChange), rows)
+
+    async def since(
+        self,
+        db: AsyncSession,
+        *,
+        version: int,
+        owner_id: Optional[int],
+        limit: int,
+    ) -> Sequence[Row]:  # type: ignore [type-arg]
+        """Return the entries after `version`, oldest first.
+
+        Args:
+            db (AsyncSession): database session
+            version (int): last version the consumer has seen
+            owner_id (Optional[int]): only entries of this owner when given
+            limit (int): largest number of entries
+
+        Returns:
+            Sequence[Row]: version, item_id, deleted and changed_at tuples
+        """
+        stmt = select(
+            ItemChange.version,
+            ItemChange.item_id,
+            ItemChange.deleted,
+            ItemChange.changed_at,
+        ).where(ItemChange.version > version)
+        if owner_id is not None:
+            stmt = stmt.where(ItemChange.owner_id == owner_id)
+        stmt = stmt.order_by(ItemChange.version).limit(limit)
+        return (await db.execute(stmt)).all()
+
+    async def head(self, db: AsyncSession) -> int:
+        """Return the newest version, compacted deletions included."""
+        newest = await db.scalar(select(func.max(ItemChange.version)))
+        return max(newest or 0, await self.horizon(db))
+
+    async def horizon(self, db: AsyncSession) -> int:
+        """Return the newest version of a deletion removed by compaction."""
+        stmt = select(ChangeHorizon.version).where(ChangeHorizon.log == KITEM_LOG)
+        return await db.scalar(stmt) or 0
+
+    async def compact(self, db: AsyncSession, *, before: datetime, limit: int) -> int:
+        """Remove up to `limit` superseded entries and deletions.
+
+        Only entries older than `before` are removed, the oldest first.
+        Rows locked by another compaction are skipped on Postgres.
+
+        Args:
+            db (AsyncSession): database session
+            before (datetime): UTC time of the newest removable entry
+            limit (int): largest number of rows removed by the transaction
+
+        Returns:
+            int: number of removed entries
+        """
+        victims = (await db.execute(_compactable(before, limit))).all()
+        deletions = [row.version for row in victims if row.deleted]
+        if deletions:
+            await db.execute(_raise_horizon(db, max(deletions)))
+        if victims:
+            removed = ItemChange.version.in_([row.version for row in victims])
+            await db.execute(delete(ItemChange).where(removed))
+        await db.commit()
+        return len(victims)
+
+
+def entry(changed: Changed, deleted: bool = False) -> Dict[str, Any]:
+    """Return the values of the change log entry of one item write."""
+    iid, owner_id = changed
+    return {"item_id": iid, "owner_id": owner_id, "deleted": deleted}
+
+
+def change_of(db_obj: Item, deleted: bool = False) -> ItemChange:
+    """Return the change log entry of a write to the item."""
+    iid = ensure_int(db_obj.id, "item.id is None")
+    return ItemChange(**entry((iid, db_obj.owner_id), deleted))
+
+
+def _compactable(before: datetime, limit: int) -> Any:
+    newer = aliased(ItemChange)
+    superseded = exists().where(
+        newer.item_id == ItemChange.item_id,
+        newer.version > ItemChange.version,
+    )
+    columns = (ItemChange.version, ItemChange.deleted)
+    return (
+        select(*columns)
+        .where(ItemChange.changed_at < before)
+        .where(or_(ItemChange.deleted.is_(True), superseded))
+        .order_by(ItemChange.version)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def _raise_horizon(db: AsyncSession, version: int) -> Any:
+    stmt = dialect_insert(db, ChangeHorizon).values(log=KITEM_LOG, version=version)
+    excluded = stmt.excluded.version
+    stored = ChangeHorizon.version
+    newest = case((excluded > stored, excluded), else_=stored)
+    return stmt.on_conflict_do_update(
+        index_elements=[ChangeHorizon.log],
+        set_={"version": newest},
+    )
+
+
+achange = AsyncCRUDItemChange()
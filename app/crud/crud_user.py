@@ -1,14 +1,42 @@
 from typing import Any, Dict, Optional, Union
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core import auth_cache
+from app.core.hashing import hasher
 from app.core.security import get_password_hash, verify_password
-from app.crud.base import CRUDBase
+from app.crud.base import AsyncCRUDBase, CRUDBase
 from app.models import User
-from app.schemas import UserCreate, UserUpdate
+from app.schemas import UserCreate, UserSnapshot, UserUpdate
+from app.utils import ensure_str
 
+KPASSWORD = "password"
+KHASHED_PASSWORD = "hashed_password"  # noqa: S105
 
-class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
+
+class UserFlagsMixin(object):
+    """Session independent checks on User objects."""
+
+    def disabled(self, user: Union[User, UserSnapshot]) -> bool:
+        """Returns True if the user is disabled.
+
+        :param user: user to check
+        :return: True if the user is disabled
+        """
+        return user.disabled if user.disabled else False
+
+    def is_superuser(self, user: Union[User, UserSnapshot]) -> bool:
+        """Returns True if user is a superuser.
+
+        :param user: user to check
+        :return: True if user is a superuser
+        """
+        return user.is_superuser if user.is_superuser else False
+
+
+class CRUDUser(UserFlagsMixin, CRUDBase[User, UserCreate, UserUpdate]):
     """CRUD User class."""
 
     def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
@@ -25,17 +53,15 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User: User object
         """
-        db_obj = User(
-            email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
-            is_superuser=obj_in.is_superuser,
+        return self._insert(
+            db,
+            {
+                "email": obj_in.email,
+                KHASHED_PASSWORD: get_password_hash(obj_in.password),
+                "is_superuser": obj_in.is_superuser,
+            },
         )
 
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-
     def update(
         self,
         db: Session,
@@ -57,10 +83,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             update_data = obj_in
         else:
             update_data = obj_in.dict(exclude_unset=True)
-        if update_data["password"]:
-            hashed_password = get_password_hash(update_data["password"])
-            update_data.pop("password")
-            update_data["hashed_password"] = hashed_password
+        if update_data[KPASSWORD]:
+            hashed_password = get_password_hash(update_data[KPASSWORD])
+            update_data.pop(KPASSWORD)
+            update_data[KHASHED_PASSWORD] = hashed_password
+        auth_cache.invalidate_user(db_obj.id)
         return super().update(db, db_obj=db_obj, obj_in=update_data)
 
     def authenticate(
@@ -86,21 +113,96 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             return None
         return user
 
-    def disabled(self, user: User) -> bool:
-        """Returns True if the user is disabled.
 
-        :param user: user to check
-        :return: True if the user is disabled
+class AsyncCRUDUser(UserFlagsMixin, AsyncCRUDBase[User, UserCreate, UserUpdate]):
+    """CRUD User class for asyncio sessions."""
+
+    async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
+        """Returns User object."""
+        return await db.scalar(select(User).filter(User.email == email))
+
+    async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
+        """Create a new user in the database.
+
+        Args:
+            db (AsyncSession): database session
+            obj_in (UserCreate): User object
+
+        Returns:
+            User: User object
         """
-        return user.disabled if user.disabled else False
+        return await self._insert(
+            db,
+            {
+                "email": obj_in.email,
+                KHASHED_PASSWORD: await hasher.hash(obj_in.password),
+                "is_superuser": obj_in.is_superuser,
+            },
+        )
 
-    def is_superuser(self, user: User) -> bool:
-        """Returns True if user is a superuser.
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: User,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        if_version: Optional[int] = None,
+    ) -> User:
+        """Update a user in the database.
 
-        :param user: user to check
-        :return: True if user is a superuser
+        Args:
+            db (AsyncSession): database session
+            db_obj (User): User object
+            obj_in (Union[UserUpdate, Dict[str, Any]]): user update data
+            if_version (int, optional): only update the row at this version
+
+        Returns:
+            User: User object
         """
-        return user.is_superuser if user.is_superuser else False
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.dict(exclude_unset=True)
+        if update_data.get(KPASSWORD):
+            hashed_password = await hasher.hash(update_data[KPASSWORD])
+            update_data.pop(KPASSWORD)
+            update_data[KHASHED_PASSWORD] = hashed_password
+        updated = await super().update(
+            db,
+            db_obj=db_obj,
+            obj_in=update_data,
+            if_version=if_version,
+        )
+        auth_cache.invalidate_user(updated.id)
+        return updated
+
+    async def authenticate(
+        self,
+        db: AsyncSession,
+        email: str,
+        password: str,
+    ) -> Optional[User]:
+        """Authenticate the user.
+
+        Args:
+            db (AsyncSession): database session
+            email (str): email address
+            password (str): password
+
+        Returns:
+            Optional[User]: User if authentication succeeded
+        """
+        user = await self.get_by_email(db, email=email)
+        if not user:
+            return None
+        hashed_password = ensure_str(
+            user.hashed_password,
+            "User id: '{0}' hashed_password is None.".format(user.id),
+        )
+        if not await hasher.verify(password, hashed_password):
+            return None
+        return user
 
 
 user = CRUDUser(User)
+auser = AsyncCRUDUser(User)
@@ -0,0 +1,43 @@
+"""Expiry of the bans reported with a ttl."""
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import Select, or_, select
+
+from app.models.item import Item
+
+
+def expiry(ttl: Optional[int]) -> Optional[datetime]:
+    """Return the UTC expiry of a ban reported now, None when it never expires."""
+    return None if ttl is None else datetime.utcnow() + timedelta(seconds=ttl)
+
+
+def expired(db_obj: Item, now: datetime) -> bool:
+    """Tell whether the item expired before `now`."""
+    return db_obj.expires_at is not None and db_obj.expires_at <= now
+
+
+def live(stmt: "Select[Any]") -> "Select[Any]":
+    """Restrict an item select to the bans that have not expired yet."""
+    expires_at = Item.expires_at
+    now = datetime.utcnow()
+    return stmt.where(or_(expires_at.is_(None), expires_at > now))
+
+
+def expired_rows(now: datetime, limit: int) -> "Select[Any]":
+    """Return the id, owner and title of up to `limit` items expired by `now`.
+
+    The oldest expirations come first, through the expires_at index; rows
+    locked by another reaper are its batch and are skipped on Postgres.
+
+    Args:
+        now (datetime): UTC reference time
+        limit (int): largest number of rows
+
+    Returns:
+        Select: SELECT ... FOR UPDATE SKIP LOCKED
+    """
+    stmt = select(Item.id, Item.owner_id, Item.title)
+    stmt = stmt.where(Item.expires_at <= now).order_by(Item.expires_at)
+    stmt = stmt.limit(limit)
+    return stmt.with_for_update(skip_locked=True)
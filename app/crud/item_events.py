@@ -0,0 +1,36 @@
+"""Process state kept in step with the item writes of every worker.
+
+The ban index and the recent reports of a worker are updated by its own
+writes as they commit, and by the events of the other workers as the bus
+delivers them. A worker hears its own events too, applying them again
+changes nothing.
+"""
+from typing import Sequence
+
+from app.core.ban_index import ban_index
+from app.core.events import KDELETE, Event
+from app.crud.recent import recent_reports
+from app.schemas.event import ItemEvent
+
+
+def applied(events: Sequence[Event]) -> None:
+    """Apply delivered item events to the ban index and the recent reports.
+
+    Args:
+        events (Sequence[Event]): committed writes of any worker
+    """
+    for event in events:
+        _apply(ItemEvent.parse_raw(event.text))
+
+
+def _apply(written: ItemEvent) -> None:
+    key = (written.owner_id, written.title)
+    if written.event == KDELETE:
+        ban_index.discard(written.id)
+        recent_reports.pop(key)
+        return
+    ban_index.put(written.id, written.owner_id, written.title, written.expires_at)
+    # another write than the one remembered, its description may differ
+    cached = recent_reports.peek(key)
+    if cached is not None and cached.version != written.version:
+        recent_reports.pop(key)
@@ -0,0 +1,148 @@
+"""Reads of the unexpired items on an asyncio session."""
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import ColumnElement, Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.expiry import expired, live
+from app.crud.reads import AsyncReadBase, paginate
+from app.models.item import Item
+
+
+class AsyncItemReads(AsyncReadBase[Item]):
+    """Item reads of `AsyncCRUDItem`, expired bans are never returned."""
+
+    export_columns: Tuple[str, ...] = ("id", "title", "description", "owner_id")
+
+    def visible(self, stmt: "Select[Any]") -> "Select[Any]":
+        """Return the select restricted to unexpired items."""
+        return live(stmt)
+
+    async def get(self, db: AsyncSession, iid: Any) -> Optional[Item]:
+        """Return the item, None when it does not exist or has expired.
+
+        Args:
+            db (AsyncSession): database session
+            iid (Any): item id
+
+        Returns:
+            Optional[Item]: the item
+        """
+        db_obj = await super().get(db, iid)
+        if db_obj is None or expired(db_obj, datetime.utcnow()):
+            return None
+        return db_obj
+
+    async def get_multi_by_ids(
+        self,
+        db: AsyncSession,
+        *,
+        iids: Sequence[int],
+    ) -> List[Item]:
+        """Return the unexpired items among `iids`, ordered by id.
+
+        Args:
+            db (AsyncSession): database session
+            iids (Sequence[int]): item ids
+
+        Returns:
+            List[Item]: the items that exist and have not expired
+        """
+        stmt = select(Item).where(Item.id.in_(iids))
+        rows = await db.scalars(self.visible(stmt).order_by(Item.id))
+        return list(rows.all())
+
+    async def get_multi_by_owner(  # noqa: WPS211
+        self,
+        db: AsyncSession,
+        *,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[int] = None,
+    ) -> List[Item]:
+        """Get a list of crud items ordered by id.
+
+        Args:
+            db (AsyncSession): database session
+            owner_id (int): owner id
+            skip (int, optional): number of items to skip. Defaults to 0.
+            limit (int, optional): number of items to return. Defaults to 100.
+            after (int, optional): only items with a greater id. Defaults to None.
+
+        Returns:
+            List[Item]: List of Item objects
+        """
+        rows = await db.scalars(
+            paginate(
+                self.visible(select(self.model).filter(Item.owner_id == owner_id)),
+                self.model,
+                skip=skip,
+                limit=limit,
+                after=after,
+            ),
+        )
+        return list(rows.all())
+
+    async def get_multi_rows_by_owner(  # noqa: WPS211
+        self,
+        db: AsyncSession,
+        *,
+        columns: Sequence[ColumnElement[Any]],
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[int] = None,
+    ) -> Sequence[Row]:  # type: ignore [type-arg]
+        """Get column tuples of an owner's items ordered by id.
+
+        Args:
+            db (AsyncSession): database session
+            columns (Sequence[ColumnElement[Any]]): selected item columns
+            owner_id (int): owner id
+            skip (int, optional): number of items to skip. Defaults to 0.
+            limit (int, optional): number of items to return. Defaults to 100.
+            after (int, optional): only items with a greater id. Defaults to None.
+
+        Returns:
+            Sequence[Row]: rows of the selected columns
+        """
+        stmt = paginate(
+            self.visible(select(*columns).filter(Item.owner_id == owner_id)),
+            self.model,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
+        return (await db.execute(stmt)).all()
+
+    async def stream_rows(
+        self,
+        db: AsyncSession,
+        *,
+        owner_id: Optional[int] = None,
+        batch_size: int = 1000,
+        names: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Sequence[Row]]:  # type: ignore [type-arg]
+        """Yield batches of unexpired item tuples from a server side cursor.
+
+        Rows are never turned into ORM objects and at most one batch is held
+        in memory.
+
+        Args:
+            db (AsyncSession): database session
+            owner_id (int, optional): only items of this owner. Defaults to None.
+            batch_size (int, optional): rows per batch. Defaults to 1000.
+            names (Sequence[str], optional): columns, `export_columns` if None.
+
+        Yields:
+            Sequence[Row]: batch of column tuples ordered by id
+        """
+        columns = [getattr(self.model, name) for name in names or self.export_columns]
+        stmt = self.visible(select(*columns)).order_by(self.model.id)
+        if owner_id is not None:
+            stmt = stmt.where(self.model.owner_id == owner_id)
+        stream = await db.stream(stmt.execution_options(yield_per=batch_size))
+        async for rows in stream.partitions():
+            yield rows
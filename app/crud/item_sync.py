@@ -0,0 +1,122 @@
+"""Process state kept in step with committed item writes.
+
+The recent report cache and the ban index of the process, and the event
+stream subscribers of every worker, learn about a write once it is
+committed.
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import Row
+
+from app.core.ban_index import ban_index
+from app.core.broadcaster import broadcaster
+from app.core.events import KDELETE, KUPSERT, Event
+from app.crud.recent import recent_reports
+from app.crud.reports import KEXPIRES_AT, ReportKey
+from app.models.item import Item
+from app.schemas.event import ItemEvent
+from app.utils import ensure_int
+
+KNO_ID = "item.id is None"
+KNO_OWNER = "item.owner_id is None"
+
+
+def item_event(  # noqa: WPS211
+    kind: str,
+    iid: int,
+    owner_id: int,
+    title: Optional[str],
+    expires_at: Optional[datetime] = None,
+    version: Optional[int] = None,
+) -> Event:
+    """Return the stream event of a committed write to an item.
+
+    Args:
+        kind (str): KUPSERT or KDELETE
+        iid (int): item id
+        owner_id (int): owner id
+        title (Optional[str]): banned address or network
+        expires_at (Optional[datetime]): UTC expiry of the ban
+        version (Optional[int]): row version written by an upsert
+
+    Returns:
+        Event: the event, its JSON text encoded once for every subscriber
+    """
+    payload = ItemEvent(
+        event=kind,
+        id=iid,
+        owner_id=owner_id,
+        title=title,
+        expires_at=expires_at,
+        version=version,
+    )
+    return Event(kind=kind, owner_id=owner_id, text=payload.json())
+
+
+def event_of(db_obj: Item, kind: str = KUPSERT) -> Event:
+    """Return the stream event of a committed write to the item."""
+    return item_event(
+        kind,
+        ensure_int(db_obj.id, KNO_ID),
+        ensure_int(db_obj.owner_id, KNO_OWNER),
+        db_obj.title,
+        db_obj.expires_at,
+        db_obj.version,
+    )
+
+
+def forget(db_obj: Item) -> None:
+    """Drop the item from the recent reports, its next report is written."""
+    if db_obj.owner_id is not None:
+        recent_reports.pop((db_obj.owner_id, db_obj.title))
+
+
+async def upserted(db_obj: Item) -> None:
+    """Index the ban of a created or updated item and publish the write."""
+    ban_index.put(
+        ensure_int(db_obj.id, KNO_ID),
+        ensure_int(db_obj.owner_id, KNO_OWNER),
+        db_obj.title,
+        db_obj.expires_at,
+    )
+    await broadcaster.publish([event_of(db_obj)])
+
+
+async def removed(db_obj: Item) -> None:
+    """Forget a deleted item and publish the deletion."""
+    forget(db_obj)
+    ban_index.discard(ensure_int(db_obj.id, KNO_ID))
+    await broadcaster.publish([event_of(db_obj, KDELETE)])
+
+
+async def reported(
+    ids: Dict[ReportKey, int],
+    rows: Dict[ReportKey, Dict[str, Any]],
+) -> None:
+    """Index the bans of a batch of reports and publish their writes.
+
+    Args:
+        ids (Dict[ReportKey, int]): ids of the written items
+        rows (Dict[ReportKey, Dict[str, Any]]): the written values
+    """
+    events = []
+    for (owner_id, title), row in rows.items():
+        iid = ids[owner_id, title]
+        ban_index.put(iid, owner_id, title, row[KEXPIRES_AT])
+        events.append(item_event(KUPSERT, iid, owner_id, title, row[KEXPIRES_AT]))
+    await broadcaster.publish(events)
+
+
+async def reaped(rows: Sequence[Row]) -> None:  # type: ignore [type-arg]
+    """Forget the expired items deleted by the reaper and publish it.
+
+    Args:
+        rows (Sequence[Row]): id, owner_id and title of the deleted items
+    """
+    for row in rows:
+        recent_reports.pop((row.owner_id, row.title))
+        ban_index.discard(row.id)
+    await broadcaster.publish(
+        [item_event(KDELETE, gone.id, gone.owner_id, gone.title) for gone in rows],
+    )
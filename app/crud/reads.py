@@ -0,0 +1,171 @@
+"""Reads shared by the blocking and asyncio CRUD classes."""
+from typing import Any, Generic, List, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import ColumnElement, Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.database import Base
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+
+def paginate(
+    stmt: "Select[Any]",
+    model: Type[ModelType],
+    *,
+    skip: int,
+    limit: int,
+    after: Optional[int],
+) -> "Select[Any]":
+    """Order a select by primary key and apply the page bounds.
+
+    Args:
+        stmt (Select): select statement on the model
+        model (Type[ModelType]): model class with an integer `id` key
+        skip (int): number of rows to skip
+        limit (int): number of rows to return
+        after (Optional[int]): keyset bound, only rows with a greater id
+
+    Returns:
+        Select: the paginated statement
+    """
+    id_column = model.id  # type: ignore [attr-defined]
+    if after is not None:
+        stmt = stmt.where(id_column > after)
+    return stmt.order_by(id_column).offset(skip).limit(limit)
+
+
+class ReadBase(Generic[ModelType]):
+    """Reads of `CRUDBase`."""
+
+    def __init__(self, model: Type[ModelType]):
+        """
+        CRUD object with default methods to Create, Read, Update, Delete (CRUD).
+
+        **Parameters**
+
+        * `model`: A SQLAlchemy model class
+        * `schema`: A Pydantic model (schema) class
+        """
+        self.model = model
+
+    def get(self, db: Session, iid: Any) -> Optional[ModelType]:
+        """Returns query result."""
+        return (
+            db.query(self.model)
+            .filter(self.model.id == iid)  # type: ignore [attr-defined]
+            .first()
+        )
+
+    def visible(self, stmt: "Select[Any]") -> "Select[Any]":
+        """Return the select restricted to the rows reads may return.
+
+        Every row by default, models with rows that outlive their use
+        narrow it.
+
+        Args:
+            stmt (Select): select statement on the model
+
+        Returns:
+            Select: the restricted statement
+        """
+        return stmt
+
+    def get_multi(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[int] = None,
+    ) -> List[ModelType]:
+        """Returns query results ordered by id, after the `after` id if given."""
+        stmt = paginate(
+            self.visible(select(self.model)),
+            self.model,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
+        return list(db.scalars(stmt).all())
+
+
+class AsyncReadBase(Generic[ModelType]):
+    """Reads of `AsyncCRUDBase`."""
+
+    def __init__(self, model: Type[ModelType]):
+        """
+        CRUD object with awaitable methods to Create, Read, Update, Delete (CRUD).
+
+        The method surface mirrors `CRUDBase`, taking an `AsyncSession`.
+
+        **Parameters**
+
+        * `model`: A SQLAlchemy model class
+        """
+        self.model = model
+
+    async def get(self, db: AsyncSession, iid: Any) -> Optional[ModelType]:
+        """Returns query result."""
+        return await db.get(self.model, iid)
+
+    def visible(self, stmt: "Select[Any]") -> "Select[Any]":
+        """Return the select restricted to the rows reads may return.
+
+        Args:
+            stmt (Select): select statement on the model
+
+        Returns:
+            Select: the statement, unchanged unless a subclass narrows it
+        """
+        return stmt
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[int] = None,
+    ) -> List[ModelType]:
+        """Returns query results ordered by id, after the `after` id if given."""
+        stmt = paginate(
+            self.visible(select(self.model)),
+            self.model,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
+        rows = await db.scalars(stmt)
+        return list(rows.all())
+
+    async def get_multi_rows(  # noqa: WPS211
+        self,
+        db: AsyncSession,
+        *,
+        columns: Sequence[ColumnElement[Any]],
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[int] = None,
+    ) -> Sequence[Row]:  # type: ignore [type-arg]
+        """Returns column tuples ordered by id, without building model objects.
+
+        Args:
+            db (AsyncSession): database session
+            columns (Sequence[ColumnElement[Any]]): selected model columns
+            skip (int, optional): number of rows to skip. Defaults to 0.
+            limit (int, optional): number of rows to return. Defaults to 100.
+            after (int, optional): only rows with a greater id. Defaults to None.
+
+        Returns:
+            Sequence[Row]: rows of the selected columns
+        """
+        stmt = paginate(
+            self.visible(select(*columns)),
+            self.model,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
+        return (await db.execute(stmt)).all()
@@ -0,0 +1,109 @@
+"""Items recently created or reported again, by (owner id, title)."""
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.crud import reports
+from app.crud.expiry import expiry
+from app.crud.returning import supports_returning
+from app.models.item import Item
+from app.schemas.item import ItemCreate
+from app.utils import ensure_int
+
+
+class RecentReport(NamedTuple):
+    """What a repeat of a report needs to know about its item.
+
+    The item itself stays with the session that wrote it, concurrent
+    requests only share these values.
+    """
+
+    id: int
+    description: Optional[str]
+    expires_at: Optional[datetime]
+    version: int
+
+
+def repeats(recent: RecentReport, obj_in: ItemCreate) -> bool:
+    """Tell whether a report only repeats the live `recent` one.
+
+    Args:
+        recent (RecentReport): item of the last report of that owner and title
+        obj_in (ItemCreate): new report
+
+    Returns:
+        bool: True when the report has the same or no description
+    """
+    expires_at = recent.expires_at
+    if expires_at is not None and expires_at <= datetime.utcnow():
+        return False
+    return obj_in.description in {None, recent.description}
+
+
+def report_hit(obj_in: ItemCreate) -> Dict[str, Any]:
+    """Return the update values of one more report of a known item."""
+    return {
+        reports.KHIT_COUNT: Item.hit_count + 1,
+        "last_seen": datetime.utcnow(),
+        reports.KEXPIRES_AT: expiry(obj_in.ttl),
+        "version": Item.version + 1,
+    }
+
+
+async def count_hit(
+    db: AsyncSession,
+    iid: int,
+    key: reports.ReportKey,
+    obj_in: ItemCreate,
+) -> Optional[Item]:
+    """Count one more report of the item `iid` if it is still `key`'s.
+
+    Args:
+        db (AsyncSession): database session, the caller commits
+        iid (int): id of the item remembered for the key
+        key (ReportKey): owner id and title of the report
+        obj_in (ItemCreate): new report
+
+    Returns:
+        Optional[Item]: the updated item, None when it is gone
+    """
+    owner_id, title = key
+    stmt = update(Item).where(
+        Item.id == iid,
+        Item.owner_id == owner_id,
+        Item.title == title,
+    )
+    stmt = stmt.values(**report_hit(obj_in))
+    if supports_returning(db, "update"):
+        rows = await db.scalars(
+            stmt.returning(Item).execution_options(populate_existing=True),
+        )
+        return rows.one_or_none()
+    counted = await db.execute(stmt)
+    if not counted.rowcount:  # type: ignore [attr-defined]
+        return None
+    return await db.get(Item, iid, populate_existing=True)
+
+
+def remember(db_obj: Item) -> None:
+    """Keep the values of a committed report of the item."""
+    key = (ensure_int(db_obj.owner_id, "item.owner_id is None"), db_obj.title)
+    recent_reports.set(
+        key,
+        RecentReport(
+            id=ensure_int(db_obj.id, "item.id is None"),
+            description=db_obj.description,
+            expires_at=db_obj.expires_at,
+            version=ensure_int(db_obj.version, "item.version is None"),
+        ),
+    )
+
+
+recent_reports: TTLCache[reports.ReportKey, RecentReport] = TTLCache(
+    maxsize=settings.ITEMS_RECENT_SIZE,
+    ttl=settings.ITEMS_RECENT_SECONDS,
+)
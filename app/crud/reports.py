@@ -0,0 +1,135 @@
+"""Upserts of ban reports keyed by (owner_id, title)."""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import Row, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud.crud_item_change import Changed
+from app.crud.expiry import expiry
+from app.crud.returning import dialect_insert
+from app.models.item import Item
+from app.schemas.item import ItemCreate
+
+if TYPE_CHECKING:
+    from app.crud.returning import UpsertInsert
+
+KOWNER_ID = "owner_id"
+KTITLE = "title"
+KHIT_COUNT = "hit_count"
+KEXPIRES_AT = "expires_at"
+
+# (owner id, title)
+ReportKey = Tuple[int, Optional[str]]
+Owned = Sequence[Tuple[int, ItemCreate]]
+
+
+def report_upsert(db: Union[Session, AsyncSession]) -> "UpsertInsert":
+    """Return the INSERT of reports that updates the owner's item on a repeat.
+
+    A repeated (owner_id, title) adds the row's hit_count to the stored one,
+    moves last_seen, takes the expiry of the latest report, replaces the
+    description when one is given and bumps the row version.
+
+    Args:
+        db (Union[Session, AsyncSession]): database session
+
+    Returns:
+        UpsertInsert: INSERT ... ON CONFLICT DO UPDATE
+    """
+    stmt = dialect_insert(db, Item)
+    return stmt.on_conflict_do_update(
+        index_elements=[Item.owner_id, Item.title],
+        set_={
+            KHIT_COUNT: Item.hit_count + stmt.excluded.hit_count,
+            "last_seen": stmt.excluded.last_seen,
+            KEXPIRES_AT: stmt.excluded.expires_at,
+            "version": Item.version + 1,
+            "description": func.coalesce(
+                stmt.excluded.description,
+                Item.description,
+            ),
+        },
+    )
+
+
+def report_row(owner_id: int, obj_in: ItemCreate) -> Dict[str, Any]:
+    """Return the values of one report, last_seen comes from the column default."""
+    return {
+        **obj_in.dict(exclude={"ttl"}),
+        KOWNER_ID: owner_id,
+        KHIT_COUNT: 1,
+        KEXPIRES_AT: expiry(obj_in.ttl),
+    }
+
+
+def report_rows(owned: Owned) -> Dict[ReportKey, Dict[str, Any]]:
+    """Return one row per (owner_id, title), merging the repeats of a batch.
+
+    A statement may not update a row twice: the repeats add to the row's
+    hit_count and the latest one sets its expiry and description.
+
+    Args:
+        owned (Owned): owner id and item pairs
+
+    Returns:
+        Dict[ReportKey, Dict[str, Any]]: the rows, in input order
+    """
+    rows: Dict[ReportKey, Dict[str, Any]] = {}
+    for owner_id, obj_in in owned:
+        key = (owner_id, obj_in.title)
+        if key not in rows:
+            rows[key] = report_row(owner_id, obj_in)
+            continue
+        rows[key][KHIT_COUNT] += 1
+        rows[key][KEXPIRES_AT] = expiry(obj_in.ttl)
+        if obj_in.description is not None:
+            rows[key]["description"] = obj_in.description
+    return rows
+
+
+def changed(ids: Dict[ReportKey, int]) -> List[Changed]:
+    """Return the change log ids of the written reports."""
+    return [(iid, owner_id) for (owner_id, _), iid in ids.items()]
+
+
+async def write_reports(
+    db: AsyncSession,
+    rows: Dict[ReportKey, Dict[str, Any]],
+    chunk_size: int,
+) -> Tuple[Dict[ReportKey, int], List[int]]:
+    """Upsert the rows, one multi-row statement per chunk.
+
+    Args:
+        db (AsyncSession): database session, the caller commits
+        rows (Dict[ReportKey, Dict[str, Any]]): one row per (owner_id, title)
+        chunk_size (int): rows per statement
+
+    Returns:
+        Tuple[Dict[ReportKey, int], List[int]]: ids of the written items and
+        the ids of those the rows created
+    """
+    stmt = report_upsert(db).returning(
+        Item.id,
+        Item.owner_id,
+        Item.title,
+        Item.hit_count,
+    )
+    written = list(rows.values())
+    returned: List[Row] = []  # type: ignore [type-arg]
+    for start in range(0, len(written), chunk_size):
+        stop = start + chunk_size
+        returned.extend(await db.execute(stmt, written[start:stop]))
+    return (
+        {(row.owner_id, row.title): row.id for row in returned},
+        [row.id for row in returned if _created(rows, row)],
+    )
+
+
+def _created(
+    rows: Dict[ReportKey, Dict[str, Any]],
+    returned: Row,  # type: ignore [type-arg]
+) -> bool:
+    # a created item holds only the hits of its row, a merged one has more
+    row = rows[returned.owner_id, returned.title]
+    return bool(returned.hit_count == row[KHIT_COUNT])
@@ -0,0 +1,105 @@
+"""Single statement writes that return the written row."""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar, Union, cast
+
+from sqlalchemy import ColumnElement, Select, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import ReturningDelete, ReturningInsert, ReturningUpdate
+
+from app.db.database import Base
+
+if TYPE_CHECKING:
+    from sqlalchemy.dialects import postgresql, sqlite
+
+    UpsertInsert = Union[postgresql.Insert, sqlite.Insert]
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+# dialects with INSERT ... ON CONFLICT DO UPDATE, imported on first use
+DIALECT_INSERTS = frozenset(("postgresql", "sqlite"))
+
+
+def supports_returning(db: Union[Session, AsyncSession], statement: str) -> bool:
+    """Tell whether the database answers `statement` ... RETURNING.
+
+    Args:
+        db (Union[Session, AsyncSession]): database session
+        statement (str): "insert", "update" or "delete"
+
+    Returns:
+        bool: True for Postgres and SQLite 3.35 or newer
+    """
+    dialect = db.get_bind().dialect
+    return bool(getattr(dialect, "{0}_returning".format(statement), False))
+
+
+def insert_returning(
+    model: Type[ModelType],
+    row: Dict[str, Any],
+) -> "ReturningInsert[Any]":
+    """Return an INSERT of one row returning the model object."""
+    return insert(model).values(**row).returning(model)
+
+
+def update_returning(
+    model: Type[ModelType],
+    iid: Any,
+    row: Dict[str, Any],
+    *criteria: "ColumnElement[bool]",
+) -> "ReturningUpdate[Any]":
+    """Return an UPDATE of the row with id `iid` returning the model object.
+
+    Args:
+        model (Type[ModelType]): model class
+        iid (Any): primary key of the row
+        row (Dict[str, Any]): new column values
+        criteria (ColumnElement[bool]): further conditions the row must meet
+
+    Returns:
+        ReturningUpdate: UPDATE ... RETURNING
+    """
+    id_column = model.id  # type: ignore [attr-defined]
+    return (
+        update(model)
+        .where(id_column == iid, *criteria)
+        .values(**row)
+        .returning(model)
+        .execution_options(populate_existing=True)
+    )
+
+
+def delete_returning(model: Type[ModelType], iid: Any) -> "ReturningDelete[Any]":
+    """Return a DELETE of the row with id `iid` returning the model object."""
+    id_column = model.id  # type: ignore [attr-defined]
+    return delete(model).where(id_column == iid).returning(model)
+
+
+def dialect_insert(db: Union[Session, AsyncSession], model: Any) -> "UpsertInsert":
+    """Return an INSERT of the session's dialect, it has `on_conflict_do_update`.
+
+    Args:
+        db (Union[Session, AsyncSession]): database session
+        model (Any): model class
+
+    Raises:
+        KeyError: the dialect has no upsert
+
+    Returns:
+        UpsertInsert: Postgres or SQLite INSERT
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect not in DIALECT_INSERTS:
+        raise KeyError(dialect)
+    module = import_module("sqlalchemy.dialects.{0}".format(dialect))
+    return cast("UpsertInsert", module.insert(model))
+
+
+def upsert_returning(model: Type[ModelType], stmt: "UpsertInsert") -> Any:
+    """Return the upsert returning the model object it inserted or updated."""
+    return stmt.returning(model).execution_options(populate_existing=True)
+
+
+def select_refreshed(model: Type[ModelType], key: Dict[str, Any]) -> "Select[Any]":
+    """Return the SELECT of the row matching `key`, refreshing loaded objects."""
+    return select(model).filter_by(**key).execution_options(populate_existing=True)
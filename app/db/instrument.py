@@ -0,0 +1,35 @@
+"""SQLAlchemy event hooks feeding the request metrics."""
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import record_statement
+
+# set on the execution context, which is dropped with a failed statement
+KSTART = "_metrics_statement_start"
+
+
+def before_cursor_execute(**kw: Any) -> None:
+    """Remember when the statement was sent."""
+    context = kw["context"]
+    if context is not None:
+        setattr(context, KSTART, time.perf_counter())
+
+
+def after_cursor_execute(**kw: Any) -> None:
+    """Record how long the statement took."""
+    started = getattr(kw["context"], KSTART, None)
+    if started is not None:
+        record_statement(time.perf_counter() - started)
+
+
+def instrument(bound: Engine) -> None:
+    """Time every statement executed through the engine.
+
+    Args:
+        bound (Engine): engine, the `sync_engine` of an async engine
+    """
+    event.listen(bound, "before_cursor_execute", before_cursor_execute, named=True)
+    event.listen(bound, "after_cursor_execute", after_cursor_execute, named=True)
@@ -0,0 +1,62 @@
+"""Engine options driven by the DB_* settings."""
+import re
+from typing import Any, Dict, Type
+
+from sqlalchemy.pool import Pool
+
+from app.core.config import settings
+
+
+def engine_options(url: str, poolclass: Type[Pool]) -> Dict[str, Any]:
+    """Return the create_engine keyword arguments for the url.
+
+    Args:
+        url (str): database connection url
+        poolclass (Type[Pool]): queue pool used unless the database is in memory
+
+    Returns:
+        Dict[str, Any]: engine keyword arguments driven by the DB_* settings
+    """
+    options: Dict[str, Any] = {"connect_args": {}}
+    if re.match("sqlite", url):
+        options["connect_args"]["check_same_thread"] = False
+        if ":memory:" in url or url.endswith("://"):
+            return options
+    elif re.match("post", url):
+        options["pool_pre_ping"] = True
+        options["connect_args"] = statement_timeout_args(url)
+    options.update(
+        poolclass=poolclass,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
+def statement_timeout_args(url: str) -> Dict[str, Any]:
+    """Return the driver arguments setting the Postgres statement_timeout.
+
+    Args:
+        url (str): postgres connection url
+
+    Returns:
+        Dict[str, Any]: connect_args for psycopg2 or asyncpg
+    """
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    if not timeout:
+        return {}
+    if "+asyncpg" in url:
+        return {"server_settings": {"statement_timeout": str(timeout)}}
+    return {"options": "-c statement_timeout={0}".format(timeout)}
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Configure every new SQLite connection from the DB_SQLITE_* settings."""
+    cursor = dbapi_connection.cursor()
+    if settings.DB_SQLITE_WAL:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous={0}".format(settings.DB_SQLITE_SYNCHRONOUS))
+    cursor.execute("PRAGMA busy_timeout={0}".format(settings.DB_SQLITE_BUSY_TIMEOUT_MS))
+    cursor.close()
@@ -0,0 +1,91 @@
+"""Connection pools that keep checkout statistics."""
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+PoolSnapshot = Dict[str, Any]
+
+
+class PoolStats(object):
+    """Counters of one engine's pool, updated on every checkout."""
+
+    def __init__(self) -> None:
+        """Start with zeroed counters."""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total: float = 0
+        self.wait_seconds_max: float = 0
+
+    def record_wait(self, waited: float) -> None:
+        """Account for the time a checkout waited for a connection.
+
+        Args:
+            waited (float): seconds spent waiting
+        """
+        self.checkouts += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self, pool: Pool) -> PoolSnapshot:
+        """Return the counters together with the live state of the pool.
+
+        Args:
+            pool (Pool): pool these statistics belong to
+
+        Returns:
+            PoolSnapshot: pool gauges and checkout counters
+        """
+        gauges: PoolSnapshot = {"status": pool.status()}
+        if isinstance(pool, QueuePool):
+            gauges.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+        gauges.update(
+            checkouts=self.checkouts,
+            timeouts=self.timeouts,
+            wait_seconds_total=self.wait_seconds_total,
+            wait_seconds_max=self.wait_seconds_max,
+        )
+        return gauges
+
+
+class TimedPoolMixin(object):
+    """Measure how long each checkout waits for a free connection.
+
+    Each pool has its own statistics, handed over to the pool that
+    replaces it when its engine is disposed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool with zeroed statistics."""
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self) -> Any:
+        """Return the replacement pool, counting on from these statistics."""
+        pool = super().recreate()  # type: ignore [misc]
+        pool.stats = self.stats
+        return pool
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore [misc]
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.record_wait(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    """QueuePool of the blocking engine."""
+
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    """QueuePool of the asyncio engine."""
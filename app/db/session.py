@@ -1,24 +1,138 @@
 import re
-from os import getenv
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
-from app.constants import KUNDEFINED
+from app.core.config import settings
+from app.db.instrument import instrument
+from app.db.options import engine_options, set_sqlite_pragmas
+from app.db.pool import PoolSnapshot, TimedAsyncQueuePool, TimedQueuePool
+from app.db.urls import async_url, sync_url
 
-SQLALCHEMY_DATABASE_URL = getenv("DB_CONNECTION", KUNDEFINED)
+SQLALCHEMY_DATABASE_URL = settings.DB_CONNECTION
 
-if re.match("sqlite", SQLALCHEMY_DATABASE_URL):
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
-        connect_args={"check_same_thread": False},
+
+class Engines(NamedTuple):
+    """The connection pools of the process and their session factories."""
+
+    engine: Engine
+    async_engine: AsyncEngine
+    SessionLocal: "sessionmaker[Any]"  # noqa: N815, WPS115
+    AsyncSessionLocal: "async_sessionmaker[AsyncSession]"  # noqa: N815, WPS115
+
+
+# Built by `init_engines`, from the application lifespan or on first
+# access of one of the Engines fields as a module attribute.
+_engines: List[Engines] = []
+
+if TYPE_CHECKING:
+    engine: Engine
+    async_engine: AsyncEngine
+    SessionLocal: sessionmaker[Any]
+    AsyncSessionLocal: async_sessionmaker[AsyncSession]
+
+
+def init_engines() -> Engines:
+    """Create the engines and session factories, once per process.
+
+    Returns:
+        Engines: the engines of the process
+    """
+    if _engines:
+        return _engines[0]
+    sync_engine = create_engine(
+        sync_url(SQLALCHEMY_DATABASE_URL),
+        **engine_options(sync_url(SQLALCHEMY_DATABASE_URL), TimedQueuePool),
+    )
+    aio_engine = create_async_engine(
+        async_url(SQLALCHEMY_DATABASE_URL),
+        **engine_options(async_url(SQLALCHEMY_DATABASE_URL), TimedAsyncQueuePool),
     )
-elif re.match("post", SQLALCHEMY_DATABASE_URL):
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
-        pool_pre_ping=True,
+    for bound in (sync_engine, aio_engine.sync_engine):
+        if settings.METRICS_ENABLED:
+            instrument(bound)
+        if re.match("sqlite", SQLALCHEMY_DATABASE_URL):
+            event.listen(bound, "connect", set_sqlite_pragmas)
+    # Objects returned by the CRUD writes are complete (RETURNING or refresh),
+    # expiring them on commit would only cost another SELECT on next access.
+    # Lazy refreshes are not possible at all outside of the greenlet that runs
+    # an async session's IO.
+    _engines.append(
+        Engines(
+            engine=sync_engine,
+            async_engine=aio_engine,
+            SessionLocal=sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                bind=sync_engine,
+                expire_on_commit=False,
+            ),
+            AsyncSessionLocal=async_sessionmaker(
+                bind=aio_engine,
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False,
+            ),
+        ),
     )
-else:
-    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    return _engines[0]
+
+
+async def dispose_engines() -> None:
+    """Close the pooled connections, the engines stay usable."""
+    for engines in _engines:
+        engines.engine.dispose()
+        await engines.async_engine.dispose()
+
+
+def pool_snapshot() -> Dict[str, Optional[PoolSnapshot]]:
+    """Return the state and checkout statistics of both connection pools."""
+    engines = init_engines()
+    return {
+        "sync": _snapshot(engines.engine),
+        "async": _snapshot(engines.async_engine.sync_engine),
+    }
+
+
+def dispose_after_fork() -> None:
+    """Forget the pooled connections inherited from the parent process.
+
+    Called in each server worker right after the fork: sharing a socket
+    with the parent corrupts both sessions, the parent keeps its own.
+    Nothing to do when the parent did not connect before forking.
+    """
+    for engines in _engines:
+        engines.engine.dispose(close=False)
+        engines.async_engine.sync_engine.dispose(close=False)
+
+
+def __getattr__(name: str) -> Any:
+    """Build the engines on first access of one of them (PEP 562).
+
+    Args:
+        name (str): module attribute
+
+    Raises:
+        AttributeError: not an engine or session factory
+
+    Returns:
+        Any: the engine or session factory
+    """
+    if name not in Engines._fields:  # noqa: WPS437
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name),
+        )
+    return getattr(init_engines(), name)
+
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _snapshot(bound: Engine) -> Optional[PoolSnapshot]:
+    stats = getattr(bound.pool, "stats", None)
+    return None if stats is None else stats.snapshot(bound.pool)
@@ -0,0 +1,60 @@
+"""Helpers to derive sync, asyncio and libpq flavours of the DB_CONNECTION url."""
+import re
+
+ASYNC_DRIVERS = (  # noqa: WPS317
+    (re.compile(r"^sqlite(\+\w+)?:"), "sqlite+aiosqlite:"),
+    (re.compile(r"^postgres(ql)?(\+\w+)?:"), "postgresql+asyncpg:"),
+)
+
+SYNC_DRIVERS = (  # noqa: WPS317
+    (re.compile(r"^sqlite\+aiosqlite:"), "sqlite:"),
+    (re.compile(r"^postgres(ql)?\+asyncpg:"), "postgresql:"),
+    (re.compile("^postgres:"), "postgresql:"),
+)
+
+POSTGRES_DRIVER = re.compile(r"^postgres(ql)?(\+\w+)?:")
+
+
+def async_url(url: str) -> str:
+    """Return the url rewritten to use the asyncio driver of its dialect.
+
+    Urls that already name an asyncio driver (``sqlite+aiosqlite``,
+    ``postgresql+asyncpg``) are returned unchanged.
+
+    Args:
+        url (str): database connection url
+
+    Returns:
+        str: database connection url for an asyncio engine
+    """
+    for pattern, replacement in ASYNC_DRIVERS:
+        if pattern.match(url):
+            return pattern.sub(replacement, url, count=1)
+    return url
+
+
+def sync_url(url: str) -> str:
+    """Return the url rewritten to use the default blocking driver.
+
+    Args:
+        url (str): database connection url
+
+    Returns:
+        str: database connection url for a blocking engine
+    """
+    for pattern, replacement in SYNC_DRIVERS:
+        if pattern.match(url):
+            return pattern.sub(replacement, url, count=1)
+    return url
+
+
+def dsn_url(url: str) -> str:
+    """Return a postgres url without its driver, as asyncpg and libpq take it.
+
+    Args:
+        url (str): database connection url
+
+    Returns:
+        str: ``postgresql://`` url, other dialects unchanged
+    """
+    return POSTGRES_DRIVER.sub("postgresql:", url, count=1)
@@ -1,17 +1,81 @@
-import json
-from urllib import request
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import AsyncIterator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
+from app.api import compression, ingest, lookup, metrics, reaper, xkcd
 from app.api.api_v1.api import api_router
+from app.core.broadcaster import broadcaster
 from app.core.config import settings
+from app.core.hashing import HashingBusyError, hasher
+from app.core.mailer import mailer
+from app.core.xkcd import XkcdClient
+from app.crud import item_events
+from app.db import session
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Acquire and release the application wide resources."""
+    session.init_engines()
+    await lookup.load_ban_index()
+    application.state.xkcd = XkcdClient(
+        base_url=settings.XKCD_BASE_URL,
+        timeout=settings.XKCD_TIMEOUT_SECONDS,
+        cache_ttl=settings.XKCD_CACHE_SECONDS,
+        max_connections=settings.XKCD_MAX_CONNECTIONS,
+    )
+    await application.state.xkcd.start()
+    start_workers()
+    yield
+    await stop_workers()
+    await application.state.xkcd.close()
+    await session.dispose_engines()
+
+
+def start_workers() -> None:
+    """Start the enabled background workers."""
+    broadcaster.watch(item_events.applied)
+    broadcaster.start()
+    if not settings.ITEMS_DURABLE_WRITES:
+        ingest.ingest_queue.start()
+    if settings.EMAILS_ENABLED:
+        mailer.start()
+    if settings.ITEMS_REAP_INTERVAL_SECONDS:
+        reaper.reaper.start()
+
+
+async def stop_workers() -> None:
+    """Stop the background workers once their queues are drained."""
+    await reaper.reaper.stop()
+    await ingest.ingest_queue.stop()
+    await mailer.stop()
+    await broadcaster.stop()
+    hasher.shutdown()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url="{0}/openapi.json".format(settings.API_V1_STR),
+    lifespan=lifespan,
 )
 
 
+@app.exception_handler(HashingBusyError)
+async def hashing_busy_handler(
+    http_request: Request,
+    exc: HashingBusyError,
+) -> JSONResponse:
+    """Ask the client to back off while the password hashers are saturated."""
+    return JSONResponse(
+        status_code=HTTPStatus.TOO_MANY_REQUESTS,
+        content={"detail": "Too many concurrent credential checks"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 @app.get("/random", tags=["misc"])
 async def random():
     """Route to random number."""
@@ -20,26 +84,27 @@ async def random():
     return {"random_number": random()}  # noqa: S311
 
 
+@app.get("/health/db-pool", tags=["misc"])
+async def db_pool():
+    """Route to the connection pool gauges and checkout statistics."""
+    return session.pool_snapshot()
+
+
 @app.get("/", tags=["misc"])
 async def hello_world():
     """Route to hello world."""
     return {"msg": "See /docs"}
 
 
-@app.get("/xkcd", tags=["xkcd"])
-async def xkcd_current():
-    """Route to xkcd."""
-    ff = request.urlopen("http://xkcd.com/info.0.json")  # noqa: S310
-    resp = ff.read().decode("utf-8")
-    return json.loads(resp)
-
-
-@app.get("/xkcd/{comic_id}", tags=["xkcd"])
-async def xkcd_comic(comic_id: int):
-    """Route to xkcd_comic."""
-    ff = request.urlopen("http://xkcd.com/info.0.json")  # noqa: S310
-    resp = ff.read().decode("utf-8")
-    return json.loads(resp)
-
-
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        compression.CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        codings=settings.COMPRESSION_CODINGS.split(","),
+    )
+# added last, the metrics include the compression time
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+    app.include_router(metrics.router)
+app.include_router(xkcd.router, tags=["xkcd"])
 app.include_router(api_router, prefix=settings.API_V1_STR)
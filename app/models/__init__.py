@@ -1,2 +1,3 @@
 from .item import Item  # noqa: WPS300, F401
+from .item_change import ChangeHorizon, ItemChange  # noqa: WPS300, F401
 from .user import User  # noqa: WPS300, F401
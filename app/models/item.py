@@ -1,6 +1,8 @@
 # from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, ForeignKey, Integer, String
+import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 
 from app.db.database import Base
 
@@ -15,8 +17,23 @@ class Item(Base):  # noqa: WPS110
     """Item class."""
 
     __tablename__ = "item"
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
-    description = Column(String, index=True)
+    __table_args__ = (
+        # owner listings filter on owner_id and page by id
+        Index("ix_item_owner_id_id", "owner_id", "id"),
+        # repeated reports of an address update the owner's existing row
+        Index("uq_item_owner_id_title", "owner_id", "title", unique=True),
+        # the reaper deletes the oldest expired rows first
+        Index("ix_item_expires_at", "expires_at"),
+    )
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    description = Column(String)
     owner_id = Column(Integer, ForeignKey("user.id"))
+    hit_count = Column(Integer, nullable=False, default=1, server_default="1")
+    last_seen = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    # NULL never expires
+    expires_at = Column(DateTime)
+    # bumped by every update and repeated report, the ETag of the row
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     # owner = relationship("User", back_populates="items")
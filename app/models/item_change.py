@@ -0,0 +1,30 @@
+import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
+
+from app.db.database import Base
+
+
+class ItemChange(Base):
+    """A write to an item, numbered by `version`."""
+
+    __tablename__ = "item_change"
+    __table_args__ = (
+        # compaction keeps the latest change of each item
+        Index("ix_item_change_item_id_version", "item_id", "version"),
+        # SQLite would reuse the versions of deleted rows without it
+        {"sqlite_autoincrement": True},
+    )
+    version = Column(Integer, primary_key=True)
+    item_id = Column(Integer, nullable=False)
+    owner_id = Column(Integer)
+    deleted = Column(Boolean, nullable=False, default=False)
+    changed_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+
+
+class ChangeHorizon(Base):
+    """Newest version of a deletion that compaction removed from a change log."""
+
+    __tablename__ = "change_horizon"
+    log = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False)
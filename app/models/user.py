@@ -15,10 +15,12 @@ class User(Base):
     """User class."""
 
     __tablename__ = "user"
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     full_name = Column(String, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     disabled = Column(Boolean, default=False)
     is_superuser = Column(Boolean(), default=False)
+    # bumped by every update, the ETag of the row
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     # items = relationship("Item", back_populates="owner")
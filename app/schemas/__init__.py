@@ -1,4 +1,15 @@
+from .ban import BanLookup, BanLookupRequest, BanMatch  # noqa: WPS300, F401
+from .bulk import BulkReport, BulkRowResult  # noqa: WPS300, F401
+from .change import ItemChanges  # noqa: WPS300, F401
+from .event import ItemEvent  # noqa: WPS300, F401
+from .ingest import IngestReceipt  # noqa: WPS300, F401
 from .item import Item, ItemCreate, ItemInDB, ItemUpdate  # noqa: WPS300, F401
 from .msg import Msg  # noqa: WPS300, F401
 from .token import Token, TokenPayload  # noqa: WPS300, F401
-from .user import User, UserCreate, UserInDB, UserUpdate  # noqa: WPS300, F401
+from .user import (  # noqa: WPS300, F401
+    User,
+    UserCreate,
+    UserInDB,
+    UserSnapshot,
+    UserUpdate,
+)
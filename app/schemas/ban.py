@@ -0,0 +1,28 @@
+from typing import List
+
+from pydantic import BaseModel, IPvAnyAddress
+
+
+# Banned network an address falls into
+class BanMatch(BaseModel):
+    """BanMatch class."""
+
+    id: int
+    owner_id: int
+    network: str
+
+
+# Answer to "is this address banned?"
+class BanLookup(BaseModel):
+    """BanLookup class."""
+
+    addr: IPvAnyAddress
+    banned: bool
+    matches: List[BanMatch]
+
+
+# Properties to receive on a batch lookup
+class BanLookupRequest(BaseModel):
+    """BanLookupRequest class."""
+
+    addrs: List[IPvAnyAddress]
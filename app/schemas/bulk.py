@@ -0,0 +1,23 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+# Outcome of one row of a bulk ingest
+class BulkRowResult(BaseModel):
+    """BulkRowResult class."""
+
+    index: int
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+# Report returned by a bulk ingest
+class BulkReport(BaseModel):
+    """BulkReport class."""
+
+    created: int
+    # rows reporting an item that already existed or an earlier row created
+    merged: int
+    failed: int
+    rows: List[BulkRowResult]
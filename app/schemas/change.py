@@ -0,0 +1,19 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from .item import Item  # noqa: WPS300
+
+
+# Changes to the items after a change log version
+class ItemChanges(BaseModel):
+    """ItemChanges class."""
+
+    # newest version included, the `since` of the next request
+    version: int
+    # the page is full, more changes are waiting
+    more: bool
+    # current state of the items created or updated
+    items: List[Item]  # noqa: WPS110
+    # ids of the items deleted or expired
+    deleted: List[int]
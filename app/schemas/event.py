@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+# An item write pushed to the stream subscribers
+class ItemEvent(BaseModel):
+    """ItemEvent class."""
+
+    # "upsert" for a created, reported again or updated item, else "delete"
+    event: str
+    id: int
+    owner_id: int
+    title: Optional[str]
+    expires_at: Optional[datetime] = None
+    # row version written by an upsert, None for the reports of a batch
+    version: Optional[int] = None
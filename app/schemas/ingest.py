@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+# State of an item accepted by the write-behind queue
+class IngestReceipt(BaseModel):
+    """IngestReceipt class."""
+
+    ingest_id: str
+    status: str
+    id: Optional[int] = None
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PositiveInt
 
 
 # Shared properties
@@ -16,6 +17,8 @@ class ItemCreate(ItemBase):
     """ItemCreate class."""
 
     title: str
+    # seconds until the ban expires, it never does when unset
+    ttl: Optional[PositiveInt] = None
 
 
 # Properties to receive on item update
@@ -30,6 +33,12 @@ class ItemInDBBase(ItemBase):
     id: int
     title: str
     owner_id: int
+    hit_count: int = 1
+    last_seen: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    # bumped by every write, the ETag of the item
+    version: int = 1
 
     class Config:  # noqa: WPS306
         orm_mode = True
@@ -32,6 +32,8 @@ class UserInDBBase(UserBase):
     """UserInDBBase class."""
 
     id: Optional[int] = None
+    # bumped by every update, the ETag of the user
+    version: int = 1
 
     class Config:  # noqa: WPS306
         orm_mode = True
@@ -47,3 +49,19 @@ class UserInDB(UserInDBBase):
     """UserInDB class."""
 
     hashed_password: str
+
+
+# Immutable view of the authenticated user kept by the auth cache
+class UserSnapshot(BaseModel):
+    """UserSnapshot class."""
+
+    id: int
+    email: str
+    full_name: Optional[str] = None
+    disabled: Optional[bool] = False
+    is_superuser: Optional[bool] = False
+    version: int = 1
+
+    class Config:  # noqa: WPS306
+        orm_mode = True
+        frozen = True
@@ -0,0 +1,94 @@
+"""Production server: gunicorn managing uvicorn worker processes.
+
+Run it with ``python -m app.server``. WEB_CONCURRENCY workers (the CPU
+count by default) are forked from a master that has already imported
+the application, so they share its modules copy-on-write, and each one
+drops the database connections it inherited. Uvicorn uses uvloop and
+httptools when they are installed.
+
+Each worker keeps its own ban index and recent reports, current with
+the writes of the others through the item events of the Postgres bus.
+On the local bus, the default for SQLite, a worker only sees its own
+writes and the server warns when it starts more than one.
+
+The listening socket is bound with SO_REUSEPORT. SIGHUP replaces the
+workers gracefully with the preloaded code; to deploy new code send
+SIGUSR2, which starts a new master next to the old one, then SIGQUIT
+to the old master once the new workers answer.
+"""
+import logging
+from typing import Any, Dict
+
+from gunicorn.app.base import BaseApplication  # type: ignore [import]
+from uvicorn.workers import UvicornWorker
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Worker(UvicornWorker):
+    """Uvicorn worker preferring uvloop and httptools."""
+
+    CONFIG_KWARGS = {"loop": "auto", "http": "auto", "lifespan": "on"}  # noqa: WPS115
+
+
+class Server(BaseApplication):
+    """Gunicorn application configured from a dict instead of argv."""
+
+    def __init__(self, options: Dict[str, Any]) -> None:
+        """Configure the server.
+
+        Args:
+            options (Dict[str, Any]): gunicorn settings
+        """
+        self._options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Apply the settings."""
+        for option, option_value in self._options.items():
+            self.cfg.set(option, option_value)
+
+    def load(self) -> Any:
+        """Import the application, once in the master when preloading."""
+        from app.main import app  # noqa: WPS433
+
+        return app
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Give the new worker its own database connections."""
+    from app.db.session import dispose_after_fork  # noqa: WPS433
+
+    dispose_after_fork()
+
+
+def server_options() -> Dict[str, Any]:
+    """Return the gunicorn settings built from the WEB_* settings."""
+    return {
+        "bind": settings.WEB_BIND,
+        "workers": settings.WEB_CONCURRENCY,
+        "worker_class": "app.server.Worker",
+        "preload_app": True,
+        "reuse_port": True,
+        "graceful_timeout": settings.WEB_GRACEFUL_TIMEOUT,
+        "keepalive": settings.WEB_KEEPALIVE,
+        "post_fork": post_fork,
+    }
+
+
+def main() -> None:
+    """Run the server until it is told to stop."""
+    if settings.WEB_CONCURRENCY > 1 and settings.EVENTS_BUS != "postgres":
+        logger.warning(
+            "{0} workers on the {1} bus only see their own item writes".format(
+                settings.WEB_CONCURRENCY,
+                settings.EVENTS_BUS,
+            ),
+        )
+    Server(server_options()).run()
+
+
+if __name__ == "__main__":
+    main()
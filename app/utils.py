@@ -1,14 +1,10 @@
 import logging
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Any, Dict, Optional
 
-import emails  # type: ignore [import]
-from emails.template import JinjaTemplate  # type: ignore [import]
-from jose import jwt
-from jose.exceptions import JWTError
-
 from app.core.config import settings
+from app.core.mailer import mailer
+from app.core.tokens import TokenError, token_service
 
 KEMAIL = "email"
 
@@ -51,60 +47,38 @@ def ensure_str(valor: Optional[str], emsg: str) -> str:
 
 def send_email(
     email_to: str,
-    subject_template: str = "",
-    html_template: str = "",
-    environment: Optional[Dict[str, Any]] = None,
+    subject: str,
+    template: str,
+    environment: Dict[str, Any],
 ) -> None:
-    """Send an email."""
+    """Queue an email for the background mailer."""
     assert (  # noqa: S101
         settings.EMAILS_ENABLED
     ), "no provided configuration for email variables"
-    if environment is None:
-        environment = {}
-    message = emails.Message(
-        subject=JinjaTemplate(subject_template),
-        html=JinjaTemplate(html_template),
-        mail_from=(settings.EMAILS_FROM_NAME, settings.EMAILS_FROM_EMAIL),
-    )
-    smtp_options = {"host": settings.SMTP_HOST, "port": settings.SMTP_PORT}
-    if settings.SMTP_TLS:
-        smtp_options["tls"] = True
-    if settings.SMTP_USER:
-        smtp_options["user"] = settings.SMTP_USER
-    if settings.SMTP_PASSWORD:
-        smtp_options["password"] = settings.SMTP_PASSWORD
-    response = message.send(to=email_to, render=environment, smtp=smtp_options)
-    logging.info("send email result: {0}".format(response))
+    if not mailer.send(email_to, subject, template, environment):
+        logging.warning("email to {0} dropped, mailer busy".format(email_to))
 
 
 def send_test_email(email_to: str) -> None:
     """Send test email."""
-    project_name = settings.PROJECT_NAME
-    subject = "{0} - Test email".format(project_name)
-    with open(Path(settings.EMAIL_TEMPLATES_DIR) / "test_email.html") as ff:
-        template_str = ff.read()
     send_email(
         email_to=email_to,
-        subject_template=subject,
-        html_template=template_str,
+        subject="{0} - Test email".format(settings.PROJECT_NAME),
+        template="test_email.html",
         environment={"project_name": settings.PROJECT_NAME, KEMAIL: email_to},
     )
 
 
 def send_reset_password_email(email_to: str, email: str, token: str) -> None:
     """Send a reset password email."""
-    subject = "{0} - Password recovery for user {1}".format(
-        settings.PROJECT_NAME,
-        email,
-    )
-    with open(Path(settings.EMAIL_TEMPLATES_DIR) / "reset_password.html") as ff:
-        template_str = ff.read()
-    server_host = settings.SERVER_HOST
-    link = "{0}/reset-password?token={1}".format(server_host, token)
+    link = "{0}/reset-password?token={1}".format(settings.SERVER_HOST, token)
     send_email(
         email_to=email_to,
-        subject_template=subject,
-        html_template=template_str,
+        subject="{0} - Password recovery for user {1}".format(
+            settings.PROJECT_NAME,
+            email,
+        ),
+        template="reset_password.html",
         environment={
             "project_name": settings.PROJECT_NAME,
             "username": email,
@@ -117,21 +91,19 @@ def send_reset_password_email(email_to: str, email: str, token: str) -> None:
 
 def send_new_account_email(email_to: str, username: str, password: str) -> None:
     """Send a new account email."""
-    project_name = settings.PROJECT_NAME
-    subject = "{0} - New account for user {1}".format(project_name, username)
-    with open(Path(settings.EMAIL_TEMPLATES_DIR) / "new_account.html") as ff:
-        template_str = ff.read()
-    link = settings.SERVER_HOST
     send_email(
         email_to=email_to,
-        subject_template=subject,
-        html_template=template_str,
+        subject="{0} - New account for user {1}".format(
+            settings.PROJECT_NAME,
+            username,
+        ),
+        template="new_account.html",
         environment={
             "project_name": settings.PROJECT_NAME,
             "username": username,
             "password": password,
             KEMAIL: email_to,
-            "link": link,
+            "link": settings.SERVER_HOST,
         },
     )
 
@@ -141,22 +113,13 @@ def generate_password_reset_token(email: str) -> str:
     delta = timedelta(hours=settings.EMAIL_RESET_TOKEN_EXPIRE_HOURS)
     now = datetime.utcnow()
     expires = now + delta
-    exp = expires.timestamp()
-    return jwt.encode(
-        {"exp": exp, "nbf": now, "sub": email},
-        settings.SECRET_KEY,
-        algorithm="HS256",
-    )
+    return token_service().encode({"exp": expires, "nbf": now, "sub": email})
 
 
 def verify_password_reset_token(token: str) -> Optional[str]:
     """Verify password reset token."""
     try:
-        decoded_token = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=["HS256"],
-        )
-        return decoded_token[KEMAIL]
-    except JWTError:
+        decoded_token = token_service().decode(token)
+    except TokenError:
         return None
+    return decoded_token.get("sub")
@@ -0,0 +1,34 @@
+"""Fixtures of the micro-benchmarks, run with `make bench`.
+
+Point BENCH_DB_CONNECTION at a scratch Postgres database to benchmark it
+instead of a temporary SQLite file.
+"""
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+os.environ["DB_CONNECTION"] = os.environ.get(
+    "BENCH_DB_CONNECTION",
+    "sqlite:///{0}".format(Path(tempfile.mkdtemp(prefix="banned-bench-")) / "bench.db"),
+)
+
+KITEMS = 1000
+
+
+@pytest.fixture(scope="session")
+def owner_id() -> int:
+    """Seed the database, return the id of the superuser owning the items."""
+    from benchmarks.seed import seed_database  # noqa: WPS433
+
+    return seed_database(KITEMS)
+
+
+@pytest.fixture(scope="session")
+def loop():
+    """Event loop running the async code under benchmark."""
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
@@ -0,0 +1,44 @@
+"""Seed the benchmark database through init_db."""
+from sqlalchemy import func, insert, select
+
+from app import crud
+from app.core.config import settings
+from app.db.database import Base
+from app.db.init_db import init_db
+from app.db.session import SessionLocal, engine
+from app.models import Item
+
+
+def seed_database(items: int) -> int:
+    """Create the tables, the first superuser and up to `items` items.
+
+    Running it again on a seeded database only tops the items up.
+
+    Args:
+        items (int): number of items the database should hold
+
+    Returns:
+        int: id of the first superuser, who owns the items
+    """
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        init_db(db)
+        owner = crud.user.get_by_email(db, email=settings.FIRST_SUPERUSER)
+        owner_id = owner.id if owner else 1
+        existing = db.scalar(select(func.count()).select_from(Item)) or 0
+        rows = [
+            {
+                "title": "10.{0}.{1}.{2}".format(
+                    row >> 16 & 255,
+                    row >> 8 & 255,
+                    row & 255,
+                ),
+                "description": "sshd",
+                "owner_id": owner_id,
+            }
+            for row in range(existing, items)
+        ]
+        if rows:
+            db.execute(insert(Item), rows)
+            db.commit()
+    return int(owner_id or 1)
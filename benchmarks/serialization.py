@@ -0,0 +1,94 @@
+"""Compare the per-row cost of the two list response serialisations.
+
+Usage::
+
+    python -m benchmarks.serialization --rows 100 --rounds 200
+
+"response_model" is what FastAPI does for `List[schemas.Item]` with
+`orm_mode`: load ORM objects, validate one pydantic model per row, run
+jsonable_encoder and json.dumps. "fast_json" is the FAST_JSON_RESPONSES
+path: a column tuple query rendered by orjson. Both include the query,
+against an in-memory SQLite database. Results are printed as JSON.
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import parse_obj_as
+from sqlalchemy import Engine, create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app import schemas
+from app.api.fastjson import item_rows
+from app.db.database import Base
+from app.models import Item
+from benchmarks.stats import percentiles
+
+KMICROS = 1000000
+
+
+def build_engine(rows: int) -> Engine:
+    """Return an in-memory database holding `rows` items."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Item),
+            [
+                {"title": "10.0.{0}.{1}".format(row >> 8, row & 255), "owner_id": 1}
+                for row in range(rows)
+            ],
+        )
+    return engine
+
+
+def response_model(db: Session, rows: int) -> bytes:
+    """Serialise a page the way `response_model` does."""
+    articulos = db.scalars(select(Item).order_by(Item.id).limit(rows)).all()
+    validated = parse_obj_as(List[schemas.Item], articulos)
+    db.expunge_all()
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def fast_json(db: Session, rows: int) -> bytes:
+    """Serialise a page the way FAST_JSON_RESPONSES does."""
+    stmt = select(*item_rows.columns).order_by(Item.id).limit(rows)
+    return bytes(item_rows.response(db.execute(stmt).all()).body)
+
+
+def run(rows: int, rounds: int) -> Dict[str, Any]:
+    """Time both serialisations of a page of `rows` items."""
+    engine = build_engine(rows)
+    report: Dict[str, Any] = {"rows": rows, "rounds": rounds}
+    paths: Dict[str, Callable[[Session, int], bytes]] = {
+        "response_model": response_model,
+        "fast_json": fast_json,
+    }
+    with Session(engine) as db:
+        for name, render in paths.items():
+            samples = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                render(db, rows)
+                samples.append(time.perf_counter() - started)
+            report[name] = {
+                "page": percentiles(samples),
+                "per_row_us": round(min(samples) / rows * KMICROS, 2),
+            }
+    return report
+
+
+def main() -> None:
+    """Parse the command line and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.rounds), indent=2))  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""Latency statistics shared by the benchmark scripts."""
+import statistics
+from typing import Dict, List
+
+KMILLIS = 1000
+KPERCENTILES = (50, 95, 99)
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """Return p50/p95/p99 of latency samples (seconds) in milliseconds."""
+    cuts = statistics.quantiles(samples, n=100)
+    return {
+        "p{0}_ms".format(rank): round(cuts[rank - 1] * KMILLIS, 3)
+        for rank in KPERCENTILES
+    }
@@ -0,0 +1,101 @@
+"""Micro-benchmarks of the per-request building blocks.
+
+Run with ``make bench`` or ``pytest benchmarks --no-cov``; pass
+``--benchmark-autosave`` and ``--benchmark-compare`` to keep and compare
+results between commits.
+"""
+from typing import Any
+
+import pytest
+
+from app import crud, schemas
+from app.api import deps
+from app.core import auth_cache, security
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, SessionLocal
+from app.utils import ensure_int
+
+KROUNDS_BCRYPT = 5
+
+
+@pytest.fixture(scope="module")
+def token(owner_id: int) -> str:
+    """Access token of the superuser."""
+    return security.create_access_token(owner_id)
+
+
+def test_create_access_token(benchmark, owner_id):
+    """Benchmark JWT encoding."""
+    benchmark(security.create_access_token, owner_id)
+
+
+def test_verify_password(benchmark):
+    """Benchmark one bcrypt verification, the cost of a login."""
+    hashed = security.get_password_hash(settings.FIRST_SUPERUSER_PASSWORD)
+    benchmark.pedantic(
+        security.verify_password,
+        args=(settings.FIRST_SUPERUSER_PASSWORD, hashed),
+        rounds=KROUNDS_BCRYPT,
+    )
+
+
+def test_get_password_hash(benchmark):
+    """Benchmark one bcrypt hash, the cost of a password change."""
+    benchmark.pedantic(
+        security.get_password_hash,
+        args=(settings.FIRST_SUPERUSER_PASSWORD,),
+        rounds=KROUNDS_BCRYPT,
+    )
+
+
+@pytest.mark.parametrize("cached", [True, False])
+def test_get_current_user(benchmark, loop, token, cached):
+    """Benchmark the authentication dependency with and without its caches."""
+
+    async def current_user() -> schemas.UserSnapshot:  # noqa: WPS430
+        async with AsyncSessionLocal() as db:
+            return await deps.get_current_user(db, token)
+
+    def clear_caches() -> None:  # noqa: WPS430
+        if not cached:
+            auth_cache.token_cache.clear()
+            auth_cache.user_cache.clear()
+
+    loop.run_until_complete(current_user())
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(current_user()),
+        setup=clear_caches,
+        rounds=200,
+    )
+
+
+def test_crud_get(benchmark, owner_id):
+    """Benchmark CRUDBase.get by primary key."""
+    with SessionLocal() as db:
+        benchmark(lambda: _fresh(db, crud.citem.get(db, iid=1)))
+
+
+def test_crud_get_multi(benchmark, owner_id):
+    """Benchmark CRUDBase.get_multi of a 100 item page."""
+    with SessionLocal() as db:
+        benchmark(lambda: _fresh(db, crud.citem.get_multi(db, limit=100)))
+
+
+def test_crud_create_update_remove(benchmark, owner_id):
+    """Benchmark a create, update and remove cycle of one item."""
+    item_in = schemas.ItemCreate(title="198.51.100.1", description="bench")
+    item_update = schemas.ItemUpdate(description="updated")
+
+    def cycle() -> None:  # noqa: WPS430
+        db_obj = crud.citem.create_with_owner(db, obj_in=item_in, owner_id=owner_id)
+        db_obj = crud.citem.update(db, db_obj=db_obj, obj_in=item_update)
+        crud.citem.remove(db, iid=ensure_int(db_obj.id, "item.id is None"))
+
+    with SessionLocal() as db:
+        benchmark(cycle)
+
+
+def _fresh(db: Any, loaded: Any) -> Any:
+    # forget the loaded objects so that every round hits the database
+    db.expunge_all()
+    return loaded
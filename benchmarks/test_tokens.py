@@ -0,0 +1,75 @@
+"""Encode and decode throughput of the token backends.
+
+The jose_raw cases hand python-jose the secret string, as the code did
+before app.core.tokens, so the key is parsed again on every call.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, Tuple
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jose import jwt as jose_jwt
+
+from app.core.tokens import BACKENDS, TokenService
+
+KSECRET = "benchmark-secret-long-enough-for-hs256"
+
+
+def _pems(private_key: Any) -> Tuple[str, str]:
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return public_pem.decode(), private_pem
+
+
+KEYS: Dict[str, Tuple[str, str]] = {  # noqa: WPS407
+    "HS256": (KSECRET, KSECRET),
+    "ES256": _pems(ec.generate_private_key(ec.SECP256R1())),
+    "EdDSA": _pems(ed25519.Ed25519PrivateKey.generate()),
+}
+CASES = (  # noqa: WPS407
+    ("jose", "HS256"),
+    ("jose", "ES256"),
+    ("pyjwt", "HS256"),
+    ("pyjwt", "ES256"),
+    ("pyjwt", "EdDSA"),
+)
+
+
+def _claims() -> Dict[str, Any]:
+    return {"sub": "1", "exp": datetime.utcnow() + timedelta(hours=1)}
+
+
+@pytest.mark.parametrize(("backend", "algorithm"), CASES)
+def test_encode(benchmark, backend, algorithm):
+    """Sign one access token."""
+    service = TokenService(BACKENDS[backend](), algorithm, *KEYS[algorithm])
+    claims = _claims()
+    benchmark(service.encode, claims)
+
+
+@pytest.mark.parametrize(("backend", "algorithm"), CASES)
+def test_decode(benchmark, backend, algorithm):
+    """Verify one access token."""
+    service = TokenService(BACKENDS[backend](), algorithm, *KEYS[algorithm])
+    token = service.encode(_claims())
+    benchmark(service.decode, token)
+
+
+def test_encode_jose_raw(benchmark):
+    """Sign with python-jose from the secret string."""
+    claims = _claims()
+    benchmark(jose_jwt.encode, claims, KSECRET, algorithm="HS256")
+
+
+def test_decode_jose_raw(benchmark):
+    """Verify with python-jose from the secret string."""
+    token = jose_jwt.encode(_claims(), KSECRET, algorithm="HS256")
+    benchmark(jose_jwt.decode, token, KSECRET, algorithms=["HS256"])
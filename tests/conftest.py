@@ -0,0 +1,50 @@
+"""Test module config for the banned api."""
+import os
+import tempfile
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+TEST_DB_DIR = Path(tempfile.mkdtemp(prefix="banned-tests-"))
+
+os.environ.setdefault(
+    "DB_CONNECTION",
+    "sqlite:///{0}".format(TEST_DB_DIR / "test.db"),
+)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client on a freshly initialized database."""
+    from fastapi.testclient import TestClient  # noqa: WPS433
+
+    from app import models  # noqa: F401, WPS433
+    from app.db.database import Base  # noqa: WPS433
+    from app.db.init_db import init_db  # noqa: WPS433
+    from app.db.session import SessionLocal, engine  # noqa: WPS433
+    from app.main import app  # noqa: WPS433
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        init_db(db)
+    with TestClient(app) as test_client:
+        yield test_client
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="session")
+def superuser_headers(client):
+    """Fixture to create access headers for the first superuser."""
+    from app.core.config import settings  # noqa: WPS433
+
+    response = client.post(
+        "{0}/login/access-token".format(settings.API_V1_STR),
+        data={
+            "username": settings.FIRST_SUPERUSER,
+            "password": settings.FIRST_SUPERUSER_PASSWORD,
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    access_token = response.json()["access_token"]
+    return {"Authorization": "Bearer {0}".format(access_token)}
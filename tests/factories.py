@@ -0,0 +1,18 @@
+from http import HTTPStatus
+from typing import Any, Dict
+
+from app.core.config import settings
+
+ITEMS_URL = "{0}/items/".format(settings.API_V1_STR)
+KID = "id"
+
+
+def create_item(client, headers, title: str = "192.0.2.1") -> Dict[str, Any]:
+    """Create an item through the api and return its json representation."""
+    response = client.post(
+        ITEMS_URL,
+        headers=headers,
+        json={"title": title, "description": "sshd"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    return response.json()
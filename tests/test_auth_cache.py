@@ -0,0 +1,45 @@
+from app.core import auth_cache
+from app.core.config import settings
+from app.utils import generate_password_reset_token
+from tests.test_metrics import parse_samples
+
+USERS_URL = "{0}/users/".format(settings.API_V1_STR)
+USERS_ME_URL = "{0}me".format(USERS_URL)
+
+
+def test_user_update_reaches_the_next_request(client, superuser_headers):
+    """Function test_user_update_reaches_the_next_request."""
+    me = client.get(USERS_ME_URL, headers=superuser_headers).json()
+    assert auth_cache.user_cache.peek(me["id"]) is not None
+    client.put(
+        "{0}{1}".format(USERS_URL, me["id"]),
+        headers=superuser_headers,
+        json={"full_name": "Renamed Admin"},
+    )
+    renamed = client.get(USERS_ME_URL, headers=superuser_headers).json()
+    assert renamed["full_name"] == "Renamed Admin"
+    assert renamed["version"] > me["version"]
+
+
+def test_password_reset_evicts_the_user(client, superuser_headers):
+    """Function test_password_reset_evicts_the_user."""
+    me = client.get(USERS_ME_URL, headers=superuser_headers).json()
+    response = client.post(
+        "{0}/reset-password/".format(settings.API_V1_STR),
+        json={
+            "token": generate_password_reset_token(settings.FIRST_SUPERUSER),
+            "new_password": settings.FIRST_SUPERUSER_PASSWORD,
+        },
+    )
+    assert response.json()["msg"] == "Password updated successfully"
+    assert auth_cache.user_cache.peek(me["id"]) is None
+    assert client.get(USERS_ME_URL, headers=superuser_headers).json() == me
+
+
+def test_cache_counters_are_exported(client, superuser_headers):
+    """Function test_cache_counters_are_exported."""
+    client.get(USERS_ME_URL, headers=superuser_headers)
+    samples = parse_samples(client.get("/metrics").text)
+    assert samples['auth_cache_hits{cache="token"}'] >= 1
+    assert samples['auth_cache_size{cache="user"}'] >= 1
+    assert 'auth_cache_misses{cache="user"}' in samples
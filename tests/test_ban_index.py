@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from ipaddress import ip_address
+from typing import List, Optional
+
+from app.core.ban_index import BanIndex
+from tests.factories import ITEMS_URL, KID, create_item
+
+LOOKUP_URL = "{0}lookup".format(ITEMS_URL)
+KEXPIRES_AT = datetime.fromisoformat("2026-01-01T00:00:00")
+
+
+def test_cidr_and_host_matches():
+    """Function test_cidr_and_host_matches."""
+    index = BanIndex()
+    index.put(1, 1, "10.0.0.0/8")
+    index.put(2, 1, "10.1.2.3")
+    index.put(3, 2, "2001:db8::/32")
+    index.put(4, 1, "not an address")
+    assert _matching(index, "10.1.2.3") == [2, 1]
+    assert _matching(index, "10.9.9.9") == [1]
+    assert _matching(index, "2001:db8::1") == [3]
+    assert _matching(index, "::ffff:10.1.2.3") == [2, 1]
+    assert not _matching(index, "192.0.2.1")
+
+
+def test_update_and_discard():
+    """Function test_update_and_discard."""
+    index = BanIndex()
+    index.put(1, 1, "192.0.2.0/24")
+    index.put(1, 1, "198.51.100.7")
+    assert not _matching(index, "192.0.2.1")
+    index.discard(1)
+    assert not _matching(index, "198.51.100.7")
+    assert not len(index)
+
+
+def test_expired_entries_are_skipped():
+    """Function test_expired_entries_are_skipped."""
+    index = BanIndex()
+    index.put(1, 1, "192.0.2.0/24", KEXPIRES_AT)
+    before = KEXPIRES_AT - timedelta(seconds=1)
+    assert _matching(index, "192.0.2.1", before) == [1]
+    assert not _matching(index, "192.0.2.1", KEXPIRES_AT)
+
+
+def test_lookup_endpoints(client, superuser_headers):
+    """Function test_lookup_endpoints."""
+    created = create_item(client, superuser_headers, "203.0.113.128/25")
+    response = client.get(
+        LOOKUP_URL,
+        params={"addr": "203.0.113.200"},
+        headers=superuser_headers,
+    )
+    assert response.json()["matches"][0][KID] == created[KID]
+
+    client.delete("{0}{1}".format(ITEMS_URL, created[KID]), headers=superuser_headers)
+    response = client.post(
+        LOOKUP_URL,
+        json={"addrs": ["203.0.113.200", "2001:db8::1"]},
+        headers=superuser_headers,
+    )
+    assert [row["banned"] for row in response.json()] == [False, False]
+
+    response = client.get(
+        LOOKUP_URL,
+        params={"addr": "nope"},
+        headers=superuser_headers,
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def _matching(
+    index: BanIndex,
+    address: str,
+    now: Optional[datetime] = None,
+) -> List[int]:
+    return [entry.item_id for entry in index.lookup(ip_address(address), now)]
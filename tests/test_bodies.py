@@ -0,0 +1,30 @@
+from http import HTTPStatus
+
+from app.core.config import settings
+from tests.factories import ITEMS_URL
+
+KBULK_URL = "{0}bulk".format(ITEMS_URL)
+
+
+def test_declared_length_is_capped(client, superuser_headers, monkeypatch):
+    """Function test_declared_length_is_capped."""
+    monkeypatch.setattr(settings, "ITEMS_BULK_MAX", value=1)
+    monkeypatch.setattr(settings, "ITEMS_BULK_ROW_BYTES", value=8)
+    response = client.post(
+        KBULK_URL,
+        headers=superuser_headers,
+        json=[{"title": "192.0.2.212"}],
+    )
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+def test_streamed_body_is_capped(client, superuser_headers, monkeypatch):
+    """Function test_streamed_body_is_capped."""
+    monkeypatch.setattr(settings, "ITEMS_BULK_MAX", value=1)
+    monkeypatch.setattr(settings, "ITEMS_BULK_ROW_BYTES", value=8)
+    response = client.post(
+        KBULK_URL,
+        headers={**superuser_headers, "Content-Type": "application/x-ndjson"},
+        content=(line for line in (b'{"title": ', b'"192.0.2.213"}\n')),
+    )
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
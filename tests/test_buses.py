@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, List, Tuple
+
+from app.core.buses import PostgresNotifier
+from app.core.events import KUPSERT
+from app.crud.item_sync import item_event
+
+KCHANNEL = "item_events"
+
+
+class Connection(object):
+    """asyncpg connection recording the statements, held until released."""
+
+    def __init__(self) -> None:
+        """Start with nothing sent."""
+        self.sent: List[Tuple[str, str]] = []
+        self.released = asyncio.Event()
+
+    async def executemany(self, query: str, args: List[Tuple[str, str]]) -> None:
+        """Record the notifications once released."""
+        await self.released.wait()
+        self.sent.extend(args)
+
+    async def close(self) -> None:
+        """Nothing to close."""
+
+
+class FakeAsyncpg(object):
+    """The asyncpg module, connecting to `connection`."""
+
+    def __init__(self, connection: Connection) -> None:
+        """Connect to the given connection."""
+        self.connection = connection
+
+    async def connect(self, dsn: str) -> Any:
+        """Return the connection."""
+        return self.connection
+
+
+def test_notify_does_not_wait_for_postgres():
+    """Function test_notify_does_not_wait_for_postgres."""
+    assert asyncio.run(_notify_twice()) == [0, 3]
+
+
+async def _notify_twice() -> List[int]:
+    connection = Connection()
+    notifier = PostgresNotifier("postgresql://db/banned", KCHANNEL, queue_size=10)
+    notifier.start(FakeAsyncpg(connection))
+    # queued while postgres does not answer
+    for iid in (1, 2, 3):
+        notifier.notify([item_event(KUPSERT, iid, 1, "198.51.100.1")])
+    await asyncio.sleep(0)
+    sent = [len(connection.sent)]
+    connection.released.set()
+    await notifier.stop()
+    sent.append(len(connection.sent))
+    return sent
@@ -0,0 +1,36 @@
+from app.core.cache import TTLCache
+
+
+class FakeClock(object):
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now: float = 0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+def test_entries_expire():
+    """Function test_entries_expire."""
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10, timer=clock)
+    cache.set("token", 1)
+    cache.set("short", 2, ttl=1)
+    clock.now = 5
+    assert cache.get("token") == 1
+    assert cache.get("short") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_least_recently_used_is_evicted():
+    """Function test_least_recently_used_is_evicted."""
+    cache: TTLCache[int, int] = TTLCache(maxsize=2, ttl=10)
+    cache.set(1, 1)
+    cache.set(2, 2)
+    cache.get(1)
+    cache.set(3, 3)
+    assert cache.get(2) is None
+    assert cache.get(1) == 1
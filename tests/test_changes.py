@@ -0,0 +1,47 @@
+from http import HTTPStatus
+
+from app.api.reaper import reaper
+from app.core.config import settings
+from tests.factories import ITEMS_URL, KID, create_item
+
+CHANGES_URL = "{0}changes".format(ITEMS_URL)
+KVERSION = "version"
+
+
+def test_change_feed(client, superuser_headers, monkeypatch):
+    """Function test_change_feed."""
+    monkeypatch.setattr(settings, "ITEMS_CHANGES_SETTLE_SECONDS", value=0)
+    since = _changes(client, superuser_headers, 0).json()[KVERSION]
+    kept = create_item(client, superuser_headers, "198.51.100.61")
+    dropped = create_item(client, superuser_headers, "198.51.100.62")
+    item_url = "{0}{1}".format(ITEMS_URL, kept[KID])
+    client.put(item_url, headers=superuser_headers, json={"description": "ftp"})
+    client.delete("{0}{1}".format(ITEMS_URL, dropped[KID]), headers=superuser_headers)
+
+    changes = _changes(client, superuser_headers, since).json()
+    assert [row[KID] for row in changes["items"]] == [kept[KID]]
+    assert changes["items"][0]["description"] == "ftp"
+    assert changes["deleted"] == [dropped[KID]]
+    assert not _changes(client, superuser_headers, changes[KVERSION]).json()["items"]
+
+
+def test_compacted_changes_are_gone(client, superuser_headers, monkeypatch):
+    """Function test_compacted_changes_are_gone."""
+    monkeypatch.setattr(settings, "ITEMS_CHANGES_SETTLE_SECONDS", value=0)
+    since = _changes(client, superuser_headers, 0).json()[KVERSION]
+    dropped = create_item(client, superuser_headers, "198.51.100.63")
+    client.delete("{0}{1}".format(ITEMS_URL, dropped[KID]), headers=superuser_headers)
+    monkeypatch.setattr(reaper, "retention", 0)
+    assert client.portal.call(reaper.compact) >= 2
+    response = _changes(client, superuser_headers, since)
+    assert response.status_code == HTTPStatus.GONE
+    response = _changes(client, superuser_headers, response.json()[KVERSION])
+    assert response.status_code == HTTPStatus.OK
+
+
+def _changes(client, headers, since: int):
+    return client.get(
+        CHANGES_URL,
+        headers=headers,
+        params={"since": since, "limit": settings.ITEMS_CHANGES_LIMIT},
+    )
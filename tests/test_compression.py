@@ -0,0 +1,70 @@
+import json
+import types
+import zlib
+from http import HTTPStatus
+
+import pytest
+from starlette.datastructures import Headers
+
+from app.api.compression import compressible
+from app.api.negotiation import negotiate
+from app.core.codecs import KGZIP_WBITS, GzipEncoder
+from tests.factories import ITEMS_URL, create_item
+
+GZIP = types.MappingProxyType({"Accept-Encoding": "gzip"})
+KCONTENT_ENCODING = "content-encoding"
+KFIRST_HOST = 120
+
+
+def test_large_list_is_gzipped(client, superuser_headers):
+    """Function test_large_list_is_gzipped."""
+    for host in range(10):
+        create_item(client, superuser_headers, "198.51.100.{0}".format(100 + host))
+    response = client.get(ITEMS_URL, headers={**superuser_headers, **GZIP})
+    assert response.headers[KCONTENT_ENCODING] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert len(response.json()) >= 10
+    cached = {**superuser_headers, **GZIP, "If-None-Match": response.headers["etag"]}
+    assert client.get(ITEMS_URL, headers=cached).status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_revalidation_keeps_the_gzip_tag(client, superuser_headers):
+    """Function test_revalidation_keeps_the_gzip_tag."""
+    for host in range(KFIRST_HOST, KFIRST_HOST + 10):
+        create_item(client, superuser_headers, "198.51.100.{0}".format(host))
+    tag = client.get(ITEMS_URL, headers={**superuser_headers, **GZIP}).headers["etag"]
+    cached = {**superuser_headers, **GZIP, "If-None-Match": tag}
+    response = client.get(ITEMS_URL, headers=cached)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["etag"] == tag
+
+
+def test_small_and_event_stream_bodies_are_not(client):
+    """Function test_small_and_event_stream_bodies_are_not."""
+    response = client.get("/", headers=GZIP)
+    assert KCONTENT_ENCODING not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert not compressible(Headers({"content-type": "text/event-stream"}))
+    assert negotiate("gzip;q=0.5, br;q=0.9, zstd;q=0", ["zstd", "br", "gzip"]) == "br"
+
+
+def test_streamed_chunks_decode_as_sent():
+    """Function test_streamed_chunks_decode_as_sent."""
+    encoder = GzipEncoder()
+    decoder = zlib.decompressobj(KGZIP_WBITS)
+    for chunk in (b'{"id": 1}\n', b'{"id": 2}\n'):
+        assert decoder.decompress(encoder.compress(chunk)) == chunk
+    decoder.decompress(encoder.finish())
+    assert decoder.eof
+
+
+def test_msgpack_item_list(client, superuser_headers):
+    """Function test_msgpack_item_list."""
+    msgpack = pytest.importorskip("msgpack")
+    create_item(client, superuser_headers, "198.51.100.99")
+    expected = client.get(ITEMS_URL, headers=superuser_headers)
+    accept = {"Accept": "application/msgpack, application/json;q=0.5"}
+    response = client.get(ITEMS_URL, headers={**superuser_headers, **accept})
+    assert response.headers["content-type"] == "application/msgpack"
+    assert response.headers["etag"] != expected.headers["etag"]
+    assert msgpack.unpackb(response.content) == json.loads(expected.content)
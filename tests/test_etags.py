@@ -0,0 +1,55 @@
+from http import HTTPStatus
+
+from app.core.config import settings
+from tests.factories import ITEMS_URL, KID, create_item
+
+KETAG = "ETag"
+USERS_ME_URL = "{0}/users/me".format(settings.API_V1_STR)
+
+
+def test_item_conditional_get(client, superuser_headers):
+    """Function test_item_conditional_get."""
+    created = create_item(client, superuser_headers, "198.51.100.81")
+    item_url = "{0}{1}".format(ITEMS_URL, created[KID])
+    tag = client.get(item_url, headers=superuser_headers).headers[KETAG]
+    response = client.get(item_url, headers={**superuser_headers, "If-None-Match": tag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert not response.content
+    # a repeated report with a new description is written
+    client.post(
+        ITEMS_URL,
+        headers=superuser_headers,
+        json={"title": "198.51.100.81", "description": "ftp"},
+    )
+    response = client.get(item_url, headers={**superuser_headers, "If-None-Match": tag})
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["version"] == created["version"] + 1
+
+
+def test_item_if_match(client, superuser_headers):
+    """Function test_item_if_match."""
+    created = create_item(client, superuser_headers, "198.51.100.82")
+    item_url = "{0}{1}".format(ITEMS_URL, created[KID])
+    tag = client.get(item_url, headers=superuser_headers).headers[KETAG]
+    response = _put(client, item_url, {**superuser_headers, "If-Match": tag})
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers[KETAG] != tag
+    response = _put(client, item_url, {**superuser_headers, "If-Match": tag})
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+
+
+def test_list_and_user_conditional_get(client, superuser_headers):
+    """Function test_list_and_user_conditional_get."""
+    tag = client.get(ITEMS_URL, headers=superuser_headers).headers[KETAG]
+    cached = {**superuser_headers, "If-None-Match": "W/{0}".format(tag)}
+    response = client.get(ITEMS_URL, headers=cached)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    create_item(client, superuser_headers, "198.51.100.83")
+    assert client.get(ITEMS_URL, headers=cached).status_code == HTTPStatus.OK
+    tag = client.get(USERS_ME_URL, headers=superuser_headers).headers[KETAG]
+    response = client.get(USERS_ME_URL, headers={**cached, "If-None-Match": tag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def _put(client, item_url: str, headers):
+    return client.put(item_url, headers=headers, json={"description": "smtp"})
@@ -0,0 +1,17 @@
+from tests.factories import ITEMS_URL, KID, create_item
+
+
+def test_export_items(client, superuser_headers):
+    """Function test_export_items."""
+    created = create_item(client, superuser_headers, "2001:db8::1")
+    response = client.get(
+        "{0}export?format=csv".format(ITEMS_URL),
+        headers=superuser_headers,
+    )
+    lines = response.text.splitlines()
+    assert lines[0] == "id,title,description,owner_id"
+    assert "{0},2001:db8::1,sshd,".format(created[KID]) in response.text
+
+    response = client.get("{0}export".format(ITEMS_URL), headers=superuser_headers)
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.count("\n") == len(lines) - 1
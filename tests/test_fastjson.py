@@ -0,0 +1,18 @@
+import pytest
+
+from app.core.config import settings
+from tests.factories import ITEMS_URL, create_item
+
+USERS_URL = "{0}/users/".format(settings.API_V1_STR)
+
+
+@pytest.mark.parametrize("url", [ITEMS_URL, USERS_URL])
+def test_fast_json_matches_response_model(client, superuser_headers, monkeypatch, url):
+    """Function test_fast_json_matches_response_model."""
+    create_item(client, superuser_headers, "198.51.100.0/24")
+    url = "{0}?limit=1".format(url)
+    expected = client.get(url, headers=superuser_headers)
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", value=True)
+    response = client.get(url, headers=superuser_headers)
+    assert response.json() == expected.json()
+    assert response.headers["X-Next-Cursor"] == expected.headers["X-Next-Cursor"]
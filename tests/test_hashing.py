@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from app.core import config
+from app.core.hashing import HashingBusyError, HashingService
+
+TPASSWORD = "correct horse battery staple"
+
+
+async def _round_trip(service: HashingService) -> bool:
+    hashed = await service.hash(TPASSWORD)
+    return await service.verify(TPASSWORD, hashed)
+
+
+async def _burst(service: HashingService) -> None:
+    await asyncio.gather(service.hash(TPASSWORD), service.hash(TPASSWORD))
+
+
+def test_hash_and_verify():
+    """Function test_hash_and_verify."""
+    service = HashingService(workers=1, queue_depth=1, retry_after=1)
+    assert asyncio.run(_round_trip(service))
+    service.shutdown()
+
+
+def test_full_queue_is_rejected():
+    """Function test_full_queue_is_rejected."""
+    service = HashingService(workers=0, queue_depth=1, retry_after=3)
+    with pytest.raises(HashingBusyError, match="queue is full"):
+        asyncio.run(_burst(service))
+
+
+def test_workers_share_the_cpus(monkeypatch):
+    """Function test_workers_share_the_cpus."""
+    monkeypatch.setattr(config, "cpu_count", lambda: 8)
+    assert config.Settings(WEB_CONCURRENCY=4).HASH_WORKERS == 2
+    assert config.Settings(WEB_CONCURRENCY=9).HASH_WORKERS == 1
+    assert config.Settings(WEB_CONCURRENCY=4, HASH_WORKERS=0).HASH_WORKERS == 0
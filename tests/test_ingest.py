@@ -0,0 +1,69 @@
+from http import HTTPStatus
+
+from app import crud
+from app.api.ingest import ingest_queue
+from app.core.config import settings
+from tests.factories import ITEMS_URL, KID
+
+KBAD_TITLE = "198.51.100.22"
+
+
+def test_write_behind(client, superuser_headers, monkeypatch):
+    """Function test_write_behind."""
+    monkeypatch.setattr(settings, "ITEMS_DURABLE_WRITES", value=False)
+    client.portal.call(ingest_queue.start)
+    receipts = []
+    for host in range(3):
+        response = client.post(
+            ITEMS_URL,
+            headers=superuser_headers,
+            json={"title": "198.51.100.{0}".format(host)},
+        )
+        assert response.status_code == HTTPStatus.ACCEPTED
+        receipts.append(response.json()["ingest_id"])
+    client.portal.call(ingest_queue.stop)
+    for ingest_id in receipts:
+        response = client.get(
+            "{0}ingest/{1}".format(ITEMS_URL, ingest_id),
+            headers=superuser_headers,
+        )
+        assert response.json()["status"] == "created"
+        articulo = client.get(
+            "{0}{1}".format(ITEMS_URL, response.json()[KID]),
+            headers=superuser_headers,
+        )
+        assert articulo.status_code == HTTPStatus.OK
+    # stopped queue, items are written synchronously again
+    response = client.post(
+        ITEMS_URL,
+        headers=superuser_headers,
+        json={"title": "198.51.100.9"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_failed_batch_is_retried_per_item(client, superuser_headers, monkeypatch):
+    """Function test_failed_batch_is_retried_per_item."""
+    create_owned = crud.acitem.create_owned
+
+    async def refuse_bad(db, *, owned, chunk_size):  # noqa: WPS430
+        if any(item_in.title == KBAD_TITLE for _, item_in in owned):
+            raise ValueError(KBAD_TITLE)
+        return await create_owned(db, owned=owned, chunk_size=chunk_size)
+
+    monkeypatch.setattr(settings, "ITEMS_DURABLE_WRITES", value=False)
+    monkeypatch.setattr(crud.acitem, "create_owned", refuse_bad)
+    client.portal.call(ingest_queue.start)
+    receipts = [
+        client.post(ITEMS_URL, headers=superuser_headers, json={"title": title})
+        for title in ("198.51.100.20", KBAD_TITLE, "198.51.100.21")
+    ]
+    client.portal.call(ingest_queue.stop)
+    statuses = [
+        client.get(
+            "{0}ingest/{1}".format(ITEMS_URL, receipt.json()["ingest_id"]),
+            headers=superuser_headers,
+        ).json()["status"]
+        for receipt in receipts
+    ]
+    assert statuses == ["created", "failed", "created"]
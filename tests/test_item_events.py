@@ -0,0 +1,43 @@
+from typing import Any, Dict, List
+
+from app.core.broadcaster import broadcaster
+from app.core.events import KDELETE, KUPSERT, Event
+from app.crud import recent
+from app.crud.item_sync import item_event
+from tests.factories import ITEMS_URL, KID, create_item
+
+LOOKUP_URL = "{0}lookup".format(ITEMS_URL)
+# an item written by another worker
+KREMOTE_ID = 90001
+KREMOTE_TITLE = "198.18.0.0/24"
+KVERSION = "version"
+
+
+def test_remote_writes_update_bans(client, superuser_headers):
+    """Function test_remote_writes_update_bans."""
+    _publish(client, item_event(KUPSERT, KREMOTE_ID, 1, KREMOTE_TITLE, version=1))
+    assert _banned_by(client, superuser_headers) == [KREMOTE_ID]
+    _publish(client, item_event(KDELETE, KREMOTE_ID, 1, KREMOTE_TITLE))
+    assert not _banned_by(client, superuser_headers)
+
+
+def test_remote_reports_drop_recent(client, superuser_headers):
+    """Function test_remote_reports_drop_recent."""
+    created = create_item(client, superuser_headers, "198.18.1.1")
+    key = (created["owner_id"], created["title"])
+    # its own event, heard back from the bus
+    iid, version = created[KID], created[KVERSION]
+    _publish(client, item_event(KUPSERT, iid, *key, version=version))
+    assert recent.recent_reports.peek(key) is not None
+    # another worker reported it again
+    _publish(client, item_event(KUPSERT, iid, *key, version=version + 1))
+    assert recent.recent_reports.peek(key) is None
+
+
+def _publish(client: Any, event: Event) -> None:
+    client.portal.call(broadcaster.publish, [event])
+
+
+def _banned_by(client: Any, headers: Dict[str, str]) -> List[int]:
+    response = client.get(LOOKUP_URL, params={"addr": "198.18.0.7"}, headers=headers)
+    return [match[KID] for match in response.json()["matches"]]
@@ -0,0 +1,113 @@
+from http import HTTPStatus
+from typing import List
+
+from app.crud import recent
+from tests.factories import ITEMS_URL, KID, create_item
+
+
+def test_create_and_update_item(client, superuser_headers):
+    """Function test_create_and_update_item."""
+    created = create_item(client, superuser_headers)
+    assert created["title"] == "192.0.2.1"
+
+    response = client.put(
+        "{0}{1}".format(ITEMS_URL, created[KID]),
+        headers=superuser_headers,
+        json={"description": "nginx"},
+    )
+    assert response.json()["description"] == "nginx"
+
+    response = client.get(ITEMS_URL, headers=superuser_headers)
+    assert created[KID] in {row[KID] for row in response.json()}
+
+
+def test_delete_item(client, superuser_headers):
+    """Function test_delete_item."""
+    item_url = "{0}{1}".format(
+        ITEMS_URL,
+        create_item(client, superuser_headers)[KID],
+    )
+    response = client.delete(item_url, headers=superuser_headers)
+    assert response.status_code == HTTPStatus.OK
+    response = client.get(item_url, headers=superuser_headers)
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_bulk_create_items(client, superuser_headers):
+    """Function test_bulk_create_items."""
+    response = client.post(
+        "{0}bulk".format(ITEMS_URL),
+        headers=superuser_headers,
+        json=[
+            {"title": "192.0.2.210"},
+            {"description": "no title"},
+            {"title": "192.0.2.210"},
+        ],
+    )
+    report = response.json()
+    assert (report["created"], report["failed"]) == (1, 1)
+    assert report["merged"] == 1
+    assert report["rows"][1]["error"].startswith("title")
+
+
+def test_bulk_create_items_ndjson(client, superuser_headers):
+    """Function test_bulk_create_items_ndjson."""
+    response = client.post(
+        "{0}bulk".format(ITEMS_URL),
+        headers={**superuser_headers, "Content-Type": "application/x-ndjson"},
+        content=b'{"title": "198.51.100.2"}\n{"title": "198.51.100.3"}\nnope\n',
+    )
+    report = response.json()
+    assert [row[KID] is not None for row in report["rows"]] == [
+        True,
+        True,
+        False,
+    ]
+
+
+def test_cursor_pagination(client, superuser_headers):
+    """Function test_cursor_pagination."""
+    for octet in (10, 11, 12):
+        create_item(client, superuser_headers, "203.0.113.{0}".format(octet))
+    seen: List[int] = []
+    url = "{0}?limit=2".format(ITEMS_URL)
+    while url:
+        response = client.get(url, headers=superuser_headers)
+        seen.extend(row[KID] for row in response.json())
+        url = response.links.get("next", {}).get("url")
+    assert seen == sorted(set(seen))
+    assert len(seen) >= 3
+
+
+def test_invalid_cursor(client, superuser_headers):
+    """Function test_invalid_cursor."""
+    response = client.get(
+        "{0}?after=bogus".format(ITEMS_URL),
+        headers=superuser_headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_repeated_reports_upsert(client, superuser_headers, monkeypatch):
+    """Function test_repeated_reports_upsert."""
+    first = create_item(client, superuser_headers, "192.0.2.200")
+    # found in the recent reports, counted by id
+    repeat = create_item(client, superuser_headers, "192.0.2.200")
+    assert (repeat[KID], repeat["hit_count"]) == (first[KID], 2)
+    monkeypatch.setattr(recent.recent_reports, "ttl", 0)
+    recent.recent_reports.clear()
+    again = create_item(client, superuser_headers, "192.0.2.200")
+    assert (again[KID], again["hit_count"]) == (first[KID], 3)
+    response = client.post(
+        "{0}bulk".format(ITEMS_URL),
+        headers=superuser_headers,
+        json=[{"title": "192.0.2.200"}, {"title": "192.0.2.200"}],
+    )
+    report = response.json()
+    assert {row[KID] for row in report["rows"]} == {first[KID]}
+    assert (report["created"], report["merged"]) == (0, 2)
+    response = client.get(
+        "{0}{1}".format(ITEMS_URL, first[KID]),
+        headers=superuser_headers,
+    )
+    assert response.json()["hit_count"] == 5
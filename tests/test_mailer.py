@@ -0,0 +1,88 @@
+import asyncio
+import socket
+from email import message_from_bytes
+from pathlib import Path
+from typing import Any, List, Set
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.handlers import Sink
+
+from app.core.config import settings
+from app.core.mailer import KTEMPLATES, mailer
+from app.utils import send_reset_password_email
+
+KHOST = "127.0.0.1"
+
+
+class Recorder(Sink):
+    """SMTP handler keeping the received messages and sessions."""
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self.messages: List[Any] = []
+        self.sessions: Set[int] = set()
+
+    async def handle_DATA(  # noqa: N802
+        self,
+        server: Any,
+        session: Any,
+        envelope: Any,
+    ) -> str:
+        """Record the message."""
+        self.messages.append(message_from_bytes(envelope.content))
+        self.sessions.add(id(session))
+        return "250 OK"
+
+
+@pytest.fixture()
+def smtp_server(tmp_path: Path, monkeypatch):
+    """Run a local SMTP server and point the mailer settings at it."""
+    write_templates(tmp_path)
+    recorder = Recorder()
+    controller = Controller(recorder, hostname=KHOST, port=free_port())
+    controller.start()
+    overrides = {
+        "EMAILS_ENABLED": True,
+        "EMAILS_FROM_EMAIL": "banned@example.com",
+        "EMAIL_TEMPLATES_DIR": str(tmp_path),
+        "SMTP_HOST": KHOST,
+        "SMTP_PORT": controller.port,
+        "SMTP_TLS": False,
+    }
+    for setting, setting_value in overrides.items():
+        monkeypatch.setattr(settings, setting, setting_value)
+    yield recorder
+    controller.stop()
+
+
+def test_reset_emails_share_a_connection(smtp_server):
+    """Function test_reset_emails_share_a_connection."""
+    asyncio.run(_send_resets(3))
+    assert len(smtp_server.messages) == 3
+    assert len(smtp_server.sessions) == 1
+    assert "reset-password?token=token-0" in smtp_server.messages[0].get_payload()
+
+
+async def _send_resets(count: int) -> None:
+    mailer.start()
+    for index in range(count):
+        send_reset_password_email(
+            "someone@example.com",
+            "someone@example.com",
+            "token-{0}".format(index),
+        )
+    await mailer.stop()
+
+
+def free_port() -> int:
+    """Return a TCP port nobody listens on."""
+    with socket.socket() as probe:
+        probe.bind((KHOST, 0))
+        return probe.getsockname()[1]
+
+
+def write_templates(directory: Path) -> None:
+    """Write minimal versions of the email templates."""
+    for name in KTEMPLATES:
+        (directory / name).write_text("<p>{{ project_name }}: {{ link }}</p>")
@@ -0,0 +1,59 @@
+from typing import Dict
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.metrics import Histogram, registry
+from app.db.instrument import instrument
+from tests.factories import ITEMS_URL
+
+
+def test_histogram_samples():
+    """Function test_histogram_samples."""
+    histogram = Histogram([1, 5])
+    for amount in (0.5, 1, 3, 9):
+        histogram.observe(amount)
+    assert histogram.samples("latency", 'route="/"') == [
+        'latency_bucket{route="/",le="1"} 2',
+        'latency_bucket{route="/",le="5"} 3',
+        'latency_bucket{route="/",le="+Inf"} 4',
+        'latency_sum{route="/"} 13.5',
+        'latency_count{route="/"} 4',
+    ]
+
+
+def test_metrics_endpoint(client, superuser_headers):
+    """Function test_metrics_endpoint."""
+    client.get(ITEMS_URL, headers=superuser_headers)
+    client.get("/no/such/page")
+    response = client.get("/metrics")
+    samples = parse_samples(response.text)
+    labels = 'method="GET",route="{0}"'.format(ITEMS_URL)
+    assert samples["http_request_duration_seconds_count{{{0}}}".format(labels)] >= 1
+    assert samples["http_request_queries_sum{{{0}}}".format(labels)] >= 1
+    assert 'route="<unmatched>"' in response.text
+    assert samples['db_pool_checkouts_total{engine="async"}'] >= 1
+
+
+def parse_samples(exposition: str) -> Dict[str, float]:
+    """Map the sample names, labels included, of an exposition to values."""
+    samples: Dict[str, float] = {}
+    for line in exposition.splitlines():
+        if not line.startswith("#"):
+            name, _, sample = line.rpartition(" ")
+            samples[name] = float(sample)
+    return samples
+
+
+def test_failed_statements_are_not_timed():
+    """Function test_failed_statements_are_not_timed."""
+    engine = create_engine("sqlite://")
+    instrument(engine)
+    before = sum(registry.statements.counts)
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+        conn.execute(text("SELECT 1"))
+        assert not conn.info
+    assert sum(registry.statements.counts) == before + 1
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+from sqlalchemy import update
+
+from app.api.reaper import Reaper, reaper
+from app.db.session import SessionLocal
+from app.models.item import Item
+from tests.factories import ITEMS_URL, KID
+
+
+def test_expired_items_are_hidden_and_reaped(client, superuser_headers):
+    """Function test_expired_items_are_hidden_and_reaped."""
+    response = client.post(
+        ITEMS_URL,
+        headers=superuser_headers,
+        json={"title": "192.0.2.250", "ttl": 3600},
+    )
+    created = response.json()
+    assert created["expires_at"] > created["created_at"]
+    _expire(created[KID])
+    item_url = "{0}{1}".format(ITEMS_URL, created[KID])
+    response = client.get(item_url, headers=superuser_headers)
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    response = client.get(ITEMS_URL, headers=superuser_headers)
+    assert created[KID] not in {row[KID] for row in response.json()}
+    assert client.portal.call(reaper.reap) == 1
+    response = client.get(
+        "{0}lookup".format(ITEMS_URL),
+        headers=superuser_headers,
+        params={"addr": "192.0.2.250"},
+    )
+    assert not response.json()["banned"]
+
+
+def test_unlimited_reaping_rate(client, superuser_headers):
+    """Function test_unlimited_reaping_rate."""
+    for host in (251, 252):
+        response = client.post(
+            ITEMS_URL,
+            headers=superuser_headers,
+            json={"title": "192.0.2.{0}".format(host), "ttl": 3600},
+        )
+        _expire(response.json()[KID])
+    unlimited = Reaper(interval=1, batch_size=1, rows_per_second=0, retention=1)
+    assert client.portal.call(unlimited.reap) == 2
+
+
+def _expire(iid: int) -> None:
+    past = datetime.utcnow() - timedelta(seconds=1)
+    stale = update(Item).where(Item.id == iid)
+    with SessionLocal() as db:
+        db.execute(stale.values(expires_at=past))
+        db.commit()
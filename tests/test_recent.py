@@ -0,0 +1,41 @@
+import pytest
+
+from app.crud import recent
+from tests.factories import ITEMS_URL, KID, create_item
+
+KCASES = ((True, "192.0.2.203", "192.0.2.204"), (False, "192.0.2.205", "192.0.2.206"))
+
+
+@pytest.mark.parametrize(("returning", "other_title", "title"), KCASES)
+def test_recent_report_rechecks_its_key(  # noqa: WPS211
+    client,
+    superuser_headers,
+    monkeypatch,
+    returning,
+    other_title,
+    title,
+):
+    """Function test_recent_report_rechecks_its_key."""
+    monkeypatch.setattr(
+        "app.crud.recent.supports_returning",
+        lambda db, statement: returning,
+    )
+    other = create_item(client, superuser_headers, other_title)
+    first = create_item(client, superuser_headers, title)
+    # a remembered id that no longer holds this owner's title
+    stale = recent.RecentReport(
+        id=other[KID],
+        description=None,
+        expires_at=None,
+        version=1,
+    )
+    recent.recent_reports.set((first["owner_id"], title), stale)
+    again = create_item(client, superuser_headers, title)
+    assert (again[KID], again["hit_count"]) == (first[KID], 2)
+    # found in the recent reports, counted by id
+    assert create_item(client, superuser_headers, title)["hit_count"] == 3
+    response = client.get(
+        "{0}{1}".format(ITEMS_URL, other[KID]),
+        headers=superuser_headers,
+    )
+    assert response.json()["hit_count"] == 1
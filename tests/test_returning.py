@@ -0,0 +1,65 @@
+from typing import Any, Callable, Dict, List
+
+import pytest
+from sqlalchemy import event
+
+from app import crud, schemas
+from app.db.session import SessionLocal, engine
+from app.utils import ensure_int
+
+
+def count_statements(action: Callable[[], Any]) -> int:
+    """Return the number of SQL statements the action sends to the database."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:  # noqa: WPS430
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:  # noqa: WPS501
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def write_round_trips() -> Dict[str, int]:
+    """Count the statements of one create, update and remove."""
+    created = []
+    with SessionLocal() as db:
+        trips = {
+            "create": count_statements(
+                lambda: created.append(
+                    crud.citem.create_with_owner(
+                        db,
+                        obj_in=schemas.ItemCreate(title="192.0.2.99"),
+                        owner_id=1,
+                    ),
+                ),
+            ),
+            "update": count_statements(
+                lambda: crud.citem.update(
+                    db,
+                    db_obj=created[0],
+                    obj_in={"description": "ssh"},
+                ),
+            ),
+        }
+        db.expunge_all()
+        iid = ensure_int(created[0].id, "item.id is None")
+        trips["remove"] = count_statements(lambda: crud.citem.remove(db, iid=iid))
+    return trips
+
+
+@pytest.mark.usefixtures("client")
+def test_writes_use_returning(monkeypatch):
+    """Function test_writes_use_returning."""
+    returning = write_round_trips()
+    monkeypatch.setattr(
+        "app.crud.base.supports_returning",
+        lambda db, statement: False,
+    )
+    fallback = write_round_trips()
+    # each write also appends its change log entry
+    assert returning == {"create": 2, "update": 2, "remove": 2}
+    assert fallback == {"create": 3, "update": 3, "remove": 3}
@@ -0,0 +1,22 @@
+from app.core.config import Settings
+from app.main import app
+from app.server import Server, server_options
+
+
+def test_server_configuration():
+    """Function test_server_configuration."""
+    server = Server({**server_options(), "workers": 3})
+    assert server.cfg.workers == 3
+    assert server.cfg.preload_app
+    assert server.cfg.reuse_port
+    assert server.cfg.worker_class_str == "app.server.Worker"
+    assert server.load() is app
+
+
+def test_postgres_deployments_share_the_events():
+    """Function test_postgres_deployments_share_the_events."""
+    postgres = Settings(DB_CONNECTION="postgresql+psycopg2://app@db/banned")
+    assert postgres.EVENTS_BUS == "postgres"
+    assert Settings(DB_CONNECTION="sqlite:///./banned.db").EVENTS_BUS == "local"
+    chosen = Settings(DB_CONNECTION="postgres://db", EVENTS_BUS="local")
+    assert chosen.EVENTS_BUS == "local"
@@ -0,0 +1,29 @@
+from sqlalchemy import create_engine, text
+
+from app.db.pool import TimedQueuePool
+from app.db.session import SessionLocal
+
+
+def test_pool_snapshot(client, superuser_headers):
+    """Function test_pool_snapshot."""
+    snapshot = client.get("/health/db-pool").json()
+    assert snapshot["async"]["checkouts"] > 0
+    assert snapshot["async"]["checked_out"] == 0
+
+
+def test_sqlite_pragmas(client):
+    """Function test_sqlite_pragmas."""
+    with SessionLocal() as db:
+        assert db.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+
+
+def test_pool_stats_per_engine():
+    """Function test_pool_stats_per_engine."""
+    first, second = (
+        create_engine("sqlite://", poolclass=TimedQueuePool) for _ in range(2)
+    )
+    with first.connect():
+        assert first.pool.stats.checkouts == 1  # type: ignore [attr-defined]
+    assert not second.pool.stats.checkouts  # type: ignore [attr-defined]
+    first.dispose()
+    assert first.pool.stats.checkouts == 1  # type: ignore [attr-defined]
@@ -0,0 +1,57 @@
+import re
+import subprocess  # noqa: S404
+import sys
+
+# imported on first use, not by app.main: its import time is the start up
+# time of every worker, measure it with `python -X importtime -c "import app.main"`
+DEFERRED = (  # noqa: WPS407
+    "httpx",
+    "jinja2",
+    "jose",
+    "jwt",
+    "passlib",
+    "sqlalchemy.dialects.postgresql",
+    "sqlite3",
+)
+
+# app.main imports after fastapi in about twice fastapi's own import time,
+# about four times before the engines moved to the lifespan; the ratio holds
+# on slow or busy machines where a wall-clock budget does not
+KFASTAPI_MULTIPLE = 3
+
+SCRIPT = (
+    "import sys, fastapi, app.main; print(*sorted(sys.modules.keys() & {0!r}))".format(
+        set(DEFERRED),
+    )
+)
+
+
+def test_deferred_imports():
+    """Function test_deferred_imports."""
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert not completed.stdout.split()
+
+
+def test_import_time_budget():
+    """Function test_import_time_budget."""
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    fastapi_us = cumulative_us(completed.stderr, "fastapi")
+    assert cumulative_us(completed.stderr, "app.main") < fastapi_us * KFASTAPI_MULTIPLE
+
+
+def cumulative_us(importtime: str, module: str) -> int:
+    """Return the cumulative import time of a module, in microseconds."""
+    pattern = r"\|\s+(\d+) \| {0}$".format(re.escape(module))
+    found = re.search(pattern, importtime, re.M)
+    assert found is not None
+    return int(found.group(1))
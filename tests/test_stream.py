@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.api import stream
+from app.core.broadcaster import broadcaster
+from app.core.events import KDELETE, KUPSERT, Subscription
+from app.crud.item_sync import item_event
+from tests.factories import ITEMS_URL, KID, create_item
+
+STREAM_URL = "{0}stream".format(ITEMS_URL)
+KEVENT = "event"
+KPOLL_SECONDS = 0.01
+
+
+def test_websocket_stream(client, superuser_headers):
+    """Function test_websocket_stream."""
+    with client.websocket_connect(STREAM_URL, headers=superuser_headers) as websocket:
+        assert websocket.receive_json()[KEVENT] == stream.KREADY
+        created = create_item(client, superuser_headers, "198.51.100.71")
+        event = websocket.receive_json()
+        assert (event[KEVENT], event[KID]) == (KUPSERT, created[KID])
+        assert event["title"] == "198.51.100.71"
+        item_url = "{0}{1}".format(ITEMS_URL, created[KID])
+        client.delete(item_url, headers=superuser_headers)
+        event = websocket.receive_json()
+        assert (event[KEVENT], event[KID]) == (KDELETE, created[KID])
+    assert client.portal.call(_unsubscribed)
+
+
+def test_websocket_stream_needs_a_token(client):
+    """Function test_websocket_stream_needs_a_token."""
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("{0}?token=nope".format(STREAM_URL)):
+            pytest.fail("the connection was accepted")
+
+
+def test_slow_subscriber_is_closed():
+    """Function test_slow_subscriber_is_closed."""
+    subscription = Subscription(buffer=2, owner_id=1)
+    others = item_event(KUPSERT, 1, 2, "198.51.100.72")
+    assert subscription.offer(others) and not subscription.wants(others)
+    owned = item_event(KUPSERT, 2, 1, "198.51.100.73")
+    assert subscription.offer(owned)
+    assert not subscription.offer(owned)
+    assert subscription.closed
+
+
+def test_sse_frames(client, monkeypatch):
+    """Function test_sse_frames."""
+    monkeypatch.setattr(broadcaster, "buffer", 1)
+    frames = client.portal.call(_sse_frames)
+    assert frames[0] == 'event: ready\ndata: {"version": 7}\n\n'
+    assert frames[1].startswith("event: upsert\ndata: {")
+    assert len(frames) == 3
+    assert frames[2].startswith("event: resync\n")
+
+
+async def _unsubscribed():
+    # the server notices the client leaving after the test client returns
+    for _ in range(100):
+        if not broadcaster:
+            return True
+        await asyncio.sleep(KPOLL_SECONDS)
+    return False
+
+
+async def _sse_frames():
+    subscription = broadcaster.subscribe()
+    events = stream.sse_events(subscription, 7)
+    frames = [await anext(events)]
+    await broadcaster.publish([item_event(KUPSERT, 3, 1, "198.51.100.74")])
+    frames.append(await anext(events))
+    # a second event while one is waiting overflows the buffer
+    burst = [item_event(KDELETE, iid, 1, "198.51.100.74") for iid in (3, 4)]
+    await broadcaster.publish(burst)
+    frames.extend([frame async for frame in events])
+    return frames
@@ -0,0 +1,66 @@
+import types
+from datetime import datetime, timedelta
+from typing import Callable, Tuple
+
+import pytest
+
+from app.core.token_backends import JoseBackend, PyJWTBackend, TokenBackend
+from app.core.tokens import TokenError, TokenService
+from app.utils import generate_password_reset_token, verify_password_reset_token
+
+KSECRET = "a-test-secret-long-enough-for-hs256"
+KCLAIMS = types.MappingProxyType({"sub": "42"})
+
+
+@pytest.mark.parametrize("backend", [JoseBackend, PyJWTBackend])
+def test_round_trip(backend):
+    """Function test_round_trip."""
+    service = TokenService(new_backend(backend), "HS256", KSECRET, KSECRET)
+    claims = {"sub": "42", "exp": datetime.utcnow() + timedelta(minutes=1)}
+    assert service.decode(service.encode(claims))["sub"] == "42"
+    other = TokenService(new_backend(backend), "HS256", "other", "other")
+    with pytest.raises(TokenError):
+        other.decode(service.encode(claims))
+
+
+@pytest.mark.parametrize("backend", [JoseBackend, PyJWTBackend])
+def test_verify_only(backend):
+    """Function test_verify_only."""
+    public_pem, private_pem = es256_pems()
+    signer = TokenService(new_backend(backend), "ES256", public_pem, private_pem)
+    replica = TokenService(new_backend(backend), "ES256", public_pem)
+    assert not replica.can_sign
+    assert replica.decode(signer.encode(dict(KCLAIMS))) == KCLAIMS
+    with pytest.raises(TokenError):
+        replica.encode(dict(KCLAIMS))
+
+
+def test_password_reset_token():
+    """Function test_password_reset_token."""
+    token = generate_password_reset_token("someone@example.com")
+    assert verify_password_reset_token(token) == "someone@example.com"
+    assert verify_password_reset_token("garbage") is None
+
+
+def new_backend(backend: Callable[[], TokenBackend]) -> TokenBackend:
+    """Return the backend, skipping the test when PyJWT is not installed."""
+    if backend is PyJWTBackend:
+        pytest.importorskip("jwt")
+    return backend()
+
+
+def es256_pems() -> Tuple[str, str]:
+    """Return a new ES256 key pair as public and private PEM text."""
+    serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+    ec = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ec")
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return public_pem.decode(), private_pem.decode()
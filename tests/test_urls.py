@@ -0,0 +1,23 @@
+import pytest
+
+from app.db.urls import async_url, dsn_url, sync_url
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "postgres://app@db/banned",
+        "postgresql://app@db/banned",
+        "postgresql+psycopg2://app@db/banned",
+        "postgresql+asyncpg://app@db/banned",
+    ],
+)
+def test_dsn_url_drops_the_driver(url):
+    """Function test_dsn_url_drops_the_driver."""
+    assert dsn_url(url) == "postgresql://app@db/banned"
+    assert dsn_url(sync_url(url)) == dsn_url(async_url(url))
+
+
+def test_dsn_url_keeps_other_dialects():
+    """Function test_dsn_url_keeps_other_dialects."""
+    assert dsn_url("sqlite:///./banned.db") == "sqlite:///./banned.db"
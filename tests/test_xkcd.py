@@ -0,0 +1,89 @@
+import asyncio
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from app.core.xkcd import XkcdClient
+
+TCOMIC = 614
+TCURRENT = 2000
+TLATENCY = 0.05
+
+COMICS = {  # noqa: WPS407
+    "/info.0.json": {"num": TCURRENT, "title": "current"},
+    "/614/info.0.json": {"num": TCOMIC, "title": "Woodpecker"},
+}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serve canned comics slowly enough for requests to overlap."""
+
+    hits: List[str] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Answer a comic request."""
+        self.hits.append(self.path)
+        time.sleep(TLATENCY)
+        payload = COMICS.get(self.path)
+        status = HTTPStatus.OK if payload else HTTPStatus.NOT_FOUND
+        body = json.dumps(payload or {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # noqa: WPS110
+        """Keep the test output quiet."""
+
+
+@pytest.fixture()
+def stand_in():
+    """Run the stand-in xkcd server on an ephemeral port."""
+    StandInHandler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{0}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+async def _gather_comics(base_url: str) -> List[Dict[str, Any]]:
+    xkcd = XkcdClient(base_url=base_url, timeout=2, cache_ttl=60)
+    await xkcd.start()
+    concurrent = [xkcd.comic(TCOMIC) for _ in range(5)]
+    comics = await asyncio.gather(*concurrent)
+    comics.append(await xkcd.comic(TCOMIC))
+    comics.append(await xkcd.comic())
+    await xkcd.close()
+    return comics
+
+
+async def _missing_comic(base_url: str) -> None:
+    xkcd = XkcdClient(base_url=base_url, timeout=2, cache_ttl=60)
+    await xkcd.start()
+    try:  # noqa: WPS501
+        await xkcd.comic(1)
+    finally:
+        await xkcd.close()
+
+
+def test_concurrent_misses_are_coalesced(stand_in):
+    """Function test_concurrent_misses_are_coalesced."""
+    comics = asyncio.run(_gather_comics(stand_in))
+    numbers = [comic["num"] for comic in comics]
+    assert numbers == [TCOMIC, TCOMIC, TCOMIC, TCOMIC, TCOMIC, TCOMIC, TCURRENT]
+    assert StandInHandler.hits == ["/614/info.0.json", "/info.0.json"]
+
+
+def test_upstream_errors_are_raised(stand_in):
+    """Function test_upstream_errors_are_raised."""
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(_missing_comic(stand_in))
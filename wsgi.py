@@ -1,7 +1,5 @@
 """Module to start application."""
-import uvicorn
-
-from app.main import app
+from app.server import main
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=5000)
+    main()